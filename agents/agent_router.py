@@ -19,7 +19,11 @@ class AgentRouter:
     """
     
     def __init__(self, config: Dict[str, Any] = None):
+        from src.utils.config_loader import ConnectionPools
+        
         self.config = config or {}
+        # Database connections are pooled for all tasks run through this router
+        self.pools = ConnectionPools(self.config)
         self.agents: List[BaseAgent] = []
         self._initialize_agents()
     
@@ -146,7 +150,7 @@ class AgentRouter:
             }
         
         try:
-            result = agent.execute(task)
+            result = agent.execute({'pools': self.pools, **task})
             result['agent'] = agent.name
             return result
         except Exception as e:
@@ -157,6 +161,10 @@ class AgentRouter:
                 'agent': agent.name
             }
     
+    def close(self):
+        """Close the connection pools used by executed tasks."""
+        self.pools.close()
+    
     def get_agent_capabilities(self) -> Dict[str, List[str]]:
         """Get capabilities of all agents."""
         return {
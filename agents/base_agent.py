@@ -145,6 +145,14 @@ class BaseAgent(ABC):
             logger.error(f"Error calling LLM: {e}")
             return None
     
+    def _get_option(self, task: Dict[str, Any], key: str, default: Any = None) -> Any:
+        """Read a migration option from the task, then the config's migration section."""
+        value = task.get(key)
+        if value is None:
+            migration_config = (task.get('config') or {}).get('migration') or {}
+            value = migration_config.get(key)
+        return default if value is None else value
+    
     @abstractmethod
     def can_handle(self, task: Dict[str, Any]) -> bool:
         """
@@ -36,6 +36,8 @@ class DataAgent(BaseAgent):
             return self._transform_data(task)
         elif task_type == 'validate_data':
             return self._validate_data(task)
+        elif task_type == 'sync_data':
+            return self._sync_data(task)
         else:
             return {'status': 'error', 'message': f'Unknown data task: {task_type}'}
     
@@ -46,19 +48,51 @@ class DataAgent(BaseAgent):
         
         try:
             config = task.get('config')
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
             
             oracle_conn.connect()
             pg_conn.connect()
             
             try:
-                batch_size = task.get('batch_size', 1000)
-                data_migrator = DataMigrator(oracle_conn, pg_conn, batch_size=batch_size)
+                batch_size = self._get_option(task, 'batch_size', 1000)
+                load_method = self._get_option(task, 'load_method', 'insert')
+                data_migrator = DataMigrator(
+                    oracle_conn, pg_conn,
+                    batch_size=batch_size,
+                    load_method=load_method,
+                    parallel_chunks=self._get_option(task, 'parallel_chunks', 1),
+                    chunk_by=self._get_option(task, 'chunk_by', 'auto'),
+                    chunk_column=self._get_option(task, 'chunk_column'),
+                    workers=self._get_option(task, 'workers', 1),
+                    pipeline_writers=self._get_option(task, 'pipeline_writers', 0),
+                    pipeline_queue_size=self._get_option(task, 'pipeline_queue_size', 4),
+                    checkpoint=self._get_option(task, 'checkpoint', False),
+                    resume=self._get_option(task, 'resume', False),
+                    extraction=self._get_option(task, 'extraction', 'cursor'),
+                    lob_inline_limit=self._get_option(task, 'lob_inline_limit', 262144),
+                    lob_chunk_size=self._get_option(task, 'lob_chunk_size', 1048576),
+                    columnar_tables=self._get_option(task, 'columnar_tables'),
+                    set_logged=self._get_option(task, 'unlogged', False),
+                    table_fetch=self._get_option(task, 'table_fetch'),
+                    adaptive_batch=self._get_option(task, 'adaptive_batch', False),
+                    min_batch_size=self._get_option(task, 'min_batch_size', 100),
+                    max_batch_size=self._get_option(task, 'max_batch_size', 50000),
+                    batch_target_bytes=self._get_option(task, 'batch_target_bytes', 33554432),
+                    batch_target_seconds=self._get_option(task, 'batch_target_seconds', 2.0),
+                    dead_letter_dir=self._get_option(task, 'dead_letter_dir', 'dead_letter'),
+                    commit_policy=self._get_option(task, 'commit_policy', 'batch'),
+                    commit_interval=self._get_option(task, 'commit_interval'),
+                    row_counts=self._get_option(task, 'row_counts', 'estimate'),
+                    partition_workers=self._get_option(task, 'partition_workers', 0)
+                )
                 
                 table_filter = task.get('tables')
                 truncate = task.get('truncate', False)
                 
                 results = data_migrator.migrate_all_tables(table_filter, truncate=truncate)
+                # Rows loaded, rejected (see the dead-letter files) and skipped per table
+                row_counts = {table_name: data_migrator.table_stats[table_name]['rows']
+                              for table_name in results if table_name in data_migrator.table_stats}
                 
                 # Use LLM to analyze data quality issues
                 failed_tables = [t for t, success in results.items() if not success]
@@ -67,13 +101,15 @@ class DataAgent(BaseAgent):
                     return {
                         'status': 'partial_success',
                         'results': results,
+                        'row_counts': row_counts,
                         'failed_tables': failed_tables,
                         'analysis': analysis
                     }
                 
                 return {
                     'status': 'success',
-                    'results': results
+                    'results': results,
+                    'row_counts': row_counts
                 }
             finally:
                 oracle_conn.disconnect()
@@ -83,13 +119,52 @@ class DataAgent(BaseAgent):
             logger.error(f"Data migration error: {e}")
             return {'status': 'error', 'message': str(e)}
     
+    def _sync_data(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Upsert the rows changed in Oracle since the previous sync."""
+        from src.migration.data_sync import DataSynchronizer
+        from src.utils.config_loader import get_db_connections
+        
+        try:
+            config = task.get('config')
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
+            
+            oracle_conn.connect()
+            pg_conn.connect()
+            
+            try:
+                synchronizer = DataSynchronizer(
+                    oracle_conn, pg_conn,
+                    batch_size=self._get_option(task, 'batch_size', 1000),
+                    sync_column=self._get_option(task, 'sync_column'),
+                    sync_columns=self._get_option(task, 'sync_columns'),
+                    since=self._get_option(task, 'sync_since'),
+                    overlap_seconds=self._get_option(task, 'sync_overlap', 60),
+                    workers=self._get_option(task, 'workers', 1)
+                )
+                results = synchronizer.sync_all_tables(task.get('tables'))
+                failed_tables = [t for t, success in results.items() if not success]
+                
+                return {
+                    'status': 'partial_success' if failed_tables else 'success',
+                    'results': results,
+                    'synced_rows': synchronizer.synced_rows,
+                    'failed_tables': failed_tables
+                }
+            finally:
+                oracle_conn.disconnect()
+                pg_conn.disconnect()
+        
+        except Exception as e:
+            logger.error(f"Data sync error: {e}")
+            return {'status': 'error', 'message': str(e)}
+    
     def _transform_data(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Transform data using LLM-generated transformation rules."""
         from src.utils.config_loader import get_db_connections
         
         try:
             config = task.get('config')
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
             
             oracle_conn.connect()
             pg_conn.connect()
@@ -133,7 +208,7 @@ class DataAgent(BaseAgent):
         
         try:
             config = task.get('config')
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
             
             oracle_conn.connect()
             pg_conn.connect()
@@ -8,6 +8,9 @@ from .base_agent import BaseAgent, LLMProvider
 
 logger = logging.getLogger(__name__)
 
+# Script written by generate_ddl and run by apply_ddl when no ddl_file is set
+DEFAULT_DDL_FILE = 'schema.sql'
+
 
 class SchemaAgent(BaseAgent):
     """Agent specialized in schema migration tasks."""
@@ -24,7 +27,8 @@ class SchemaAgent(BaseAgent):
         """Check if task is schema-related."""
         task_type = task.get('type', '').lower()
         return task_type in ['schema', 'schema_migration', 'convert_schema', 
-                            'create_table', 'analyze_schema', 'optimize_schema']
+                            'create_table', 'analyze_schema', 'optimize_schema',
+                            'create_constraints', 'generate_ddl', 'apply_ddl']
     
     def execute(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Execute schema migration task."""
@@ -36,6 +40,12 @@ class SchemaAgent(BaseAgent):
             return self._analyze_schema(task)
         elif task_type == 'optimize_schema':
             return self._optimize_schema(task)
+        elif task_type == 'create_constraints':
+            return self._create_constraints(task)
+        elif task_type == 'generate_ddl':
+            return self._generate_ddl(task)
+        elif task_type == 'apply_ddl':
+            return self._apply_ddl(task)
         else:
             return {'status': 'error', 'message': f'Unknown schema task: {task_type}'}
     
@@ -46,13 +56,19 @@ class SchemaAgent(BaseAgent):
         
         try:
             config = task.get('config')
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
             
             oracle_conn.connect()
             pg_conn.connect()
             
             try:
-                schema_converter = SchemaConverter(oracle_conn, pg_conn)
+                schema_converter = SchemaConverter(
+                    oracle_conn, pg_conn,
+                    workers=self._get_option(task, 'workers', 1),
+                    defer_constraints=self._get_option(task, 'load_first', False),
+                    unlogged=self._get_option(task, 'unlogged', False),
+                    pg_partitions=self._get_option(task, 'pg_partitions', False)
+                )
                 table_filter = task.get('tables')
                 
                 results = schema_converter.convert_all_tables(table_filter)
@@ -80,13 +96,107 @@ class SchemaAgent(BaseAgent):
             logger.error(f"Schema migration error: {e}")
             return {'status': 'error', 'message': str(e)}
     
+    def _create_constraints(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Build indexes and foreign keys deferred by load-first schema migration."""
+        from src.migration.schema_converter import SchemaConverter
+        from src.utils.config_loader import get_db_connections
+        
+        try:
+            config = task.get('config')
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
+            
+            oracle_conn.connect()
+            pg_conn.connect()
+            
+            try:
+                schema_converter = SchemaConverter(
+                    oracle_conn, pg_conn,
+                    workers=self._get_option(task, 'workers', 1)
+                )
+                results = schema_converter.create_deferred_constraints(task.get('tables'))
+                failed_tables = [t for t, success in results.items() if not success]
+                
+                return {
+                    'status': 'partial_success' if failed_tables else 'success',
+                    'results': results,
+                    'failed_tables': failed_tables
+                }
+            finally:
+                oracle_conn.disconnect()
+                pg_conn.disconnect()
+        
+        except Exception as e:
+            logger.error(f"Constraint creation error: {e}")
+            return {'status': 'error', 'message': str(e)}
+    
+    def _generate_ddl(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Render the PostgreSQL DDL to a script without connecting to PostgreSQL."""
+        from src.migration.schema_converter import SchemaConverter
+        from src.utils.config_loader import get_db_connections
+        
+        try:
+            config = task.get('config')
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
+            ddl_file = self._get_option(task, 'ddl_file', DEFAULT_DDL_FILE)
+            
+            oracle_conn.connect()
+            
+            try:
+                schema_converter = SchemaConverter(
+                    oracle_conn, pg_conn,
+                    unlogged=self._get_option(task, 'unlogged', False),
+                    pg_partitions=self._get_option(task, 'pg_partitions', False)
+                )
+                statements = schema_converter.generate_ddl_script(ddl_file, task.get('tables'))
+                
+                return {
+                    'status': 'success',
+                    'ddl_file': ddl_file,
+                    'statements': statements
+                }
+            finally:
+                oracle_conn.disconnect()
+        
+        except Exception as e:
+            logger.error(f"DDL generation error: {e}")
+            return {'status': 'error', 'message': str(e)}
+    
+    def _apply_ddl(self, task: Dict[str, Any]) -> Dict[str, Any]:
+        """Run a generated DDL script, one transaction per section."""
+        from src.migration.schema_converter import SchemaConverter
+        from src.utils.config_loader import get_db_connections
+        
+        try:
+            config = task.get('config')
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
+            ddl_file = self._get_option(task, 'ddl_file', DEFAULT_DDL_FILE)
+            
+            pg_conn.connect()
+            
+            try:
+                results = SchemaConverter(oracle_conn, pg_conn).apply_ddl_script(ddl_file)
+                failed_sections = [s for s, success in results.items() if not success]
+                
+                return {
+                    'status': 'error' if failed_sections else 'success',
+                    'results': results,
+                    'message': f"DDL section {failed_sections[0]} of {ddl_file} failed"
+                               if failed_sections else None
+                }
+            finally:
+                pg_conn.disconnect()
+        
+        except Exception as e:
+            logger.error(f"DDL apply error: {e}")
+            return {'status': 'error', 'message': str(e)}
+    
     def _analyze_schema(self, task: Dict[str, Any]) -> Dict[str, Any]:
         """Analyze Oracle schema and provide insights using LLM."""
         from src.utils.config_loader import get_db_connections
         
         try:
             config = task.get('config')
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
             
             oracle_conn.connect()
             
@@ -138,7 +248,7 @@ class SchemaAgent(BaseAgent):
         
         try:
             config = task.get('config')
-            _, pg_conn = get_db_connections(config)
+            _, pg_conn = get_db_connections(config, task.get('pools'))
             
             pg_conn.connect()
             
@@ -202,6 +312,7 @@ class SchemaAgent(BaseAgent):
             'schema_analysis',
             'schema_optimization',
             'table_conversion',
-            'constraint_migration'
+            'constraint_migration',
+            'ddl_script_generation'
         ]
 
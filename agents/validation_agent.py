@@ -48,7 +48,7 @@ class ValidationAgent(BaseAgent):
         
         try:
             config = task.get('config')
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
             
             oracle_conn.connect()
             pg_conn.connect()
@@ -151,7 +151,7 @@ class ValidationAgent(BaseAgent):
         
         try:
             config = task.get('config')
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, task.get('pools'))
             
             oracle_conn.connect()
             pg_conn.connect()
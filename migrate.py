@@ -77,6 +77,77 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def schema_task_options(args) -> dict:
+    """Collect schema migration options from the command line."""
+    return {
+        'workers': args.workers,
+        'load_first': args.load_first,
+        'unlogged': args.unlogged,
+        'pg_partitions': args.pg_partitions,
+        'ddl_file': args.ddl_file,
+    }
+
+
+def load_first_enabled(args, config: dict) -> bool:
+    """Check for load-first mode on the command line, then in the config."""
+    if args.load_first is not None:
+        return args.load_first
+    return bool((config.get('migration') or {}).get('load_first', False))
+
+
+def constraints_task(args, config: dict, tables) -> dict:
+    """Task building the indexes and foreign keys skipped by load-first schema migration."""
+    return {
+        'type': 'create_constraints',
+        'config': config,
+        'tables': tables,
+        **schema_task_options(args)
+    }
+
+
+def apply_refresh_metadata(args, config: dict):
+    """Make --refresh-metadata bypass cached table metadata for this run."""
+    if args.refresh_metadata:
+        config['migration'] = {**(config.get('migration') or {}), 'refresh_metadata': True}
+
+
+def log_row_counts(result: dict):
+    """Log the tables of a data migration result that have rejected or skipped rows."""
+    for table_name, counts in (result.get('row_counts') or {}).items():
+        if counts['rejected'] or counts['skipped']:
+            logger.info(f"    {table_name}: {counts['loaded']} loaded, {counts['rejected']} "
+                        f"rejected, {counts['skipped']} skipped")
+
+
+def data_task_options(args) -> dict:
+    """Collect data migration options from the command line."""
+    return {
+        'truncate': args.truncate,
+        'batch_size': args.batch_size,
+        'adaptive_batch': args.adaptive_batch,
+        'commit_policy': args.commit_policy,
+        'commit_interval': args.commit_interval,
+        'row_counts': args.row_counts,
+        'sync_column': args.sync_column,
+        'sync_since': args.sync_since,
+        'workers': args.workers,
+        'load_method': args.load_method,
+        'parallel_chunks': args.parallel_chunks,
+        'partition_workers': args.partition_workers,
+        'chunk_by': args.chunk_by,
+        'chunk_column': args.chunk_column,
+        'pipeline_writers': args.pipeline_writers,
+        'pipeline_queue_size': args.pipeline_queue_size,
+        'checkpoint': args.checkpoint,
+        'resume': args.resume,
+        'extraction': args.extraction,
+        'lob_inline_limit': args.lob_inline_limit,
+        'columnar_tables': [t.strip() for t in args.columnar_tables.split(',')]
+                           if args.columnar_tables else None,
+        'unlogged': args.unlogged,
+    }
+
+
 def main():
     """Main migration function."""
     parser = argparse.ArgumentParser(
@@ -116,8 +187,156 @@ def main():
     parser.add_argument(
         '--batch-size',
         type=int,
-        default=1000,
-        help='Batch size for data migration (default: 1000)'
+        help='Batch size for data migration (default: migration.batch_size from config, or 1000)'
+    )
+    parser.add_argument(
+        '--adaptive-batch',
+        action='store_true',
+        default=None,
+        help='Grow or shrink the batch size per table towards a byte budget and a load '
+             'time per batch (bounds and targets are set in the migration config)'
+    )
+    parser.add_argument(
+        '--load-method',
+        choices=['insert', 'copy', 'copy_binary'],
+        help='How rows are loaded into PostgreSQL: executemany INSERT, COPY text '
+             'or COPY binary (default: migration.load_method from config, or insert)'
+    )
+    parser.add_argument(
+        '--commit-policy',
+        choices=['batch', 'batches', 'bytes', 'chunk'],
+        help='When loaded rows are committed: after each batch, every --commit-interval '
+             'batches or bytes, or once per chunk/table (default: batch)'
+    )
+    parser.add_argument(
+        '--row-counts',
+        choices=['estimate', 'exact'],
+        help='Source row totals for progress: optimizer statistics (estimate) or '
+             'COUNT(*) per table (exact) (default: estimate)'
+    )
+    parser.add_argument(
+        '--sync-column',
+        type=str,
+        help='Change-tracking column (e.g. a last-modified timestamp) for --task sync_data; '
+             'tables without it are synced by ORA_ROWSCN'
+    )
+    parser.add_argument(
+        '--sync-since',
+        type=str,
+        help='Starting watermark for tables never synced before: an SCN, or an ISO '
+             'timestamp with --sync-column (default: sync all rows once)'
+    )
+    parser.add_argument(
+        '--commit-interval',
+        type=int,
+        help='Batches or bytes per commit for the batches and bytes commit policies '
+             '(default: 10 batches, 64 MB)'
+    )
+    parser.add_argument(
+        '--workers',
+        type=int,
+        help='Number of tables converted or migrated concurrently, largest tables '
+             'first, each on its own connections (default: 1)'
+    )
+    parser.add_argument(
+        '--parallel-chunks',
+        type=int,
+        help='Split each table into N ranges migrated in parallel, each on its own '
+             'Oracle and PostgreSQL connections (default: 1)'
+    )
+    parser.add_argument(
+        '--partition-workers',
+        type=int,
+        help='Extract partitioned tables one partition at a time, N partitions in '
+             'parallel, each with its own checkpoint (default: 0, off)'
+    )
+    parser.add_argument(
+        '--pg-partitions',
+        action='store_true',
+        default=None,
+        help='Create RANGE, LIST and HASH partitioned Oracle tables as PostgreSQL '
+             'partitioned tables with matching partitions'
+    )
+    parser.add_argument(
+        '--chunk-by',
+        choices=['auto', 'pk', 'rowid'],
+        help='How tables are split for --parallel-chunks: numeric primary key, ROWID, '
+             'or auto (primary key when usable, else ROWID)'
+    )
+    parser.add_argument(
+        '--chunk-column',
+        type=str,
+        help='Numeric column to split tables on for --parallel-chunks'
+    )
+    parser.add_argument(
+        '--pipeline-writers',
+        type=int,
+        help='Overlap Oracle fetches with PostgreSQL loads using N writer threads '
+             'per table or chunk (default: 0, sequential)'
+    )
+    parser.add_argument(
+        '--pipeline-queue-size',
+        type=int,
+        help='Maximum fetched batches buffered between reader and writers (default: 4)'
+    )
+    parser.add_argument(
+        '--checkpoint',
+        action='store_true',
+        default=None,
+        help='Record per-table and per-chunk progress in the target schema so an '
+             'interrupted data migration can be resumed'
+    )
+    parser.add_argument(
+        '--resume',
+        action='store_true',
+        default=None,
+        help='Resume an interrupted data migration from its checkpoints, skipping '
+             'completed tables (implies --checkpoint)'
+    )
+    parser.add_argument(
+        '--extraction',
+        choices=['cursor', 'keyset'],
+        help='How rows are read from Oracle: one cursor per table, or short primary '
+             'key ordered pages that avoid long-running snapshots (default: cursor)'
+    )
+    parser.add_argument(
+        '--lob-inline-limit',
+        type=int,
+        help='LOBs up to this many bytes (characters for CLOBs) are fetched with the '
+             'row; larger ones are streamed in pieces (default: 262144)'
+    )
+    parser.add_argument(
+        '--columnar-tables',
+        type=str,
+        help="Comma-separated tables (or '*' for all) transferred as Arrow record "
+             "batches encoded directly into binary COPY; requires pyarrow"
+    )
+    parser.add_argument(
+        '--load-first',
+        action='store_true',
+        default=None,
+        help='Create only tables and primary keys before loading data, then build '
+             'secondary indexes and foreign keys (NOT VALID, then validated) in parallel'
+    )
+    parser.add_argument(
+        '--unlogged',
+        action='store_true',
+        default=None,
+        help='Create target tables UNLOGGED for the initial load and set each one '
+             'LOGGED once its row count matches the source'
+    )
+    parser.add_argument(
+        '--ddl-file',
+        type=str,
+        help='SQL script written by --task generate_ddl (tables, indexes and foreign keys '
+             'in pre-data, post-data and constraints sections, without connecting to '
+             'PostgreSQL) and run by --task apply_ddl (default: schema.sql)'
+    )
+    parser.add_argument(
+        '--refresh-metadata',
+        action='store_true',
+        help='Re-read all table metadata from the Oracle dictionary instead of '
+             'reusing the metadata cache (the cache is then rebuilt)'
     )
     parser.add_argument(
         '--list-agents',
@@ -137,6 +356,7 @@ def main():
 
     
     args = parser.parse_args()
+    router = None
     
     try:
         # Handle interactive mode first
@@ -144,7 +364,7 @@ def main():
             from src.utils.interactive_planner import run_interactive_mode
             
             logger.info("Starting interactive migration mode")
-            config, selected_tables = run_interactive_mode()
+            config, selected_tables = run_interactive_mode(args.refresh_metadata, args.workers)
             
             if config is None:
                 logger.info("Interactive mode cancelled or failed")
@@ -160,7 +380,8 @@ def main():
                 tasks.append({
                     'type': 'schema_migration',
                     'config': config,
-                    'tables': selected_tables
+                    'tables': selected_tables,
+                    **schema_task_options(args)
                 })
             
             if not args.schema_only:
@@ -168,9 +389,10 @@ def main():
                     'type': 'data_migration',
                     'config': config,
                     'tables': selected_tables,
-                    'truncate': args.truncate,
-                    'batch_size': args.batch_size
+                    **data_task_options(args)
                 })
+                if load_first_enabled(args, config):
+                    tasks.append(constraints_task(args, config, selected_tables))
             
             # Execute tasks
             all_results = []
@@ -188,6 +410,7 @@ def main():
             logger.info("Migration Summary:")
             for result in all_results:
                 logger.info(f"  {result.get('agent', 'Unknown')}: {result.get('status', 'unknown')}")
+                log_row_counts(result)
             
             logger.info("Migration completed successfully!")
             return 0
@@ -208,6 +431,7 @@ def main():
         # Load configuration for other operations
         logger.info(f"Loading configuration from {args.config}")
         config = load_config(args.config)
+        apply_refresh_metadata(args, config)
         
         # Initialize agent router
         router = AgentRouter(config)
@@ -235,8 +459,8 @@ def main():
                 'type': args.task,
                 'config': config,
                 'tables': [t.strip() for t in args.tables.split(',')] if args.tables else None,
-                'truncate': args.truncate,
-                'batch_size': args.batch_size
+                **schema_task_options(args),
+                **data_task_options(args)
             }
             logger.info(f"Executing task: {task.get('type')}")
             result = router.execute_task(task)
@@ -255,7 +479,8 @@ def main():
             tasks.append({
                 'type': 'schema_migration',
                 'config': config,
-                'tables': [t.strip() for t in args.tables.split(',')] if args.tables else None
+                'tables': [t.strip() for t in args.tables.split(',')] if args.tables else None,
+                **schema_task_options(args)
             })
         
         if not args.schema_only:
@@ -263,10 +488,14 @@ def main():
                 'type': 'data_migration',
                 'config': config,
                 'tables': [t.strip() for t in args.tables.split(',')] if args.tables else None,
-                'truncate': args.truncate,
-                'batch_size': args.batch_size
+                **data_task_options(args)
             })
         
+        if load_first_enabled(args, config) and not args.schema_only:
+            tasks.append(constraints_task(
+                args, config, [t.strip() for t in args.tables.split(',')] if args.tables else None
+            ))
+        
         # Execute tasks
         all_results = []
         for task in tasks:
@@ -283,6 +512,7 @@ def main():
         logger.info("Migration Summary:")
         for result in all_results:
             logger.info(f"  {result.get('agent', 'Unknown')}: {result.get('status', 'unknown')}")
+            log_row_counts(result)
         
         logger.info("Migration completed successfully!")
         return 0
@@ -293,6 +523,9 @@ def main():
     except Exception as e:
         logger.error(f"Migration failed: {e}", exc_info=True)
         return 1
+    finally:
+        if router is not None:
+            router.close()
 
 
 if __name__ == '__main__':
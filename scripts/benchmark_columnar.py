@@ -0,0 +1,140 @@
+#!/usr/bin/env python3
+"""
+Benchmark of the columnar (Arrow) transfer against the row path.
+
+With a config file and a table, the table is migrated end to end (fetch,
+convert, load) twice: once on the row path with binary COPY, once on the
+columnar path. The target table is truncated before each run and rows per
+second of each whole transfer are reported.
+
+With --encode-only, only the encoders are timed, on a generated wide table of
+BIGINT, DOUBLE and NUMERIC(18,4) columns: pg_copy.encode_binary_rows on
+Python tuples against arrow_copy.encode_record_batch on Arrow record batches.
+Both produce identical binary COPY data, which is checked before timing.
+
+Requires pyarrow and numpy (and python-oracledb 3.0 or later end to end).
+
+Run from the project root directory:
+    python scripts/benchmark_columnar.py --config config/config.yaml TABLE [--batch-size N]
+    python scripts/benchmark_columnar.py --encode-only [--rows N] [--columns N]
+"""
+
+import argparse
+import logging
+import os
+import sys
+import time
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+import numpy as np
+import pyarrow as pa
+
+from src.migration import arrow_copy, pg_copy
+
+
+def make_batch(rows, columns):
+    """Build a record batch of BIGINT, DOUBLE and NUMERIC(18,4) columns with some NULLs."""
+    rng = np.random.default_rng(42)
+    arrays = []
+    types = []
+    for i in range(columns):
+        mask = rng.random(rows) < 0.05
+        if i % 3 == 0:
+            arrays.append(pa.array(rng.integers(-10**12, 10**12, rows), mask=mask))
+            types.append('int8')
+        elif i % 3 == 1:
+            arrays.append(pa.array(rng.random(rows) * 1e6, mask=mask))
+            types.append('float8')
+        else:
+            unscaled = rng.integers(-10**17, 10**17, rows)
+            values = [Decimal(int(value)).scaleb(-4) for value in unscaled]
+            arrays.append(pa.array(values, pa.decimal128(18, 4), mask=mask))
+            types.append('numeric')
+    return pa.record_batch(arrays, names=[f'c{i}' for i in range(columns)]), types
+
+
+def measure(label, func, rows, repeat=3):
+    """Time the best of several runs and print rows per second."""
+    best = float('inf')
+    for _ in range(repeat):
+        started = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - started)
+    rate = rows / best
+    print(f"  {label:<45} {rate:>12,.0f} rows/s")
+    return rate
+
+
+def benchmark_encoders(rows, columns):
+    """Time the row and columnar COPY encoders on a generated batch."""
+    batch, types = make_batch(rows, columns)
+    tuples = arrow_copy.to_rows(batch)
+    
+    assert arrow_copy.encode_record_batch(batch, types) == \
+        pg_copy.encode_binary_rows(tuples, types), "encoders disagree"
+    
+    print(f"Encoding {rows:,} rows x {columns} numeric columns as binary COPY")
+    row_rate = measure("row path (tuples already fetched)",
+                       lambda: pg_copy.encode_binary_rows(tuples, types), rows)
+    measure("row path including tuple materialization",
+            lambda: pg_copy.encode_binary_rows(arrow_copy.to_rows(batch), types), rows)
+    columnar_rate = measure("columnar path",
+                            lambda: arrow_copy.encode_record_batch(batch, types), rows)
+    print(f"  {'speedup over row path':>45} {columnar_rate / row_rate:>11.1f}x")
+
+
+def benchmark_transfer(config_path, table_name, batch_size):
+    """Migrate a table on the row path and on the columnar path and compare."""
+    from src.migration.data_migrator import DataMigrator
+    from src.utils.config_loader import get_db_connections, load_config
+    
+    oracle_conn, pg_conn = get_db_connections(load_config(config_path))
+    oracle_conn.connect()
+    pg_conn.connect()
+    try:
+        rows = oracle_conn.get_row_count(table_name)
+        print(f"Migrating {table_name} ({rows:,} rows) end to end, batch size {batch_size}")
+        rates = {}
+        for label, columnar_tables in (("row path (binary COPY)", None),
+                                       ("columnar path", [table_name])):
+            migrator = DataMigrator(oracle_conn, pg_conn, batch_size=batch_size,
+                                    load_method='copy_binary', columnar_tables=columnar_tables)
+            started = time.perf_counter()
+            if not migrator.migrate_table(table_name, truncate=True):
+                sys.exit(f"Migration of {table_name} failed on the {label}")
+            elapsed = time.perf_counter() - started
+            rates[label] = rows / elapsed
+            print(f"  {label:<45} {rates[label]:>12,.0f} rows/s ({elapsed:.1f}s)")
+        speedup = rates["columnar path"] / rates["row path (binary COPY)"]
+        print(f"  {'speedup over row path':>45} {speedup:>11.1f}x")
+    finally:
+        oracle_conn.disconnect()
+        pg_conn.disconnect()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('table', nargs='?', help='Table to migrate end to end')
+    parser.add_argument('--config', default='config/config.yaml', help='Migration config file')
+    parser.add_argument('--batch-size', type=int, default=10000, help='Rows per batch')
+    parser.add_argument('--encode-only', action='store_true',
+                        help='Only time the encoders on generated data')
+    parser.add_argument('--rows', type=int, default=100000, help='Generated rows (--encode-only)')
+    parser.add_argument('--columns', type=int, default=20,
+                        help='Generated columns (--encode-only)')
+    args = parser.parse_args()
+    
+    if args.encode_only:
+        benchmark_encoders(args.rows, args.columns)
+    elif args.table:
+        # Shows whether the table qualified for the columnar path
+        logging.basicConfig(level=logging.INFO, format='%(message)s')
+        benchmark_transfer(args.config, args.table.upper(), args.batch_size)
+    else:
+        parser.error("give a table to migrate, or --encode-only")
+
+
+if __name__ == '__main__':
+    main()
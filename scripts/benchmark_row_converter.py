@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark of row conversion in the data migration hot loop.
+
+Compares the previous per-value loop (an `is None` and `hasattr(value, 'read')`
+check on every value, building a list per row) with the converter compiled
+once per table by src.migration.row_converter.
+
+Run from the project root directory:
+    python scripts/benchmark_row_converter.py [rows]
+"""
+
+import os
+import sys
+import time
+from datetime import datetime
+from decimal import Decimal
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from src.migration.row_converter import compile_row_converter
+
+
+def per_value_convert(batch):
+    """Row conversion as previously done in DataMigrator."""
+    converted_batch = []
+    for row in batch:
+        converted_row = []
+        for value in row:
+            if value is None:
+                converted_row.append(None)
+            elif hasattr(value, 'read'):
+                try:
+                    converted_row.append(value.read())
+                except:
+                    converted_row.append(str(value))
+            else:
+                converted_row.append(value)
+        converted_batch.append(tuple(converted_row))
+    return converted_batch
+
+
+def compiled_convert(convert, batch):
+    """Row conversion with a compiled converter (None means pass-through)."""
+    if convert is None:
+        return batch
+    return [convert(row) for row in batch]
+
+
+def make_rows(count):
+    """Build rows shaped like a typical table with ten columns."""
+    now = datetime(2024, 1, 1, 12, 0, 0)
+    return [
+        (i, f'name {i}', Decimal('1234.56'), now, None, i * 2, 'ACTIVE',
+         f'description of row {i}', now, 3.14)
+        for i in range(count)
+    ]
+
+
+def measure(label, func, batches, rows):
+    """Time func over all batches and print rows per second."""
+    started = time.perf_counter()
+    for batch in batches:
+        func(batch)
+    elapsed = time.perf_counter() - started
+    rate = rows / elapsed if elapsed else float('inf')
+    print(f"  {label:<40} {rate:>14,.0f} rows/s")
+    return rate
+
+
+def main():
+    rows = int(sys.argv[1]) if len(sys.argv) > 1 else 500000
+    batch_size = 1000
+    data = make_rows(rows)
+    batches = [data[i:i + batch_size] for i in range(0, rows, batch_size)]
+    
+    plain_types = ['NUMBER', 'VARCHAR2', 'NUMBER', 'DATE', 'VARCHAR2', 'NUMBER',
+                   'VARCHAR2', 'VARCHAR2', 'TIMESTAMP(6)', 'BINARY_DOUBLE']
+    # Same rows with column 7 declared as an (inlined) CLOB
+    lob_types = list(plain_types)
+    lob_types[7] = 'CLOB'
+    
+    print(f"Converting {rows:,} rows of {len(plain_types)} columns in batches of {batch_size}")
+    baseline = measure("per-value loop", per_value_convert, batches, rows)
+    
+    for label, types in [("compiled, no conversions (pass-through)", plain_types),
+                         ("compiled, one CLOB column", lob_types)]:
+        convert = compile_row_converter(types)
+        rate = measure(label, lambda batch: compiled_convert(convert, batch), batches, rows)
+        print(f"  {'speedup':>40} {rate / baseline:>13.1f}x")
+
+if __name__ == '__main__':
+    main()
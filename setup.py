@@ -17,6 +17,7 @@ setup(
     extras_require={
         "openai": ["openai>=1.0.0"],
         "anthropic": ["anthropic>=0.18.0"],
+        "arrow": ["pyarrow>=14.0.0", "numpy>=1.21"],
         "all": ["openai>=1.0.0", "anthropic>=0.18.0"],
     },
     entry_points={
@@ -0,0 +1,280 @@
+"""
+Columnar encoding of Arrow record batches into PostgreSQL binary COPY data.
+
+Requires the optional pyarrow and numpy packages. Whole columns are encoded
+with vectorized numpy operations, so no Python object is created per value.
+"""
+
+from typing import Any, List, Tuple
+
+try:
+    import numpy as np
+    import pyarrow as pa
+except ImportError:  # columnar transfer is optional
+    np = None
+    pa = None
+
+from .pg_copy import BINARY_HEADER, BINARY_TRAILER
+
+# Offsets between the Unix epoch and the PostgreSQL epoch (2000-01-01)
+PG_EPOCH_DAYS = 10957
+PG_EPOCH_MICROS = PG_EPOCH_DAYS * 86400 * 1000000
+
+# Fixed-width encodings keyed by pg_type.typname
+FIXED_WIDTH_TYPES = {
+    'int2': '>i2',
+    'int4': '>i4',
+    'int8': '>i8',
+    'float4': '>f4',
+    'float8': '>f8',
+    'bool': '?',
+    'date': '>i4',
+    'timestamp': '>i8',
+    'timestamptz': '>i8',
+}
+VARIABLE_WIDTH_TYPES = ('text', 'varchar', 'bpchar', 'bytea', 'numeric')
+
+# NUMERIC digits are base 10000; a decimal128 value (with its scale padded to
+# whole digits) has at most 11 of them
+NUMERIC_BASE = 10000
+NUMERIC_DIGITS = 11
+NUMERIC_NEG = 0x4000
+
+
+def available() -> bool:
+    """Check whether pyarrow and numpy are installed."""
+    return pa is not None
+
+
+def supports(column_types: List[str]) -> bool:
+    """Check whether every column type has a columnar encoder."""
+    return all(col_type in FIXED_WIDTH_TYPES or col_type in VARIABLE_WIDTH_TYPES
+               for col_type in column_types)
+
+
+def to_record_batches(frame: Any) -> List[Any]:
+    """Convert a python-oracledb DataFrame (or any Arrow-compatible object) to record batches."""
+    return pa.table(frame).to_batches()
+
+
+def leading_columns(batch, width: int):
+    """Keep the first width columns of a record batch, dropping helper columns."""
+    if batch.num_columns <= width:
+        return batch
+    return pa.RecordBatch.from_arrays(batch.columns[:width], names=batch.schema.names[:width])
+
+
+def to_rows(batch) -> List[tuple]:
+    """Materialize a record batch as row tuples (the row-path fallback)."""
+    return list(zip(*[column.to_pylist() for column in batch.columns]))
+
+
+def _valid_mask(array) -> Any:
+    if array.null_count == 0:
+        return np.ones(len(array), dtype=bool)
+    return array.is_valid().to_numpy(zero_copy_only=False)
+
+
+def _fixed_values(array, pg_type: str):
+    """Convert a column to big-endian values for a fixed-width type."""
+    arrow_type = array.type
+    target = np.dtype(FIXED_WIDTH_TYPES[pg_type])
+    
+    if pg_type in ('timestamp', 'timestamptz'):
+        if not pa.types.is_timestamp(arrow_type):
+            raise TypeError(f"Cannot encode {arrow_type} as {pg_type}")
+        if (arrow_type.tz is not None) != (pg_type == 'timestamptz'):
+            raise TypeError(f"Time zone of {arrow_type} does not match {pg_type}")
+        micros = array.cast(pa.timestamp('us', tz=arrow_type.tz)).cast(pa.int64())
+        values = micros.fill_null(0).to_numpy() - PG_EPOCH_MICROS
+    elif pg_type == 'date':
+        if pa.types.is_timestamp(arrow_type):
+            array = array.cast(pa.date32())
+        elif not pa.types.is_date(arrow_type):
+            raise TypeError(f"Cannot encode {arrow_type} as date")
+        days = array.cast(pa.date32()).cast(pa.int32())
+        values = days.fill_null(0).to_numpy().astype(np.int64) - PG_EPOCH_DAYS
+    elif pg_type == 'bool':
+        if not pa.types.is_boolean(arrow_type):
+            raise TypeError(f"Cannot encode {arrow_type} as bool")
+        values = array.fill_null(False).to_numpy(zero_copy_only=False)
+    else:
+        if not (pa.types.is_integer(arrow_type) or pa.types.is_floating(arrow_type)):
+            raise TypeError(f"Cannot encode {arrow_type} as {pg_type}")
+        values = array.fill_null(0).to_numpy()
+        if target.kind == 'i':
+            if values.dtype.kind == 'f' and not np.all(np.isfinite(values) & (values == np.floor(values))):
+                raise TypeError(f"Cannot encode non-integral values as {pg_type}")
+            limits = np.iinfo(target)
+            if values.size and (values.min() < limits.min or values.max() > limits.max):
+                raise TypeError(f"Values out of range for {pg_type}")
+    
+    return values.astype(target)
+
+
+def _numeric_values(array) -> Tuple[Any, Any]:
+    """
+    Encode a decimal or integer column as binary NUMERIC values, returned
+    as (offsets, data) like a binary column.
+    
+    Each unscaled 128-bit value is split into 32-bit limbs, scaled so the
+    decimal point falls between base-10000 digits, and divided down into
+    those digits column-wise. Leading and trailing zero digits are dropped,
+    as PostgreSQL does.
+    """
+    arrow_type = array.type
+    if pa.types.is_integer(arrow_type):
+        array = array.cast(pa.decimal128(20 if arrow_type.bit_width == 64 else 19, 0))
+    elif not pa.types.is_decimal128(array.type):
+        # Floats have no exact decimal form to encode column-wise
+        raise TypeError(f"Cannot encode {arrow_type} as numeric")
+    scale = array.type.scale
+    if scale < 0:
+        raise TypeError(f"Cannot encode negative scale {array.type} as numeric")
+    
+    rows = len(array)
+    valid = _valid_mask(array)
+    words = np.frombuffer(array.buffers()[1], dtype='<u8').reshape(-1, 2)
+    words = words[array.offset:array.offset + rows]
+    low = np.where(valid, words[:, 0], 0)
+    high = np.where(valid, words[:, 1], 0)
+    
+    # Two's complement magnitude
+    negative = (high >> np.uint64(63)).astype(bool)
+    low = np.where(negative, ~low + np.uint64(1), low)
+    high = np.where(negative, ~high + (low == 0).astype(np.uint64), high)
+    mask = np.uint64(0xFFFFFFFF)
+    limbs = [high >> np.uint64(32), high & mask, low >> np.uint64(32), low & mask]
+    
+    pad = -scale % 4
+    carry = np.zeros(rows, dtype=np.uint64)
+    for i in reversed(range(len(limbs))):
+        product = limbs[i] * np.uint64(10 ** pad) + carry
+        limbs[i] = product & mask
+        carry = product >> np.uint64(32)
+    limbs.insert(0, carry)
+    
+    # Base-10000 digits, least significant first
+    digits = np.zeros((rows, NUMERIC_DIGITS), dtype=np.int64)
+    for d in range(NUMERIC_DIGITS):
+        remainder = np.zeros(rows, dtype=np.uint64)
+        for i in range(len(limbs)):
+            current = (remainder << np.uint64(32)) | limbs[i]
+            limbs[i] = current // np.uint64(NUMERIC_BASE)
+            remainder = current % np.uint64(NUMERIC_BASE)
+        digits[:, d] = remainder
+    
+    nonzero = digits != 0
+    any_digit = nonzero.any(axis=1)
+    first = np.where(any_digit, nonzero.argmax(axis=1), 0)
+    last = np.where(any_digit, NUMERIC_DIGITS - 1 - nonzero[:, ::-1].argmax(axis=1), -1)
+    ndigits = last - first + 1
+    header = np.zeros((rows, 4), dtype='>i2')
+    header[:, 0] = ndigits
+    header[:, 1] = np.where(any_digit, last - (scale + pad) // 4, 0)
+    header[:, 2] = np.where(negative & any_digit, NUMERIC_NEG, 0)
+    header[:, 3] = scale
+    
+    lengths = np.where(valid, 8 + 2 * ndigits, 0)
+    offsets = np.concatenate(([0], np.cumsum(lengths)))
+    data = np.zeros(int(offsets[-1]), dtype=np.uint8)
+    _scatter(data, offsets[:-1][valid], header[valid], 8)
+    
+    # Kept digits, most significant first
+    positions = np.arange(NUMERIC_DIGITS)[::-1]
+    kept = valid[:, None] & (positions >= first[:, None]) & (positions <= last[:, None])
+    counts = kept.sum(axis=1)
+    total = int(counts.sum())
+    if total:
+        row_of_digit = np.repeat(np.arange(rows), counts)
+        within = np.arange(total) - np.repeat(np.cumsum(counts) - counts, counts)
+        _scatter(data, offsets[row_of_digit] + 8 + 2 * within,
+                 digits[:, ::-1][kept].astype('>i2'), 2)
+    return offsets, data
+
+
+def _variable_values(array, pg_type: str) -> Tuple[Any, Any]:
+    """Get (offsets, data) buffers of a string, binary or numeric column."""
+    arrow_type = array.type
+    if pg_type == 'numeric':
+        return _numeric_values(array)
+    if pg_type == 'bytea':
+        if not (pa.types.is_binary(arrow_type) or pa.types.is_large_binary(arrow_type)):
+            raise TypeError(f"Cannot encode {arrow_type} as bytea")
+        array = array.cast(pa.large_binary())
+    else:
+        if not (pa.types.is_string(arrow_type) or pa.types.is_large_string(arrow_type)):
+            raise TypeError(f"Cannot encode {arrow_type} as {pg_type}")
+        array = array.cast(pa.large_string())
+    
+    _, offsets_buffer, data_buffer = array.buffers()
+    offsets = np.frombuffer(offsets_buffer, dtype=np.int64)[array.offset:array.offset + len(array) + 1]
+    data = np.frombuffer(data_buffer, dtype=np.uint8) if data_buffer is not None \
+        else np.zeros(0, dtype=np.uint8)
+    return offsets, data
+
+
+def _scatter(buf, positions, values, width: int):
+    """Write fixed-width values into buf starting at each position."""
+    if len(positions):
+        raw = np.ascontiguousarray(values).view(np.uint8).reshape(-1, width)
+        buf[positions[:, None] + np.arange(width)] = raw
+
+
+def encode_record_batch(batch, column_types: List[str], header: bool = True) -> bytes:
+    """
+    Encode an Arrow record batch as COPY binary-format data.
+    
+    Args:
+        batch: Record batch whose columns are in target column order
+        column_types: pg_type names of the target columns
+        header: If True, wrap the rows in the binary header and trailer
+    
+    Raises:
+        TypeError: If a column cannot be encoded for its target type; the
+            caller can fall back to the row path for the batch
+    """
+    rows = batch.num_rows
+    columns = []
+    row_sizes = np.full(rows, 2, dtype=np.int64)  # field count
+    
+    for array, pg_type in zip(batch.columns, column_types):
+        valid = _valid_mask(array)
+        if pg_type in FIXED_WIDTH_TYPES:
+            values = _fixed_values(array, pg_type)
+            lengths = np.where(valid, values.dtype.itemsize, -1)
+            columns.append((valid, lengths, values, None))
+        else:
+            offsets, data = _variable_values(array, pg_type)
+            lengths = np.where(valid, np.diff(offsets), -1)
+            columns.append((valid, lengths, offsets, data))
+        row_sizes += 4 + np.maximum(lengths, 0)
+    
+    prefix = len(BINARY_HEADER) if header else 0
+    suffix = len(BINARY_TRAILER) if header else 0
+    row_starts = prefix + np.concatenate(([0], np.cumsum(row_sizes)[:-1])) if rows \
+        else np.zeros(0, dtype=np.int64)
+    buf = np.zeros(prefix + int(row_sizes.sum()) + suffix, dtype=np.uint8)
+    if header:
+        buf[:prefix] = np.frombuffer(BINARY_HEADER, dtype=np.uint8)
+        buf[len(buf) - suffix:] = np.frombuffer(BINARY_TRAILER, dtype=np.uint8)
+    
+    _scatter(buf, row_starts, np.full(rows, len(columns), dtype='>i2'), 2)
+    positions = row_starts + 2
+    for valid, lengths, values, data in columns:
+        _scatter(buf, positions, lengths.astype('>i4'), 4)
+        data_starts = positions + 4
+        if data is None:
+            _scatter(buf, data_starts[valid], values[valid], values.dtype.itemsize)
+        else:
+            copy_lengths = np.maximum(lengths, 0)
+            total = int(copy_lengths.sum())
+            if total:
+                # Byte k of row i goes from offsets[i] + k to data_starts[i] + k
+                row_of_byte = np.repeat(np.arange(rows), copy_lengths)
+                within = np.arange(total) - np.repeat(np.cumsum(copy_lengths) - copy_lengths,
+                                                      copy_lengths)
+                buf[data_starts[row_of_byte] + within] = data[values[:-1][row_of_byte] + within]
+        positions = data_starts + np.maximum(lengths, 0)
+    
+    return buf.tobytes()
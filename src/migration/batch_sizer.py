@@ -0,0 +1,115 @@
+"""
+Adaptive per-table batch sizing for data migration.
+"""
+
+import threading
+from typing import Any, Dict, List, Optional
+
+# Rows sampled from each batch to estimate its size
+ROW_SAMPLE_SIZE = 16
+# Size counted for values that are not str/bytes (numbers, dates, ...)
+FIXED_VALUE_BYTES = 8
+# Weight of the newest batch in the moving averages
+SMOOTHING = 0.5
+# Largest growth factor from one batch to the next; shrinking is not limited
+MAX_GROWTH = 2.0
+
+
+def estimate_row_bytes(batch: List[tuple]) -> float:
+    """Estimate the average payload size of the rows of a batch from a sample."""
+    if not batch:
+        return 0.0
+    step = max(1, len(batch) // ROW_SAMPLE_SIZE)
+    sample = batch[::step][:ROW_SAMPLE_SIZE]
+    total = 0
+    for row in sample:
+        for value in row:
+            if isinstance(value, (str, bytes, bytearray)):
+                total += len(value)
+            elif value is not None:
+                total += FIXED_VALUE_BYTES
+    return total / len(sample)
+
+
+class AdaptiveBatchSizer:
+    """
+    Chooses the number of rows per batch of one table, so that a batch stays
+    within a byte budget and loads within a target time.
+    
+    Row size and load time per row are tracked as moving averages over the
+    loaded batches. A row size above the average is taken at once, so the
+    size shrinks immediately when large rows show up, while growth is limited
+    to MAX_GROWTH per batch. Safe to share between threads.
+    """
+    
+    def __init__(self, initial: int, min_size: int, max_size: int,
+                 target_bytes: int, target_seconds: float):
+        """
+        Args:
+            initial: Rows in the first batch (clamped to the bounds)
+            min_size: Smallest batch size
+            max_size: Largest batch size
+            target_bytes: Budget for the payload of one batch
+            target_seconds: Target time to load one batch
+        """
+        self.min_size = max(1, min_size)
+        self.max_size = max(self.min_size, max_size)
+        self.target_bytes = target_bytes
+        self.target_seconds = target_seconds
+        self.size = self._clamp(initial)
+        self.initial = self.size
+        self.smallest = self.size
+        self.largest = self.size
+        self.row_bytes: Optional[float] = None
+        self.row_seconds: Optional[float] = None
+        self._lock = threading.Lock()
+    
+    def _clamp(self, size: float) -> int:
+        return int(min(self.max_size, max(self.min_size, size)))
+    
+    def record(self, rows: int, batch_bytes: float, seconds: float) -> int:
+        """
+        Record a loaded batch and compute the size of the next one.
+        
+        Args:
+            rows: Rows in the batch
+            batch_bytes: Estimated payload size of the batch
+            seconds: Time taken to load the batch
+        
+        Returns:
+            The new batch size
+        """
+        if rows <= 0:
+            return self.size
+        with self._lock:
+            row_bytes = batch_bytes / rows
+            if self.row_bytes is None or row_bytes > self.row_bytes:
+                self.row_bytes = row_bytes
+            else:
+                self.row_bytes += SMOOTHING * (row_bytes - self.row_bytes)
+            row_seconds = seconds / rows
+            if self.row_seconds is None:
+                self.row_seconds = row_seconds
+            else:
+                self.row_seconds += SMOOTHING * (row_seconds - self.row_seconds)
+            
+            target = self.size * MAX_GROWTH
+            if self.row_bytes > 0:
+                target = min(target, self.target_bytes / self.row_bytes)
+            if self.row_seconds > 0:
+                target = min(target, self.target_seconds / self.row_seconds)
+            
+            self.size = self._clamp(target)
+            self.smallest = min(self.smallest, self.size)
+            self.largest = max(self.largest, self.size)
+            return self.size
+    
+    def summary(self) -> Dict[str, Any]:
+        """Batch sizes used so far, with the current row size estimate."""
+        return {
+            'initial': self.initial,
+            'smallest': self.smallest,
+            'largest': self.largest,
+            'final': self.size,
+            'row_bytes': round(self.row_bytes) if self.row_bytes is not None else None,
+        }
@@ -0,0 +1,102 @@
+"""
+In-memory model of the Oracle catalog, loaded for many tables at once.
+"""
+
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+# Oracle accepts at most 1000 expressions in an IN list
+IN_LIST_LIMIT = 1000
+
+
+@dataclass
+class TableMetadata:
+    """
+    Dictionary information about one Oracle table.
+    
+    Rows have the shapes returned by the per-table OracleConnector queries,
+    so the schema converter handles both alike:
+    
+    - columns: (column_name, data_type, data_length, data_precision,
+      data_scale, nullable, data_default), in column order
+    - primary_keys: column names, in key order
+    - foreign_keys: (constraint_name, column_name, r_owner, r_constraint_name,
+      ref_column, ref_table, delete_rule), by constraint and column position
+    - indexes: (index_name, column_name, column_position, uniqueness)
+    """
+    
+    name: str
+    columns: List[tuple] = field(default_factory=list)
+    primary_keys: List[str] = field(default_factory=list)
+    foreign_keys: List[tuple] = field(default_factory=list)
+    indexes: List[tuple] = field(default_factory=list)
+
+
+def table_filter_chunks(tables: Optional[List[str]]) -> List[Optional[List[str]]]:
+    """
+    Split a table filter into IN lists Oracle accepts.
+    
+    Returns:
+        [None] for no filter (the whole schema), else lists of at most
+        IN_LIST_LIMIT names
+    """
+    if tables is None:
+        return [None]
+    return [tables[i:i + IN_LIST_LIMIT] for i in range(0, len(tables), IN_LIST_LIMIT)]
+
+
+def in_list(column: str, tables: Optional[List[str]], params: Dict[str, Any]) -> str:
+    """
+    Build an "AND column IN (...)" condition with one bind per table name.
+    
+    Args:
+        column: Qualified column holding the table name
+        tables: Table names, or None for no condition
+        params: Bind parameters, extended in place
+    """
+    if tables is None:
+        return ''
+    binds = []
+    for i, table_name in enumerate(tables):
+        params[f't{i}'] = table_name
+        binds.append(f':t{i}')
+    return f"AND {column} IN ({', '.join(binds)})"
+
+
+def foreign_key_order(catalog: Dict[str, TableMetadata],
+                      tables: List[str]) -> Tuple[List[str], List[str]]:
+    """
+    Order tables so that each one follows the tables its foreign keys
+    reference (self-references and tables outside the list are ignored).
+    
+    Args:
+        catalog: Metadata of every table in tables
+        tables: Tables to order
+    
+    Returns:
+        Tuple of (tables in dependency order, tables in reference cycles or
+        depending on one, in their given order)
+    """
+    selected = set(tables)
+    waiting_on = {}
+    dependents = {table_name: [] for table_name in tables}
+    for table_name in tables:
+        referenced = {fk[5] for fk in catalog[table_name].foreign_keys
+                      if fk[5] in selected and fk[5] != table_name}
+        waiting_on[table_name] = len(referenced)
+        for ref_table in referenced:
+            dependents[ref_table].append(table_name)
+    
+    ready = deque(table_name for table_name in tables if not waiting_on[table_name])
+    ordered = []
+    while ready:
+        table_name = ready.popleft()
+        ordered.append(table_name)
+        for dependent in dependents[table_name]:
+            waiting_on[dependent] -= 1
+            if not waiting_on[dependent]:
+                ready.append(dependent)
+    
+    placed = set(ordered)
+    return ordered, [table_name for table_name in tables if table_name not in placed]
@@ -0,0 +1,147 @@
+"""
+Per-table and per-chunk progress checkpoints for resumable data migration.
+"""
+
+import json
+import logging
+from datetime import date, datetime
+from decimal import Decimal
+from typing import Any, Dict, List, Optional
+from .db_connector import PostgreSQLConnector
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_TABLE = '_migration_checkpoints'
+
+
+def json_values(values: List[Any]) -> List[Any]:
+    """Convert row or key values to JSON-compatible values that decode_key restores."""
+    encoded = []
+    for value in values:
+        if isinstance(value, datetime):
+            encoded.append({'datetime': value.isoformat()})
+        elif isinstance(value, date):
+            encoded.append({'date': value.isoformat()})
+        elif isinstance(value, Decimal):
+            encoded.append({'decimal': str(value)})
+        elif isinstance(value, (bytes, bytearray)):
+            encoded.append({'bytes': bytes(value).hex()})
+        else:
+            encoded.append(value)
+    return encoded
+
+
+def encode_key(values: Optional[List[Any]]) -> Optional[str]:
+    """Serialize key values (PK column values or a ROWID) to JSON."""
+    if values is None:
+        return None
+    return json.dumps(json_values(values))
+
+
+def decode_key(text: Optional[str]) -> Optional[List[Any]]:
+    """Inverse of encode_key."""
+    if text is None:
+        return None
+    decoded = []
+    for value in json.loads(text):
+        if isinstance(value, dict):
+            if 'datetime' in value:
+                value = datetime.fromisoformat(value['datetime'])
+            elif 'date' in value:
+                value = date.fromisoformat(value['date'])
+            elif 'decimal' in value:
+                value = Decimal(value['decimal'])
+            elif 'bytes' in value:
+                value = bytes.fromhex(value['bytes'])
+        decoded.append(value)
+    return decoded
+
+
+class CheckpointStore:
+    """
+    Stores migration progress in a control table in the target schema.
+    
+    Checkpoint rows are written on the same connection and in the same
+    transaction as the batch they describe, so a committed checkpoint never
+    runs ahead of (or behind) the committed data.
+    """
+    
+    def __init__(self, schema: str, table: str = CHECKPOINT_TABLE):
+        self.qualified_name = f'"{schema}"."{table}"'
+    
+    def ensure_table(self, pg_conn: PostgreSQLConnector):
+        """Create the control table if it does not exist."""
+        pg_conn.execute_command(f"""
+            CREATE TABLE IF NOT EXISTS {self.qualified_name} (
+                table_name TEXT NOT NULL,
+                chunk_id INTEGER NOT NULL,
+                chunk_spec TEXT,
+                last_key TEXT,
+                rows_loaded BIGINT NOT NULL DEFAULT 0,
+                status TEXT NOT NULL DEFAULT 'pending',
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+                PRIMARY KEY (table_name, chunk_id)
+            )
+        """)
+    
+    def load(self, pg_conn: PostgreSQLConnector, table_name: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Load the checkpoints of a table.
+        
+        Returns:
+            Dictionary mapping chunk id to a dict with 'chunk_spec' (where
+            clause, bind params and partition name, or None), 'last_key',
+            'rows_loaded' and 'status'
+        """
+        rows = pg_conn.execute_query(
+            f"SELECT chunk_id, chunk_spec, last_key, rows_loaded, status "
+            f"FROM {self.qualified_name} WHERE table_name = %s ORDER BY chunk_id",
+            (table_name,)
+        )
+        return {
+            row['chunk_id']: {
+                'chunk_spec': json.loads(row['chunk_spec']) if row['chunk_spec'] else None,
+                'last_key': decode_key(row['last_key']),
+                'rows_loaded': row['rows_loaded'],
+                'status': row['status'],
+            }
+            for row in rows
+        }
+    
+    def reset(self, pg_conn: PostgreSQLConnector, table_name: str):
+        """Discard all checkpoints of a table."""
+        pg_conn.execute_command(
+            f"DELETE FROM {self.qualified_name} WHERE table_name = %s", (table_name,)
+        )
+    
+    def register(self, pg_conn: PostgreSQLConnector, table_name: str,
+                 chunk_specs: List[Optional[List[Any]]]):
+        """
+        Record the chunks a table is split into, so a resumed run reuses the
+        same ranges even if replanning would produce different ones.
+        """
+        for chunk_id, spec in enumerate(chunk_specs):
+            pg_conn.cursor.execute(
+                f"INSERT INTO {self.qualified_name} (table_name, chunk_id, chunk_spec) "
+                f"VALUES (%s, %s, %s) ON CONFLICT (table_name, chunk_id) DO NOTHING",
+                (table_name, chunk_id, json.dumps(spec) if spec else None)
+            )
+        pg_conn.connection.commit()
+    
+    def save(self, pg_conn: PostgreSQLConnector, table_name: str, chunk_id: int,
+             last_key: Optional[List[Any]], rows_loaded: int, done: bool = False):
+        """
+        Record progress of a chunk without committing; the caller commits it
+        together with the batch it describes.
+        """
+        pg_conn.cursor.execute(
+            f"INSERT INTO {self.qualified_name} "
+            f"(table_name, chunk_id, last_key, rows_loaded, status, updated_at) "
+            f"VALUES (%s, %s, %s, %s, %s, now()) "
+            f"ON CONFLICT (table_name, chunk_id) DO UPDATE SET "
+            f"last_key = COALESCE(EXCLUDED.last_key, {self.qualified_name}.last_key), "
+            f"rows_loaded = EXCLUDED.rows_loaded, status = EXCLUDED.status, "
+            f"updated_at = EXCLUDED.updated_at",
+            (table_name, chunk_id, encode_key(last_key), rows_loaded,
+             'done' if done else 'in_progress')
+        )
@@ -2,22 +2,346 @@
 Data migration utilities for Oracle to PostgreSQL.
 """
 
+import copy
 import logging
-from typing import List, Optional
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 from tqdm import tqdm
-from .db_connector import OracleConnector, PostgreSQLConnector
+from .db_connector import OracleConnector, PostgreSQLConnector, LOB_LOCATOR_SUFFIX, is_row_error
+from . import arrow_copy, pg_copy
+from .batch_sizer import AdaptiveBatchSizer, estimate_row_bytes
+from .checkpoint import CheckpointStore
+from .dead_letter import DeadLetterWriter
+from .row_converter import column_conversion, compile_row_converter, select_expression
+from .pipeline import BatchPipeline, summarize_stage_times
+from .scheduler import TableScheduler
 
 logger = logging.getLogger(__name__)
 
 
+LOAD_METHODS = ('insert', 'copy', 'copy_binary')
+CHUNK_STRATEGIES = ('auto', 'pk', 'rowid')
+EXTRACTION_MODES = ('cursor', 'keyset')
+# Attempts per keyset page before the transfer fails, with exponential backoff
+PAGE_RETRIES = 3
+PAGE_RETRY_DELAY = 1.0
+NUMERIC_ORACLE_TYPES = ('NUMBER', 'FLOAT', 'INTEGER', 'BINARY_FLOAT', 'BINARY_DOUBLE')
+LOB_ORACLE_TYPES = ('CLOB', 'NCLOB', 'BLOB')
+# Savepoint used while isolating the bad rows of a failed batch
+BISECT_SAVEPOINT = 'migration_bisect'
+# When loaded batches are committed: after each batch, every commit_interval
+# batches, every commit_interval bytes, or once per chunk (or unchunked table)
+COMMIT_POLICIES = ('batch', 'batches', 'bytes', 'chunk')
+DEFAULT_COMMIT_INTERVALS = {'batches': 10, 'bytes': 67108864}
+# Savepoint around each batch when a transaction spans several batches
+BATCH_SAVEPOINT = 'migration_batch'
+# Source row totals: optimizer statistics or COUNT(*)
+ROW_COUNT_MODES = ('estimate', 'exact')
+
+
+class _TableJob:
+    """Per-table transfer settings and statistics shared by every batch."""
+    
+    def __init__(self, table_name: str, column_names: List[str],
+                 copy_format: Optional[str] = None, column_types: Optional[List[str]] = None):
+        self.table_name = table_name
+        self.column_names = column_names
+        self.copy_format = copy_format
+        self.column_types = column_types
+        self.stats: Dict[str, Any] = {'rows': {'loaded': 0, 'rejected': 0, 'skipped': 0}}
+        # Select-list expression per column (LOB columns are size-tested)
+        self.column_exprs = [f'"{col}"' for col in column_names]
+        # (column index, fetched row index) of locators for large LOBs
+        self.lob_locators: List[Tuple[int, int]] = []
+        # Compiled by row_converter; None when fetched rows load as they are
+        self.convert_row: Optional[Callable[[tuple], tuple]] = None
+        # pg_type names for the columnar (Arrow) path; None for the row path
+        self.columnar_types: Optional[List[str]] = None
+        # Ordering key used for checkpoints: SQL expressions, bind expressions,
+        # positions in the fetched row and extra select-list expressions
+        self.key_exprs: List[str] = []
+        self.key_binds: List[str] = []
+        self.key_indexes: List[int] = []
+        self.extra_select: List[str] = []
+        # True when rows are read in keyset pages instead of one cursor
+        self.paged = False
+        # Extraction cursor tuning
+        self.arraysize = 0
+        self.prefetchrows = 0
+        # Set in adaptive batch mode
+        self.sizer: Optional[AdaptiveBatchSizer] = None
+        self._lock = threading.Lock()
+    
+    def keyset_predicate(self) -> str:
+        """Build a predicate selecting rows after the key bound to :k0, :k1, ..."""
+        clauses = []
+        for i, expr in enumerate(self.key_exprs):
+            terms = [f'{self.key_exprs[j]} = {self.key_binds[j]}' for j in range(i)]
+            terms.append(f'{expr} > {self.key_binds[i]}')
+            clauses.append('(' + ' AND '.join(terms) + ')')
+        return '(' + ' OR '.join(clauses) + ')'
+    
+    def add_stage_times(self, stage_times: Dict[str, Dict[str, float]]):
+        """Accumulate pipeline stage timings across transfers (e.g. chunks)."""
+        with self._lock:
+            totals = self.stats.setdefault('pipeline', {})
+            for stage, timing in stage_times.items():
+                stage_total = totals.setdefault(stage, {'busy': 0.0, 'idle': 0.0, 'batches': 0})
+                for key, value in timing.items():
+                    stage_total[key] = stage_total.get(key, 0) + value
+
+    def add_lob_stats(self, inline_values: int, inline_bytes: int,
+                      streamed_values: int, streamed_bytes: int):
+        """Accumulate LOB counters (bytes are characters for CLOB/NCLOB)."""
+        with self._lock:
+            totals = self.stats.setdefault('lobs', {
+                'inline_values': 0, 'inline_bytes': 0,
+                'streamed_values': 0, 'streamed_bytes': 0,
+            })
+            totals['inline_values'] += inline_values
+            totals['inline_bytes'] += inline_bytes
+            totals['streamed_values'] += streamed_values
+            totals['streamed_bytes'] += streamed_bytes
+
+    def add_row_counts(self, loaded: int = 0, rejected: int = 0, skipped: int = 0):
+        """Accumulate rows loaded, rejected (dead-lettered) and skipped (not loaded or examined)."""
+        with self._lock:
+            rows = self.stats['rows']
+            rows['loaded'] += loaded
+            rows['rejected'] += rejected
+            rows['skipped'] += skipped
+    
+    def add_round_trips(self, count: int, measured: bool):
+        """Accumulate Oracle round trips; the total is 'measured' only if every part was."""
+        with self._lock:
+            fetch = self.stats.setdefault('fetch', {
+                'arraysize': self.arraysize, 'prefetchrows': self.prefetchrows,
+                'round_trips': 0, 'measured': True,
+            })
+            fetch['round_trips'] += count
+            fetch['measured'] = fetch['measured'] and measured
+
+
+class _CommitWindow:
+    """
+    Batches loaded on one connection since its last commit, and the commit
+    policy deciding when to commit them.
+    
+    When a transaction spans several batches, each batch runs under a
+    savepoint, so a failed batch is undone without losing the others. Row
+    counts are added to the table only once committed; if a commit fails,
+    the window's rows are counted as skipped and the chunk's checkpoint
+    position goes back to the last commit. Checkpointed chunks stop there
+    (see DataMigrator._stop_if_skipped), so no later batch saves a position
+    past the discarded rows.
+    """
+    
+    def __init__(self, pg_conn: PostgreSQLConnector, job: '_TableJob', chunk: Dict[str, Any],
+                 policy: str, interval: int):
+        self.pg_conn = pg_conn
+        self.job = job
+        self.chunk = chunk
+        self.policy = policy
+        self.interval = interval
+        self.guarded = policy != 'batch'
+        self.committed_rows = chunk['rows_loaded']
+        self._reset()
+    
+    def _reset(self):
+        self.batches = 0
+        self.bytes = 0
+        self.loaded = 0
+        self.rejected = 0
+    
+    def begin(self):
+        """Start a batch."""
+        if self.guarded:
+            self.pg_conn.savepoint(BATCH_SAVEPOINT)
+    
+    def add(self, batch: Any, loaded: int, rejected: int = 0):
+        """Finish a batch and commit the window if the policy says so."""
+        if self.guarded:
+            self.pg_conn.release_savepoint(BATCH_SAVEPOINT)
+        self.batches += 1
+        self.loaded += loaded
+        self.rejected += rejected
+        if self.policy == 'bytes':
+            self.bytes += batch.nbytes if hasattr(batch, 'nbytes') \
+                else estimate_row_bytes(batch) * len(batch)
+        
+        if (self.policy == 'batch'
+                or (self.policy == 'batches' and self.batches >= self.interval)
+                or (self.policy == 'bytes' and self.bytes >= self.interval)):
+            self.commit()
+    
+    def undo(self):
+        """Undo a failed batch; if that is not possible, the whole window is discarded."""
+        if self.guarded:
+            try:
+                self.pg_conn.rollback_to_savepoint(BATCH_SAVEPOINT)
+                self.pg_conn.release_savepoint(BATCH_SAVEPOINT)
+                return
+            except Exception as e:
+                logger.error(f"Cannot roll back batch of {self.job.table_name} to its "
+                             f"savepoint, discarding uncommitted batches: {e}")
+        self._discard()
+    
+    def commit(self):
+        """Commit the window and count its rows."""
+        try:
+            self.pg_conn.commit()
+        except Exception as e:
+            logger.error(f"Error committing {self.batches} batches of {self.job.table_name}: {e}")
+            self._discard()
+            return
+        self.job.add_row_counts(loaded=self.loaded, rejected=self.rejected)
+        self.committed_rows = self.chunk['rows_loaded']
+        self._reset()
+    
+    def skip(self, rows: int):
+        """Count rows of the chunk that were neither loaded nor dead-lettered."""
+        self.job.add_row_counts(skipped=rows)
+        self.chunk['skipped'] += rows
+    
+    def _discard(self):
+        try:
+            self.pg_conn.rollback()
+        except Exception as e:
+            logger.error(f"Error rolling back {self.job.table_name}: {e}")
+        self.skip(self.loaded + self.rejected)
+        self.chunk['rows_loaded'] = self.committed_rows
+        self._reset()
+
+
 class DataMigrator:
     """Migrates data from Oracle to PostgreSQL."""
     
     def __init__(self, oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector,
-                 batch_size: int = 1000):
+                 batch_size: int = 1000, load_method: str = 'insert',
+                 parallel_chunks: int = 1, chunk_by: str = 'auto',
+                 chunk_column: Optional[str] = None, workers: int = 1,
+                 pipeline_writers: int = 0, pipeline_queue_size: int = 4,
+                 checkpoint: bool = False, resume: bool = False,
+                 extraction: str = 'cursor', lob_inline_limit: int = 262144,
+                 lob_chunk_size: int = 1048576, columnar_tables: Optional[List[str]] = None,
+                 set_logged: bool = False,
+                 table_fetch: Optional[Dict[str, Dict[str, int]]] = None,
+                 adaptive_batch: bool = False, min_batch_size: int = 100,
+                 max_batch_size: int = 50000, batch_target_bytes: int = 33554432,
+                 batch_target_seconds: float = 2.0, dead_letter_dir: str = 'dead_letter',
+                 commit_policy: str = 'batch', commit_interval: Optional[int] = None,
+                 row_counts: str = 'estimate', partition_workers: int = 0):
+        """
+        Args:
+            oracle_conn: Source connection
+            pg_conn: Target connection
+            batch_size: Number of rows fetched and loaded per batch
+            load_method: 'insert' (executemany), 'copy' (COPY text format)
+                or 'copy_binary' (COPY binary format)
+            parallel_chunks: Number of disjoint ranges each table is split
+                into; each range gets its own worker and connection pair
+            chunk_by: 'auto' (numeric PK if available, else ROWID), 'pk' or 'rowid'
+            chunk_column: Numeric column to split on, overriding chunk_by
+            workers: Number of tables migrated concurrently by migrate_all_tables
+            pipeline_writers: If > 0, overlap fetching and loading with this
+                many writer threads per transfer
+            pipeline_queue_size: Maximum number of fetched batches buffered
+                between the reader and the writers
+            checkpoint: Record per-table and per-chunk progress in the target
+                schema; rows are then extracted in primary key (or ROWID) order
+            resume: Skip tables whose checkpoints are complete and continue
+                partially migrated ones from their last committed key
+                (implies checkpoint)
+            extraction: 'cursor' (one query per table or chunk) or 'keyset'
+                (short primary key ordered pages, each retried independently;
+                tables without a primary key fall back to 'cursor')
+            lob_inline_limit: LOBs up to this length (bytes for BLOB,
+                characters for CLOB) are fetched inline with the row; longer
+                ones are fetched as locators and streamed
+            lob_chunk_size: Piece size used when streaming large LOBs
+            columnar_tables: Tables transferred as Arrow record batches
+                encoded straight into binary COPY ('*' for every table);
+                needs pyarrow and python-oracledb 3.0+, and falls back to
+                the row path for tables it cannot handle
+            set_logged: Switch UNLOGGED target tables (created by the schema
+                step in unlogged mode) to LOGGED once their row count
+                matches the source; tables failing the check stay UNLOGGED
+            table_fetch: Per-table 'arraysize' and 'prefetchrows' of the
+                extraction cursor, overriding the Oracle connector's settings
+                (which default to batch_size)
+            adaptive_batch: Size batches per table between min_batch_size and
+                max_batch_size, aiming for batch_target_bytes of row data and
+                batch_target_seconds of load time per batch; batch_size is
+                the starting point (lowered for tables with wide rows).
+                Columnar transfers keep batch_size
+            min_batch_size: Smallest adaptive batch size
+            max_batch_size: Largest adaptive batch size
+            batch_target_bytes: Adaptive byte budget per batch
+            batch_target_seconds: Adaptive load time target per batch
+            dead_letter_dir: Directory of the per-table JSONL files receiving
+                rows rejected by PostgreSQL; failed batches are bisected so
+                only the bad rows are rejected
+            commit_policy: 'batch' (commit each batch), 'batches' (every
+                commit_interval batches), 'bytes' (every commit_interval bytes
+                of row data) or 'chunk' (once per chunk, or per table when it
+                is not split); batches of a multi-batch transaction run under
+                savepoints. With checkpoints this is the unit of restart
+            commit_interval: Batches or bytes per commit (default: 10
+                batches, 64 MB)
+            row_counts: 'estimate' (optimizer statistics, read for all tables
+                in one query) or 'exact' (a COUNT(*) per table) row totals for
+                progress reporting; the UNLOGGED row check always counts exactly
+            partition_workers: If > 0, partitioned tables are extracted one
+                partition at a time (SELECT ... PARTITION (p)), largest first,
+                with this many partitions in flight, each on its own
+                connections; every partition is a chunk with its own
+                checkpoint. Takes precedence over parallel_chunks
+        """
+        if load_method not in LOAD_METHODS:
+            raise ValueError(f"Unknown load method: {load_method}")
+        if chunk_by not in CHUNK_STRATEGIES:
+            raise ValueError(f"Unknown chunk strategy: {chunk_by}")
+        if extraction not in EXTRACTION_MODES:
+            raise ValueError(f"Unknown extraction mode: {extraction}")
+        if commit_policy not in COMMIT_POLICIES:
+            raise ValueError(f"Unknown commit policy: {commit_policy}")
+        if row_counts not in ROW_COUNT_MODES:
+            raise ValueError(f"Unknown row count mode: {row_counts}")
         self.oracle_conn = oracle_conn
         self.pg_conn = pg_conn
         self.batch_size = batch_size
+        self.load_method = load_method
+        self.parallel_chunks = max(1, parallel_chunks)
+        self.chunk_by = chunk_by
+        self.chunk_column = chunk_column.upper() if chunk_column else None
+        self.workers = max(1, workers)
+        self.pipeline_writers = max(0, pipeline_writers)
+        self.pipeline_queue_size = pipeline_queue_size
+        self.extraction = extraction
+        self.lob_inline_limit = max(0, lob_inline_limit)
+        self.lob_chunk_size = lob_chunk_size
+        self.columnar_tables = {table.upper() for table in (columnar_tables or [])}
+        self.resume = resume
+        self.checkpoints = CheckpointStore(pg_conn.schema) if (checkpoint or resume) else None
+        self.table_stats: Dict[str, Dict[str, Any]] = {}
+        self.set_logged = set_logged
+        self.adaptive_batch = adaptive_batch
+        self.min_batch_size = min_batch_size
+        self.max_batch_size = max_batch_size
+        self.batch_target_bytes = batch_target_bytes
+        self.batch_target_seconds = batch_target_seconds
+        self.dead_letters = DeadLetterWriter(dead_letter_dir)
+        self.commit_policy = commit_policy
+        self.commit_interval = commit_interval or DEFAULT_COMMIT_INTERVALS.get(commit_policy, 1)
+        self.table_fetch = {table.upper(): sizes for table, sizes in (table_fetch or {}).items()}
+        self.row_counts = row_counts
+        self.partition_workers = max(0, partition_workers)
+        # Optimizer row estimates by table (None for tables without statistics)
+        self.row_estimates: Dict[str, Optional[int]] = {}
+        # Verified tables whose SET LOGGED must wait for the tables they reference
+        self._logged_pending: List[str] = []
     
     def migrate_table(self, table_name: str, truncate: bool = False) -> bool:
         """
@@ -38,64 +362,98 @@ class DataMigrator:
                 logger.error(f"Table {table_name} does not exist in PostgreSQL. Run schema migration first.")
                 return False
             
-            # Get row count
-            total_rows = self.oracle_conn.get_row_count(table_name)
-            if total_rows == 0:
+            # Get row count (an exact count, or an estimate for progress only)
+            total_rows = self._total_rows(table_name)
+            exact_rows = total_rows if self.row_counts == 'exact' else None
+            if exact_rows == 0:
                 logger.info(f"Table {table_name} is empty, skipping data migration")
-                return True
+                return self._verify_and_set_logged(table_name, exact_rows)
+            
+            if exact_rows is not None:
+                logger.info(f"Migrating {total_rows} rows from {table_name}")
+            elif total_rows is not None:
+                logger.info(f"Migrating about {total_rows} rows from {table_name} (statistics estimate)")
+            else:
+                logger.info(f"Migrating {table_name} (no statistics for a row estimate)")
             
-            logger.info(f"Migrating {total_rows} rows from {table_name}")
+            checkpoints = self._load_checkpoints(table_name) if self.checkpoints else {}
+            if checkpoints and all(c['status'] == 'done' for c in checkpoints.values()):
+                logger.info(f"Table {table_name} already migrated according to checkpoints, skipping")
+                return self._verify_and_set_logged(table_name, exact_rows)
             
             # Truncate if requested
-            if truncate:
+            if truncate and checkpoints:
+                logger.warning(f"Not truncating {table_name}: resuming from checkpoints")
+            elif truncate:
                 schema = self.pg_conn.schema
                 self.pg_conn.execute_command(f'TRUNCATE TABLE "{schema}"."{table_name}"')
                 logger.info(f"Truncated table: {table_name}")
+            if not checkpoints:
+                self.dead_letters.reset(table_name)
             
             # Get column names
             columns = self.oracle_conn.get_table_columns(table_name)
             column_names = [col[0] for col in columns]
             
-            # Build SELECT query
-            schema = self.oracle_conn.schema
-            col_list = ', '.join([f'"{col}"' for col in column_names])
-            query = f'SELECT {col_list} FROM "{schema}"."{table_name}"'
+            copy_format, column_types = self._resolve_copy_format(table_name, column_names)
+            job = _TableJob(table_name, column_names, copy_format, column_types)
+            self.table_stats[table_name] = job.stats
+            job.column_exprs = [select_expression(col[0], col[1]) for col in columns]
+            self._plan_lobs(job, columns)
+            if self.checkpoints or self.extraction == 'keyset':
+                self._resolve_key(job)
+            job.convert_row = compile_row_converter(
+                [col[1] for col in columns], len(column_names) + len(job.extra_select)
+            )
+            if '*' in self.columnar_tables or table_name.upper() in self.columnar_tables:
+                self._plan_columnar(job, columns)
+            if self.adaptive_batch and not job.columnar_types:
+                job.sizer = self._new_sizer(columns)
+            job.arraysize, job.prefetchrows = self._fetch_sizes(
+                table_name, job.sizer.size if job.sizer else self.batch_size
+            )
             
-            # Fetch and insert data in batches
-            self.oracle_conn.cursor.execute(query)
+            if checkpoints:
+                chunks = self._resume_chunks(table_name, checkpoints)
+            else:
+                chunks = self._new_chunks(table_name, columns)
+            pending = [chunk for chunk in chunks if chunk['status'] != 'done']
             
             with tqdm(total=total_rows, desc=f"Migrating {table_name}") as pbar:
-                while True:
-                    batch = self.oracle_conn.cursor.fetchmany(self.batch_size)
-                    if not batch:
-                        break
-                    
-                    # Convert Oracle data types to Python types
-                    converted_batch = []
-                    for row in batch:
-                        converted_row = []
-                        for i, value in enumerate(row):
-                            # Handle Oracle-specific types
-                            if value is None:
-                                converted_row.append(None)
-                            elif hasattr(value, 'read'):  # LOB types
-                                try:
-                                    converted_row.append(value.read())
-                                except:
-                                    converted_row.append(str(value))
-                            else:
-                                converted_row.append(value)
-                        converted_batch.append(tuple(converted_row))
-                    
-                    # Insert batch into PostgreSQL
-                    try:
-                        self.pg_conn.insert_data(table_name, column_names, converted_batch)
-                        pbar.update(len(batch))
-                    except Exception as e:
-                        logger.error(f"Error inserting batch into {table_name}: {e}")
-                        # Continue with next batch
-                        pbar.update(len(batch))
+                pbar.update(sum(chunk['rows_loaded'] for chunk in chunks))
+                if len(pending) > 1:
+                    self._migrate_chunks(job, pending, pbar)
+                elif pending:
+                    self._transfer(self.oracle_conn, self.pg_conn, job, pending[0],
+                                   pbar.update)
             
+            if 'pipeline' in job.stats:
+                logger.info(f"Pipeline stages for {table_name}: "
+                            f"{summarize_stage_times(job.stats['pipeline'])}")
+            if 'lobs' in job.stats:
+                lobs = job.stats['lobs']
+                logger.info(f"LOB data for {table_name}: {lobs['inline_values']} inline "
+                            f"({lobs['inline_bytes']} bytes), {lobs['streamed_values']} "
+                            f"streamed ({lobs['streamed_bytes']} bytes)")
+            if job.sizer:
+                sizes = job.sizer.summary()
+                job.stats['batch_size'] = sizes
+                logger.info(f"Batch size for {table_name}: started at {sizes['initial']}, "
+                            f"ranged {sizes['smallest']}-{sizes['largest']}, ended at "
+                            f"{sizes['final']} (~{sizes['row_bytes']} bytes per row)")
+            if 'fetch' in job.stats:
+                fetch = job.stats['fetch']
+                logger.info(f"Fetch for {table_name}: arraysize {fetch['arraysize']}, "
+                            f"prefetchrows {fetch['prefetchrows']}, {fetch['round_trips']} "
+                            f"round trips ({'measured' if fetch['measured'] else 'estimated'})")
+            rows = job.stats['rows']
+            if rows['rejected'] or rows['skipped']:
+                logger.error(f"Table {table_name}: {rows['loaded']} rows loaded, "
+                             f"{rows['rejected']} rejected (see {self.dead_letters.path(table_name)}), "
+                             f"{rows['skipped']} skipped")
+                return False
+            if not self._verify_and_set_logged(table_name, exact_rows):
+                return False
             logger.info(f"Successfully migrated data for table: {table_name}")
             return True
             
@@ -103,6 +461,807 @@ class DataMigrator:
             logger.error(f"Error migrating data for table {table_name}: {e}")
             return False
     
+    def _total_rows(self, table_name: str) -> Optional[int]:
+        """
+        Get the number of rows of a source table: exact in 'exact' mode, else
+        the optimizer estimate (None if the table has no statistics).
+        """
+        if self.row_counts == 'exact':
+            return self.oracle_conn.get_row_count(table_name)
+        if table_name not in self.row_estimates:
+            self.load_row_estimates([table_name])
+        return self.row_estimates[table_name]
+    
+    def load_row_estimates(self, tables: List[str]):
+        """Read the optimizer row estimates of tables with one statistics query."""
+        try:
+            stats = self.oracle_conn.get_table_stats(tables)
+        except Exception as e:
+            logger.warning(f"Cannot read table statistics for row estimates: {e}")
+            stats = {}
+        for table_name in tables:
+            self.row_estimates[table_name] = (stats.get(table_name) or {}).get('num_rows')
+    
+    def _verify_and_set_logged(self, table_name: str, expected_rows: Optional[int] = None) -> bool:
+        """
+        Switch an UNLOGGED target table to LOGGED after checking its row count.
+        
+        A table that references another still UNLOGGED table cannot be set
+        LOGGED yet; it is queued and retried by set_pending_logged.
+        
+        Args:
+            table_name: Table to switch
+            expected_rows: Exact source row count, counted here if None
+        
+        Returns:
+            False if the row count does not match (the table stays UNLOGGED)
+        """
+        if not self.set_logged or not self.pg_conn.is_unlogged(table_name):
+            return True
+        
+        if expected_rows is None:
+            expected_rows = self.oracle_conn.get_row_count(table_name)
+        loaded_rows = self.pg_conn.get_row_count(table_name)
+        if loaded_rows != expected_rows:
+            logger.error(f"Row count mismatch for {table_name}: {expected_rows} in Oracle, "
+                         f"{loaded_rows} in PostgreSQL; leaving table UNLOGGED")
+            return False
+        
+        try:
+            self.pg_conn.set_logged(table_name)
+        except Exception as e:
+            self.pg_conn.rollback()
+            logger.warning(f"Cannot set {table_name} LOGGED yet: {e}")
+            self._logged_pending.append(table_name)
+        return True
+    
+    def set_pending_logged(self) -> List[str]:
+        """
+        Retry SET LOGGED for verified tables that were waiting on referenced
+        tables, until no more progress is made.
+        
+        Returns:
+            Names of the tables that are still UNLOGGED
+        """
+        pending = list(self._logged_pending)
+        while pending:
+            remaining = []
+            for table_name in pending:
+                try:
+                    self.pg_conn.set_logged(table_name)
+                except Exception as e:
+                    self.pg_conn.rollback()
+                    remaining.append(table_name)
+                    last_error = e
+            if len(remaining) == len(pending):
+                logger.error(f"Tables left UNLOGGED: {', '.join(remaining)} ({last_error})")
+                break
+            pending = remaining
+        self._logged_pending[:] = pending
+        return pending
+    
+    def _with_connections(self, oracle_conn: OracleConnector,
+                          pg_conn: PostgreSQLConnector) -> 'DataMigrator':
+        """Create a migrator with the same settings bound to other connections."""
+        migrator = copy.copy(self)
+        migrator.oracle_conn = oracle_conn
+        migrator.pg_conn = pg_conn
+        return migrator
+    
+    def _transfer(self, oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector,
+                  job: '_TableJob', chunk: Dict[str, Any], progress: Callable[[int], Any]):
+        """
+        Fetch the rows of one chunk and load them in batches.
+        
+        Args:
+            oracle_conn: Connection to extract from
+            pg_conn: Connection to load into
+            job: Table being transferred
+            chunk: Chunk dict from _new_chunk; its WHERE clause restricts the
+                rows (None for the whole table) and its last_key, when set,
+                resumes after a checkpoint
+            progress: Called with the number of rows in each processed batch
+        """
+        chunk['estimated_round_trips'] = 0
+        chunk['reconnects'] = 0
+        trips_before = oracle_conn.round_trips()
+        batches = self._fetch_batches(oracle_conn, job, chunk)
+        window = self._commit_window(pg_conn, job, chunk)
+        
+        if self.pipeline_writers > 0:
+            self._transfer_pipelined(window, job, chunk, batches, progress)
+        else:
+            for batch, last_key in batches:
+                self._write_batch(window, job, chunk, batch, last_key, progress)
+        
+        # A new session after a reconnect starts its own round trip count
+        trips_after = oracle_conn.round_trips() \
+            if trips_before is not None and not chunk['reconnects'] else None
+        if trips_after is not None:
+            # The counter query after the transfer is itself one round trip
+            job.add_round_trips(trips_after - trips_before - 1, measured=True)
+        else:
+            job.add_round_trips(chunk['estimated_round_trips'], measured=False)
+        
+        if self.checkpoints:
+            self.checkpoints.save(pg_conn, job.table_name, chunk['id'], None,
+                                  chunk['rows_loaded'], done=True)
+        window.commit()
+        # A failed final commit rolls back the done marker with the last batches
+        self._stop_if_skipped(window, job, chunk)
+        chunk['status'] = 'done'
+    
+    def _commit_window(self, pg_conn: PostgreSQLConnector, job: '_TableJob',
+                       chunk: Dict[str, Any]) -> _CommitWindow:
+        """Start tracking uncommitted batches of a chunk on a connection."""
+        return _CommitWindow(pg_conn, job, chunk, self.commit_policy, self.commit_interval)
+    
+    def _fetch_batches(self, oracle_conn: OracleConnector, job: '_TableJob',
+                       chunk: Dict[str, Any]) -> Iterator[Tuple[List[tuple], Optional[list]]]:
+        """
+        Yield converted batches of rows from Oracle.
+        
+        Yields:
+            Tuples of (rows, last_key), where last_key holds the ordering key
+            values of the batch's last row when rows are key ordered, else None
+        """
+        if job.paged:
+            yield from self._fetch_pages(oracle_conn, job, chunk)
+            return
+        if job.columnar_types:
+            yield from self._fetch_record_batches(oracle_conn, job, chunk)
+            return
+        
+        query, params = self._select_query(oracle_conn, job, chunk, chunk['last_key'])
+        
+        # Fetch data in batches
+        cursor = oracle_conn.extraction_cursor(job.arraysize, job.prefetchrows)
+        fetched = 0
+        try:
+            cursor.execute(query, params)
+            while True:
+                batch = cursor.fetchmany(self._batch_size(job))
+                if not batch:
+                    break
+                fetched += len(batch)
+                yield self._convert_rows(job, batch), self._last_key(job, batch)
+        finally:
+            cursor.close()
+            chunk['estimated_round_trips'] += self._estimate_round_trips(job, fetched)
+    
+    def _fetch_record_batches(self, oracle_conn: OracleConnector, job: '_TableJob',
+                              chunk: Dict[str, Any]) -> Iterator[Tuple[Any, Optional[list]]]:
+        """Yield Arrow record batches fetched with python-oracledb's DataFrame API."""
+        query, params = self._select_query(oracle_conn, job, chunk, chunk['last_key'])
+        width = len(job.column_names)
+        
+        fetch_df_batches = oracle_conn.connection.fetch_df_batches
+        if 'numeric' in job.columnar_types:
+            # NUMBER(p, s) columns then arrive as decimal128 rather than float64;
+            # without fetch_decimals, their batches take the row path
+            try:
+                frames = fetch_df_batches(query, params, size=self.batch_size, fetch_decimals=True)
+            except TypeError:
+                frames = fetch_df_batches(query, params, size=self.batch_size)
+        else:
+            frames = fetch_df_batches(query, params, size=self.batch_size)
+        chunk['estimated_round_trips'] += 1
+        for frame in frames:
+            chunk['estimated_round_trips'] += 1
+            for batch in arrow_copy.to_record_batches(frame):
+                last_key = None
+                if job.key_indexes:
+                    last_key = [batch.column(i)[batch.num_rows - 1].as_py()
+                                for i in job.key_indexes]
+                yield arrow_copy.leading_columns(batch, width), last_key
+    
+    def _fetch_pages(self, oracle_conn: OracleConnector, job: '_TableJob',
+                     chunk: Dict[str, Any]) -> Iterator[Tuple[List[tuple], Optional[list]]]:
+        """
+        Yield batches read as keyset pages: each page is a separate short query
+        for the batch_size rows following the previous page's last key, so no
+        cursor (and read-consistent snapshot) stays open for the whole table.
+        """
+        last_key = chunk['last_key']
+        while True:
+            query, params = self._select_query(oracle_conn, job, chunk, last_key)
+            query += ' FETCH FIRST :page_size ROWS ONLY'
+            page_size = self._batch_size(job)
+            params['page_size'] = page_size
+            
+            batch = self._fetch_page(oracle_conn, job, chunk, query, params)
+            chunk['estimated_round_trips'] += self._estimate_round_trips(job, len(batch))
+            if not batch:
+                break
+            last_key = self._last_key(job, batch)
+            yield self._convert_rows(job, batch), last_key
+            if len(batch) < page_size:
+                break
+    
+    def _fetch_page(self, oracle_conn: OracleConnector, job: '_TableJob',
+                    chunk: Dict[str, Any], query: str, params: Dict[str, Any]) -> List[tuple]:
+        """
+        Run one keyset page query, retrying it on failure. Each retry runs
+        on a new connection, since errors like ORA-03113 leave the old one
+        unusable.
+        """
+        for attempt in range(1, PAGE_RETRIES + 1):
+            try:
+                cursor = oracle_conn.extraction_cursor(job.arraysize, job.prefetchrows)
+                try:
+                    cursor.execute(query, params)
+                    return cursor.fetchall()
+                finally:
+                    cursor.close()
+            except Exception as e:
+                if attempt == PAGE_RETRIES:
+                    raise
+                delay = PAGE_RETRY_DELAY * 2 ** (attempt - 1)
+                logger.warning(f"Page query on {job.table_name} failed (attempt {attempt}/"
+                               f"{PAGE_RETRIES}), reconnecting and retrying in {delay:.0f}s: {e}")
+                time.sleep(delay)
+                try:
+                    oracle_conn.reconnect()
+                    chunk['reconnects'] += 1
+                except Exception as reconnect_error:
+                    logger.warning(f"Reconnecting for {job.table_name} failed: {reconnect_error}")
+    
+    def _fetch_sizes(self, table_name: str, default: int) -> Tuple[int, int]:
+        """
+        Resolve the extraction cursor's (arraysize, prefetchrows) for a table,
+        using default (the table's first batch size) for unset values.
+        """
+        sizes = self.table_fetch.get(table_name.upper(), {})
+        arraysize = sizes.get('arraysize') or self.oracle_conn.arraysize or default
+        prefetchrows = sizes.get('prefetchrows', self.oracle_conn.prefetchrows)
+        return arraysize, default if prefetchrows is None else prefetchrows
+    
+    def _batch_size(self, job: '_TableJob') -> int:
+        """Rows to fetch for the next batch of a table."""
+        return job.sizer.size if job.sizer else self.batch_size
+    
+    def _new_sizer(self, columns: List[Any]) -> AdaptiveBatchSizer:
+        """
+        Create the adaptive batch sizer of a table. The first batch is sized
+        from the declared column lengths (LOBs counted at lob_inline_limit),
+        so tables with wide rows start small enough to fit the byte budget.
+        """
+        row_bytes = sum(self.lob_inline_limit if col[1] in LOB_ORACLE_TYPES else (col[2] or 0)
+                        for col in columns)
+        initial = self.batch_size
+        if row_bytes > 0:
+            initial = min(initial, self.batch_target_bytes // row_bytes)
+        return AdaptiveBatchSizer(initial, self.min_batch_size, self.max_batch_size,
+                                  self.batch_target_bytes, self.batch_target_seconds)
+    
+    @staticmethod
+    def _estimate_round_trips(job: '_TableJob', rows: int) -> int:
+        """
+        Estimate the round trips of one query fetching rows: the execute
+        (which returns up to prefetchrows rows) plus one per arraysize rows.
+        Prefetching does not apply to queries returning LOB locators.
+        """
+        prefetched = 0 if job.lob_locators else job.prefetchrows
+        return 1 + -(-max(0, rows - prefetched) // job.arraysize)
+    
+    def _select_query(self, oracle_conn: OracleConnector, job: '_TableJob',
+                      chunk: Dict[str, Any], last_key: Optional[list]) -> Tuple[str, Dict[str, Any]]:
+        """Build the SELECT for a chunk, starting after last_key when given."""
+        schema = oracle_conn.schema
+        col_list = ', '.join(job.column_exprs + job.extra_select)
+        query = f'SELECT {col_list} FROM "{schema}"."{job.table_name}"'
+        if chunk['partition']:
+            query += f' PARTITION ("{chunk["partition"]}")'
+        
+        conditions = []
+        params = dict(chunk['params'] or {})
+        if chunk['where']:
+            conditions.append(f"({chunk['where']})")
+        if last_key is not None:
+            conditions.append(job.keyset_predicate())
+            params.update({f'k{i}': value for i, value in enumerate(last_key)})
+        if conditions:
+            query += ' WHERE ' + ' AND '.join(conditions)
+        if job.key_exprs:
+            query += ' ORDER BY ' + ', '.join(job.key_exprs)
+        return query, params
+        
+    @staticmethod
+    def _last_key(job: '_TableJob', batch: List[tuple]) -> Optional[list]:
+        """Ordering key values of the last row of a fetched batch."""
+        return [batch[-1][i] for i in job.key_indexes] if job.key_indexes else None
+    
+    def _convert_rows(self, job: '_TableJob', batch: List[tuple]) -> List[tuple]:
+        """
+        Convert fetched rows with the table's compiled converter and stream
+        large LOBs into their columns.
+        """
+        convert = job.convert_row
+        converted_batch = batch if convert is None else [convert(row) for row in batch]
+        if not job.lob_locators:
+            return converted_batch
+        
+        lob_counts = [0, 0, 0, 0]  # inline values/bytes, streamed values/bytes
+        for r, row in enumerate(batch):
+            values = None
+            for col_index, locator_index in job.lob_locators:
+                locator = row[locator_index]
+                if locator is not None:
+                    if values is None:
+                        values = list(converted_batch[r])
+                    value = OracleConnector.read_lob(locator, self.lob_chunk_size)
+                    values[col_index] = value
+                    lob_counts[2] += 1
+                    lob_counts[3] += len(value)
+                elif converted_batch[r][col_index] is not None:
+                    lob_counts[0] += 1
+                    lob_counts[1] += len(converted_batch[r][col_index])
+            if values is not None:
+                converted_batch[r] = tuple(values)
+        
+        job.add_lob_stats(*lob_counts)
+        return converted_batch
+    
+    def _write_batch(self, window: _CommitWindow, job: '_TableJob',
+                     chunk: Dict[str, Any], batch: List[tuple], last_key: Optional[list],
+                     progress: Callable[[int], Any]):
+        """
+        Load one batch, checkpoint it in the same transaction and report progress.
+        
+        If the batch fails because of its rows, it is loaded again in halves
+        down to the bad rows, which go to the table's dead-letter file; the
+        good rows are kept. Batches failing for other reasons are skipped;
+        with checkpoints on, that stops the chunk (see _stop_if_skipped).
+        """
+        pg_conn = window.pg_conn
+        processed = chunk['rows_loaded']
+        try:
+            window.begin()
+            started = time.perf_counter()
+            self._load_batch(pg_conn, job, batch)
+            if job.sizer:
+                job.sizer.record(len(batch), estimate_row_bytes(batch) * len(batch),
+                                 time.perf_counter() - started)
+            self._save_checkpoint(pg_conn, job, chunk, len(batch), last_key)
+            window.add(batch, loaded=len(batch))
+        except Exception as e:
+            chunk['rows_loaded'] = processed
+            window.undo()
+            if is_row_error(e):
+                logger.warning(f"Batch of {len(batch)} rows failed on {job.table_name}, "
+                               f"isolating the bad rows: {e}")
+                self._write_bisected(window, job, chunk, batch, last_key)
+            else:
+                logger.error(f"Error inserting batch into {job.table_name}: {e}")
+                window.skip(len(batch))
+        progress(len(batch))
+        self._stop_if_skipped(window, job, chunk)
+    
+    def _stop_if_skipped(self, window: _CommitWindow, job: '_TableJob', chunk: Dict[str, Any]):
+        """
+        Stop a checkpointed chunk once rows of it were skipped.
+        
+        Checkpoints are saved in the transaction of the batch they describe,
+        so the stored position never covers skipped rows that were rolled
+        back. Loading on would move it past them; instead the batches loaded
+        so far are committed and the chunk fails, and a resumed run extracts
+        again from its last committed key.
+        
+        Raises:
+            RuntimeError: If the chunk has skipped rows and checkpoints are on
+        """
+        if not self.checkpoints or not chunk['skipped']:
+            return
+        window.commit()
+        raise RuntimeError(f"{chunk['skipped']} rows of chunk {chunk['id']} of {job.table_name} "
+                           f"were not loaded; stopped at the last committed key so a resumed "
+                           f"run extracts them again")
+    
+    def _save_checkpoint(self, pg_conn: PostgreSQLConnector, job: '_TableJob',
+                         chunk: Dict[str, Any], rows: int, last_key: Optional[list]):
+        """Record rows processed up to last_key in the current transaction, if checkpointing."""
+        if self.checkpoints:
+            chunk['rows_loaded'] += rows
+            self.checkpoints.save(pg_conn, job.table_name, chunk['id'], last_key,
+                                  chunk['rows_loaded'])
+    
+    def _write_bisected(self, window: _CommitWindow, job: '_TableJob',
+                        chunk: Dict[str, Any], batch: List[tuple], last_key: Optional[list]):
+        """Load the good rows of a failed batch and dead-letter the bad ones."""
+        rows = batch if isinstance(batch, list) else arrow_copy.to_rows(batch)
+        processed = chunk['rows_loaded']
+        try:
+            window.begin()
+            rejects = self._bisect_batch(window.pg_conn, job, rows)
+            self._save_checkpoint(window.pg_conn, job, chunk, len(rows), last_key)
+            # Written before the commit: a failed commit may repeat, but never lose, rejects
+            self.dead_letters.write(job.table_name, job.column_names, rejects)
+            window.add(rows, loaded=len(rows) - len(rejects), rejected=len(rejects))
+        except Exception as e:
+            chunk['rows_loaded'] = processed
+            window.undo()
+            logger.error(f"Error isolating bad rows of batch in {job.table_name}: {e}")
+            window.skip(len(rows))
+    
+    def _bisect_batch(self, pg_conn: PostgreSQLConnector, job: '_TableJob',
+                      rows: List[tuple]) -> List[Tuple[tuple, str]]:
+        """
+        Load the rows of a failed batch in the current transaction, splitting
+        failing parts in half under a savepoint until single bad rows remain.
+        
+        Returns:
+            Tuples of (row, error message) of the rejected rows
+        
+        Raises:
+            Exception: If a part fails for a reason other than its rows
+        """
+        rejects = []
+        middle = len(rows) // 2
+        pending = [rows[middle:], rows[:middle]] if len(rows) > 1 else [rows]
+        while pending:
+            part = pending.pop()
+            pg_conn.savepoint(BISECT_SAVEPOINT)
+            try:
+                self._load_batch(pg_conn, job, part)
+            except Exception as e:
+                pg_conn.rollback_to_savepoint(BISECT_SAVEPOINT)
+                if not is_row_error(e):
+                    raise
+                if len(part) == 1:
+                    rejects.append((part[0], str(e).strip()))
+                else:
+                    middle = len(part) // 2
+                    pending.extend([part[middle:], part[:middle]])
+            pg_conn.release_savepoint(BISECT_SAVEPOINT)
+        return rejects
+    
+    def _transfer_pipelined(self, window: _CommitWindow, job: '_TableJob',
+                            chunk: Dict[str, Any], batches: Iterator[tuple],
+                            progress: Callable[[int], Any]):
+        """
+        Overlap fetching with loading: the current thread's cursor feeds a
+        bounded queue drained by pipeline_writers writer threads. The first
+        writer loads through window, additional writers open their own
+        connections, which are committed before they are closed.
+        
+        With checkpoints a single writer is used, so batches commit in key
+        order and the checkpoint is a true high-water mark.
+        """
+        writer_count = 1 if self.checkpoints else self.pipeline_writers
+        windows = [window]
+        lock = threading.Lock()
+        
+        def locked_progress(rows: int):
+            with lock:
+                progress(rows)
+        
+        try:
+            for _ in range(writer_count - 1):
+                conn = window.pg_conn.clone()
+                conn.connect()
+                windows.append(self._commit_window(conn, job, chunk))
+            
+            pipeline = BatchPipeline(writers=len(windows), queue_size=self.pipeline_queue_size)
+            stage_times = pipeline.run(
+                batches,
+                lambda writer_id, item: self._write_batch(windows[writer_id], job, chunk,
+                                                          item[0], item[1], locked_progress)
+            )
+            for writer_window in windows[1:]:
+                writer_window.commit()
+        finally:
+            for writer_window in windows[1:]:
+                writer_window.pg_conn.disconnect()
+        
+        job.add_stage_times(stage_times)
+    
+    def _plan_chunks(self, table_name: str, columns: List[Any]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Split a table into disjoint ranges for parallel extraction.
+        
+        Ranges are taken over chunk_column when set, over a single-column
+        numeric primary key when chunk_by is 'auto' or 'pk', and over ROWID
+        otherwise (cut from the table's extents, see
+        OracleConnector.get_rowid_ranges).
+        
+        Returns:
+            List of (where_clause, bind_params) tuples, empty if the table
+            cannot be split
+        """
+        column_info = {col[0]: col for col in columns}
+        range_column = self.chunk_column
+        
+        if not range_column and self.chunk_by in ('auto', 'pk'):
+            primary_keys = self.oracle_conn.get_primary_keys(table_name)
+            pk_info = column_info.get(primary_keys[0]) if len(primary_keys) == 1 else None
+            if pk_info and pk_info[1] in NUMERIC_ORACLE_TYPES:
+                range_column = primary_keys[0]
+            elif self.chunk_by == 'pk':
+                logger.warning(f"Table {table_name} has no single-column numeric primary key, "
+                               f"splitting by ROWID")
+        
+        if range_column:
+            col = column_info.get(range_column)
+            nullable = col is not None and col[5] == 'Y'
+            return self._plan_column_chunks(table_name, range_column, nullable)
+        
+        ranges = self.oracle_conn.get_rowid_ranges(table_name, self.parallel_chunks)
+        return [
+            ('ROWID BETWEEN CHARTOROWID(:lo) AND CHARTOROWID(:hi)', {'lo': lo, 'hi': hi})
+            for lo, hi in ranges
+        ]
+    
+    def _plan_column_chunks(self, table_name: str, column: str,
+                            nullable: bool) -> List[Tuple[str, Dict[str, Any]]]:
+        """Split the value range of a numeric column into equal-width chunks."""
+        low, high = self.oracle_conn.get_column_range(table_name, column)
+        if low is None:
+            return []
+        
+        n = self.parallel_chunks
+        if isinstance(low, int) and isinstance(high, int):
+            bounds = [low + (high - low) * i // n for i in range(n)]
+        else:
+            bounds = [low + (high - low) * i / n for i in range(n)]
+        bounds = sorted(set(bounds))
+        
+        chunks = []
+        for i, lo in enumerate(bounds):
+            if i + 1 < len(bounds):
+                chunks.append((f'"{column}" >= :lo AND "{column}" < :hi',
+                               {'lo': lo, 'hi': bounds[i + 1]}))
+            else:
+                chunks.append((f'"{column}" >= :lo', {'lo': lo}))
+        if nullable:
+            chunks.append((f'"{column}" IS NULL', {}))
+        return chunks
+    
+    def _new_chunk(self, chunk_id: int, where: Optional[str] = None,
+                   params: Optional[Dict[str, Any]] = None,
+                   partition: Optional[str] = None) -> Dict[str, Any]:
+        """Create the progress record for one chunk of a table."""
+        return {
+            'id': chunk_id,
+            'where': where,
+            'params': params,
+            'partition': partition,
+            'last_key': None,
+            'rows_loaded': 0,
+            # Rows neither loaded nor dead-lettered in this run
+            'skipped': 0,
+            'status': 'pending',
+        }
+    
+    def _new_chunks(self, table_name: str, columns: List[Any]) -> List[Dict[str, Any]]:
+        """Plan the chunks of a table and register them with the checkpoint store."""
+        partitions = self._plan_partitions(table_name) if self.partition_workers else []
+        if partitions:
+            chunks = [self._new_chunk(i, partition=partition) for i, partition in enumerate(partitions)]
+        else:
+            specs = self._plan_chunks(table_name, columns) if self.parallel_chunks > 1 else []
+            chunks = [self._new_chunk(i, where, params) for i, (where, params) in enumerate(specs)]
+        if not chunks:
+            chunks = [self._new_chunk(0)]
+        
+        if self.checkpoints:
+            self.checkpoints.register(self.pg_conn, table_name, [
+                [chunk['where'], chunk['params'], chunk['partition']]
+                if chunk['where'] or chunk['partition'] else None
+                for chunk in chunks
+            ])
+        return chunks
+    
+    def _plan_partitions(self, table_name: str) -> List[str]:
+        """
+        List the partitions of a table for per-partition extraction, largest
+        first so the longest transfers start early.
+        
+        Returns:
+            Partition names, empty if the table is not partitioned
+        """
+        partitions = self.oracle_conn.get_table_partitions(table_name)
+        partitions = sorted(partitions, key=lambda p: p[3] or 0, reverse=True)
+        return [partition[0] for partition in partitions]
+    
+    def _resume_chunks(self, table_name: str,
+                       checkpoints: Dict[int, Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Rebuild the chunks of a partially migrated table from its checkpoints."""
+        chunks = []
+        for chunk_id, state in sorted(checkpoints.items()):
+            spec = state['chunk_spec'] or [None, None]
+            # Specs written before partition chunks have no partition
+            chunk = self._new_chunk(chunk_id, spec[0], spec[1], spec[2] if len(spec) > 2 else None)
+            chunk.update(last_key=state['last_key'], rows_loaded=state['rows_loaded'],
+                         status=state['status'])
+            chunks.append(chunk)
+        
+        done = sum(1 for chunk in chunks if chunk['status'] == 'done')
+        loaded = sum(chunk['rows_loaded'] for chunk in chunks)
+        logger.info(f"Resuming {table_name}: {done}/{len(chunks)} chunks done, "
+                    f"{loaded} rows already loaded")
+        return chunks
+    
+    def _load_checkpoints(self, table_name: str) -> Dict[int, Dict[str, Any]]:
+        """
+        Load the checkpoints of a table when resuming; otherwise clear them so
+        the run starts over.
+        """
+        self.checkpoints.ensure_table(self.pg_conn)
+        if self.resume:
+            checkpoints = self.checkpoints.load(self.pg_conn, table_name)
+            if checkpoints:
+                return checkpoints
+        self.checkpoints.reset(self.pg_conn, table_name)
+        return {}
+    
+    def _plan_lobs(self, job: '_TableJob', columns: List[Any]):
+        """
+        Fetch LOBs up to lob_inline_limit inline (see
+        db_connector.inline_lob_handler) and select longer ones a second
+        time, as locators in a helper column.
+        """
+        limit = self.lob_inline_limit
+        for i, col in enumerate(columns):
+            if col[1] not in LOB_ORACLE_TYPES:
+                continue
+            name = col[0]
+            job.column_exprs[i] = (f'CASE WHEN DBMS_LOB.GETLENGTH("{name}") <= {limit} '
+                                   f'THEN "{name}" END AS "{name}"')
+            job.lob_locators.append((i, len(job.column_names) + len(job.extra_select)))
+            job.extra_select.append(f'CASE WHEN DBMS_LOB.GETLENGTH("{name}") > {limit} '
+                                    f'THEN "{name}" END AS "{name}{LOB_LOCATOR_SUFFIX}"')
+    
+    def _resolve_key(self, job: '_TableJob'):
+        """
+        Order extraction by the primary key, or by ROWID when there is none.
+        
+        Keyset pages need an indexed key, so tables without a primary key
+        fall back to a single cursor (ROWID ordered only for checkpoints).
+        """
+        primary_keys = self.oracle_conn.get_primary_keys(job.table_name)
+        if primary_keys and all(pk in job.column_names for pk in primary_keys):
+            job.key_exprs = [f'"{pk}"' for pk in primary_keys]
+            job.key_binds = [f':k{i}' for i in range(len(primary_keys))]
+            job.key_indexes = [job.column_names.index(pk) for pk in primary_keys]
+            job.paged = self.extraction == 'keyset'
+            return
+        
+        if self.extraction == 'keyset':
+            logger.info(f"No usable primary key on {job.table_name}, "
+                        f"extracting with a single cursor")
+        if self.checkpoints:
+            job.key_exprs = ['ROWID']
+            job.key_binds = ['CHARTOROWID(:k0)']
+            job.key_indexes = [len(job.column_names) + len(job.extra_select)]
+            job.extra_select.append('ROWIDTOCHAR(ROWID)')
+    
+    def _migrate_chunks(self, job: '_TableJob', chunks: List[Dict[str, Any]], pbar: tqdm):
+        """
+        Transfer each chunk on its own worker with its own connections, on
+        at most parallel_chunks workers (partition_workers for partition
+        chunks). ROWID ranges of a partitioned table can outnumber
+        parallel_chunks, since a range never spans two partitions.
+        """
+        table_name = job.table_name
+        if chunks[0]['partition']:
+            workers = min(len(chunks), self.partition_workers)
+            logger.info(f"Migrating {table_name} in {len(chunks)} partitions, "
+                        f"{workers} at a time")
+        else:
+            workers = min(len(chunks), self.parallel_chunks)
+            logger.info(f"Migrating {table_name} in {len(chunks)} parallel chunks, "
+                        f"{workers} at a time")
+        lock = threading.Lock()
+        
+        def progress(rows: int):
+            with lock:
+                pbar.update(rows)
+        
+        def run_chunk(chunk: Dict[str, Any]):
+            oracle_conn = self.oracle_conn.clone()
+            pg_conn = self.pg_conn.clone()
+            oracle_conn.connect()
+            try:
+                pg_conn.connect()
+                try:
+                    self._transfer(oracle_conn, pg_conn, job, chunk, progress)
+                finally:
+                    pg_conn.disconnect()
+            finally:
+                oracle_conn.disconnect()
+            logger.debug(f"Finished chunk {chunk['id']} of {table_name}")
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(run_chunk, chunk) for chunk in chunks]
+            # Re-raise the first chunk failure so the table is reported as failed
+            for future in futures:
+                future.result()
+    
+    def _resolve_copy_format(self, table_name: str, column_names: List[str]) -> tuple:
+        """
+        Pick the COPY format for a table.
+        
+        Returns:
+            Tuple of (format, column_types); format is None for the INSERT path
+        """
+        if self.load_method == 'insert':
+            return None, None
+        
+        if self.load_method == 'copy_binary':
+            type_map = self.pg_conn.get_column_types(table_name)
+            column_types = [type_map.get(col) for col in column_names]
+            if pg_copy.supports_binary(column_types):
+                return 'binary', column_types
+            unsupported = sorted({t for t in column_types if t not in pg_copy.BINARY_ENCODERS},
+                                 key=str)
+            logger.info(f"Binary COPY does not support column types {unsupported} "
+                        f"in {table_name}, using text COPY")
+        
+        return 'text', None
+    
+    def _plan_columnar(self, job: '_TableJob', columns: List[Any]):
+        """Use the columnar path for a table if it can handle every column."""
+        reason = None
+        if not arrow_copy.available():
+            reason = "pyarrow is not installed"
+        elif not hasattr(self.oracle_conn.connection, 'fetch_df_batches'):
+            reason = "python-oracledb 3.0 or later is required"
+        elif job.paged:
+            reason = "keyset extraction is enabled"
+        elif any(column_conversion(col[1]) for col in columns):
+            reason = "LOB, interval or time zone columns need row conversion"
+        elif any(col[1] == 'NUMBER' and col[3] is None for col in columns):
+            # Data frames hold NUMBER without a precision as float64
+            reason = "NUMBER columns without a precision have no exact columnar form"
+        else:
+            type_map = self.pg_conn.get_column_types(job.table_name)
+            column_types = [type_map.get(col) for col in job.column_names]
+            if not arrow_copy.supports(column_types):
+                unsupported = sorted({t for t in column_types
+                                      if not arrow_copy.supports([t])}, key=str)
+                reason = f"column types {unsupported} are not supported"
+        
+        if reason:
+            logger.info(f"Not using columnar transfer for {job.table_name}: {reason}")
+            return
+        job.columnar_types = column_types
+        logger.info(f"Using columnar transfer for {job.table_name}")
+    
+    def _load_batch(self, pg_conn: PostgreSQLConnector, job: '_TableJob', batch: List[tuple]):
+        """
+        Load one batch into PostgreSQL without committing.
+        
+        Arrow record batches are encoded column-wise into binary COPY, and
+        fall back to the row path if a column cannot be encoded. Binary COPY
+        falls back to text COPY, and text COPY falls back to INSERT, for
+        batches containing values the format cannot encode.
+        """
+        if job.columnar_types and not isinstance(batch, list):
+            try:
+                payload = arrow_copy.encode_record_batch(batch, job.columnar_types)
+                pg_conn.copy_payload(job.table_name, job.column_names, payload,
+                                     format='binary', commit=False)
+                return
+            except TypeError as e:
+                logger.debug(f"Columnar COPY cannot encode batch for {job.table_name}: {e}")
+                batch = arrow_copy.to_rows(batch)
+        
+        formats = []
+        if job.copy_format == 'binary':
+            formats = ['binary', 'text']
+        elif job.copy_format == 'text':
+            formats = ['text']
+        
+        for fmt in formats:
+            try:
+                pg_conn.copy_data(job.table_name, job.column_names, batch, format=fmt,
+                                  column_types=job.column_types, commit=False)
+                return
+            except TypeError as e:
+                logger.debug(f"{fmt} COPY cannot encode batch for {job.table_name}: {e}")
+        
+        pg_conn.insert_data(job.table_name, job.column_names, batch, commit=False)
+    
     def migrate_all_tables(self, table_filter: List[str] = None, 
                           truncate: bool = False) -> dict:
         """
@@ -124,9 +1283,26 @@ class DataMigrator:
             tables = self.oracle_conn.get_tables()
         
         logger.info(f"Migrating data for {len(tables)} tables...")
+        if self.row_counts == 'estimate':
+            self.load_row_estimates(tables)
         
-        for table_name in tables:
-            results[table_name] = self.migrate_table(table_name, truncate)
+        if self.workers > 1 and len(tables) > 1:
+            scheduler = TableScheduler(self.oracle_conn, self.pg_conn, self.workers)
+            ordered = scheduler.order_by_size(tables)
+            logger.info(f"Using {self.workers} workers, largest tables first")
+            
+            def migrate(oracle_conn, pg_conn, table_name):
+                return self._with_connections(oracle_conn, pg_conn).migrate_table(
+                    table_name, truncate)
+            
+            scheduled = scheduler.run(ordered, migrate)
+            results = {table_name: scheduled[table_name] for table_name in tables}
+        else:
+            for table_name in tables:
+                results[table_name] = self.migrate_table(table_name, truncate)
+        
+        for table_name in self.set_pending_logged():
+            results[table_name] = False
         
         successful = sum(1 for v in results.values() if v)
         logger.info(f"Data migration complete: {successful}/{len(tables)} tables successful")
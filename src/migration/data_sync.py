@@ -0,0 +1,272 @@
+"""
+Incremental re-synchronization of migrated tables by change-tracking column
+or ORA_ROWSCN.
+"""
+
+import copy
+import logging
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from .checkpoint import decode_key, encode_key
+from .db_connector import OracleConnector, PostgreSQLConnector
+from .row_converter import compile_row_converter, select_expression
+from .scheduler import TableScheduler
+
+logger = logging.getLogger(__name__)
+
+WATERMARK_TABLE = '_migration_watermarks'
+# Pseudo-column tracking changes when a table has no change-tracking column
+ROWSCN = 'ORA_ROWSCN'
+# Alias of the change marker appended to the select list
+SYNC_MARK_ALIAS = 'SYNC_MARK__'
+
+
+class WatermarkStore:
+    """
+    Stores the highest change marker synchronized per table, in a control
+    table in the target schema.
+    """
+    
+    def __init__(self, schema: str, table: str = WATERMARK_TABLE):
+        self.qualified_name = f'"{schema}"."{table}"'
+    
+    def ensure_table(self, pg_conn: PostgreSQLConnector):
+        """Create the control table if it does not exist."""
+        pg_conn.execute_command(f"""
+            CREATE TABLE IF NOT EXISTS {self.qualified_name} (
+                table_name TEXT PRIMARY KEY,
+                sync_column TEXT NOT NULL,
+                watermark TEXT,
+                rows_synced BIGINT NOT NULL DEFAULT 0,
+                updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+            )
+        """)
+    
+    def load(self, pg_conn: PostgreSQLConnector, table_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Load the watermark of a table.
+        
+        Returns:
+            Dict with 'sync_column' and 'watermark', or None if the table
+            was never synchronized
+        """
+        rows = pg_conn.execute_query(
+            f"SELECT sync_column, watermark FROM {self.qualified_name} WHERE table_name = %s",
+            (table_name,)
+        )
+        if not rows:
+            return None
+        watermark = decode_key(rows[0]['watermark'])
+        return {
+            'sync_column': rows[0]['sync_column'],
+            'watermark': watermark[0] if watermark else None,
+        }
+    
+    def save(self, pg_conn: PostgreSQLConnector, table_name: str, sync_column: str,
+             watermark: Any, rows_synced: int):
+        """Record the watermark of a table without committing."""
+        pg_conn.cursor.execute(
+            f"INSERT INTO {self.qualified_name} "
+            f"(table_name, sync_column, watermark, rows_synced, updated_at) "
+            f"VALUES (%s, %s, %s, %s, now()) "
+            f"ON CONFLICT (table_name) DO UPDATE SET "
+            f"sync_column = EXCLUDED.sync_column, watermark = EXCLUDED.watermark, "
+            f"rows_synced = EXCLUDED.rows_synced, updated_at = EXCLUDED.updated_at",
+            (table_name, sync_column,
+             encode_key([watermark]) if watermark is not None else None, rows_synced)
+        )
+
+
+class DataSynchronizer:
+    """
+    Re-synchronizes migrated tables with the rows changed in Oracle since the
+    previous sync.
+    
+    Changed rows are those whose change-tracking column (e.g. a last-modified
+    timestamp) or ORA_ROWSCN is above the table's stored watermark. They are
+    upserted into PostgreSQL by primary key in batches, and the new watermark
+    is stored once the table is done. Upserts are idempotent, so an
+    interrupted sync is simply run again. Deleted rows are not detected.
+    """
+    
+    def __init__(self, oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector,
+                 batch_size: int = 1000, sync_column: Optional[str] = None,
+                 sync_columns: Optional[Dict[str, str]] = None, since: Any = None,
+                 overlap_seconds: int = 60, workers: int = 1):
+        """
+        Args:
+            oracle_conn: Source connection
+            pg_conn: Target connection
+            batch_size: Rows fetched and upserted per batch
+            sync_column: Change-tracking column used for every table that
+                has it; other tables use ORA_ROWSCN
+            sync_columns: Per-table change-tracking columns, overriding
+                sync_column ('ORA_ROWSCN' selects the pseudo-column)
+            since: Watermark for tables never synchronized before (an SCN, or
+                an ISO timestamp for change-tracking columns), e.g. taken just
+                before the full load; without it their first sync copies
+                every row
+            overlap_seconds: Change-tracking timestamps are re-read this far
+                below the watermark, to catch rows committed after others
+                with a later timestamp
+            workers: Number of tables synchronized concurrently
+        """
+        self.oracle_conn = oracle_conn
+        self.pg_conn = pg_conn
+        self.batch_size = batch_size
+        self.sync_column = sync_column.upper() if sync_column else None
+        self.sync_columns = {table.upper(): column.upper()
+                             for table, column in (sync_columns or {}).items()}
+        self.since = since
+        self.overlap_seconds = overlap_seconds
+        self.workers = max(1, workers)
+        self.watermarks = WatermarkStore(pg_conn.schema)
+        # Rows upserted per table
+        self.synced_rows: Dict[str, int] = {}
+        self._watermarks_ready = False
+    
+    def _ensure_watermarks(self):
+        """Create the watermark table once, before any worker uses it."""
+        if not self._watermarks_ready:
+            self.watermarks.ensure_table(self.pg_conn)
+            self._watermarks_ready = True
+    
+    def _sync_column(self, table_name: str, column_names: List[str]) -> str:
+        """Choose the change marker of a table."""
+        column = self.sync_columns.get(table_name.upper())
+        if column:
+            return column
+        if self.sync_column and self.sync_column in column_names:
+            return self.sync_column
+        return ROWSCN
+    
+    def _initial_watermark(self, sync_column: str) -> Any:
+        """Convert the configured starting point to a watermark value."""
+        if self.since is None or self.since == '':
+            return None
+        if sync_column == ROWSCN:
+            return int(self.since)
+        if isinstance(self.since, datetime):
+            return self.since
+        return datetime.fromisoformat(str(self.since))
+    
+    def _select_query(self, table_name: str, columns: List[Any], sync_column: str,
+                      watermark: Any) -> tuple:
+        """Build the query for the rows changed above the watermark."""
+        marker = ROWSCN if sync_column == ROWSCN else f'"{sync_column}"'
+        select_list = ', '.join(select_expression(col[0], col[1]) for col in columns)
+        query = f'SELECT {select_list}, {marker} AS {SYNC_MARK_ALIAS} ' \
+                f'FROM "{self.oracle_conn.schema}"."{table_name}"'
+        params = {}
+        if watermark is not None:
+            if sync_column == ROWSCN:
+                query += f' WHERE {marker} > :watermark'
+            else:
+                query += f" WHERE {marker} > :watermark - NUMTODSINTERVAL(:overlap, 'SECOND')"
+                params['overlap'] = self.overlap_seconds
+            params['watermark'] = watermark
+        return query, params
+    
+    def sync_table(self, table_name: str) -> bool:
+        """
+        Upsert the rows of a table changed since its last sync.
+        
+        Args:
+            table_name: Name of the table to synchronize
+        
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            if not self.pg_conn.table_exists(table_name):
+                logger.error(f"Table {table_name} does not exist in PostgreSQL. Run schema migration first.")
+                return False
+            key_columns = self.oracle_conn.get_primary_keys(table_name)
+            if not key_columns:
+                logger.error(f"Table {table_name} has no primary key to match changed rows on, "
+                             f"skipping sync")
+                return False
+            
+            columns = self.oracle_conn.get_table_columns(table_name)
+            column_names = [col[0] for col in columns]
+            sync_column = self._sync_column(table_name, column_names)
+            
+            self._ensure_watermarks()
+            stored = self.watermarks.load(self.pg_conn, table_name)
+            if stored and stored['sync_column'] != sync_column:
+                logger.warning(f"Sync column of {table_name} changed from {stored['sync_column']} "
+                               f"to {sync_column}; starting over")
+                stored = None
+            watermark = stored['watermark'] if stored else self._initial_watermark(sync_column)
+            if watermark is None:
+                logger.warning(f"No watermark for {table_name} yet, syncing all rows")
+            else:
+                logger.info(f"Syncing {table_name} rows with {sync_column} above {watermark}")
+            
+            query, params = self._select_query(table_name, columns, sync_column, watermark)
+            convert = compile_row_converter([col[1] for col in columns], len(columns) + 1)
+            new_watermark = watermark
+            synced = 0
+            cursor = self.oracle_conn.extraction_cursor(self.batch_size, self.batch_size)
+            try:
+                cursor.execute(query, params)
+                while True:
+                    batch = cursor.fetchmany(self.batch_size)
+                    if not batch:
+                        break
+                    marks = [row[-1] for row in batch if row[-1] is not None]
+                    if marks:
+                        batch_max = max(marks)
+                        if new_watermark is None or batch_max > new_watermark:
+                            new_watermark = batch_max
+                    synced += self.pg_conn.upsert_data(
+                        table_name, column_names, key_columns, [convert(row) for row in batch]
+                    )
+            finally:
+                cursor.close()
+            
+            self.watermarks.save(self.pg_conn, table_name, sync_column, new_watermark, synced)
+            self.pg_conn.commit()
+            self.synced_rows[table_name] = synced
+            logger.info(f"Synced {synced} changed rows of {table_name} "
+                        f"(watermark {sync_column} = {new_watermark})")
+            return True
+        
+        except Exception as e:
+            logger.error(f"Error syncing table {table_name}: {e}")
+            self.pg_conn.rollback()
+            return False
+    
+    def sync_all_tables(self, table_filter: List[str] = None) -> Dict[str, bool]:
+        """
+        Synchronize all tables (or those in table_filter).
+        
+        Returns:
+            Dictionary mapping table names to success status
+        """
+        if table_filter:
+            tables = [t for t in self.oracle_conn.get_tables() if t in table_filter]
+        else:
+            tables = self.oracle_conn.get_tables()
+        
+        logger.info(f"Syncing changed rows of {len(tables)} tables...")
+        self._ensure_watermarks()
+        
+        if self.workers > 1 and len(tables) > 1:
+            scheduler = TableScheduler(self.oracle_conn, self.pg_conn, self.workers)
+            
+            def sync(oracle_conn, pg_conn, table_name):
+                synchronizer = copy.copy(self)
+                synchronizer.oracle_conn = oracle_conn
+                synchronizer.pg_conn = pg_conn
+                return synchronizer.sync_table(table_name)
+            
+            scheduled = scheduler.run(scheduler.order_by_size(tables), sync)
+            results = {table_name: scheduled[table_name] for table_name in tables}
+        else:
+            results = {table_name: self.sync_table(table_name) for table_name in tables}
+        
+        successful = sum(1 for v in results.values() if v)
+        logger.info(f"Data sync complete: {successful}/{len(tables)} tables successful, "
+                    f"{sum(self.synced_rows.values())} rows upserted")
+        return results
@@ -5,26 +5,125 @@ Database connection handlers for Oracle and PostgreSQL.
 import oracledb
 import psycopg2
 from psycopg2.extras import RealDictCursor
+import io
 import os
 from typing import Dict, Any, Optional
 import logging
 
+from . import pg_copy
+from .catalog import TableMetadata, in_list, table_filter_chunks
+
 logger = logging.getLogger(__name__)
 
+# Suffix of the select-list alias under which large LOBs are fetched as locators
+LOB_LOCATOR_SUFFIX = '__LOCATOR'
+
+# SQLSTATE classes of load errors caused by the rows themselves
+# (data exceptions and integrity constraint violations)
+ROW_ERROR_CLASSES = ('22', '23')
+
+# Highest row number in the upper ROWID of a block range
+MAX_ROWID_ROW = 32767
+# Views listing table extents and segments, tried in order (the USER_ views
+# for own tables only; Oracle has no ALL_ views of either)
+EXTENT_VIEWS = ('dba_extents', 'user_extents')
+SEGMENT_VIEWS = ('dba_segments', 'user_segments')
+
+_INLINE_LOB_TYPES = {
+    oracledb.DB_TYPE_CLOB: oracledb.DB_TYPE_LONG,
+    oracledb.DB_TYPE_NCLOB: oracledb.DB_TYPE_LONG_NVARCHAR,
+    oracledb.DB_TYPE_BLOB: oracledb.DB_TYPE_LONG_RAW,
+}
+
+
+def inline_lob_handler(cursor, metadata):
+    """
+    Output type handler fetching LOB columns as str/bytes within the fetch
+    round trip, except columns aliased with LOB_LOCATOR_SUFFIX, which stay
+    LOB locators so large values can be streamed.
+    """
+    fetch_type = _INLINE_LOB_TYPES.get(metadata.type_code)
+    if fetch_type is not None and not metadata.name.endswith(LOB_LOCATOR_SUFFIX):
+        return cursor.var(fetch_type, arraysize=cursor.arraysize)
+
+
+def is_row_error(error: Exception) -> bool:
+    """
+    Check whether a load error was caused by the rows being loaded (a bad
+    value or a constraint violation), rather than by the connection or the
+    statement, so loading the rows one at a time would isolate it.
+    """
+    if isinstance(error, (psycopg2.OperationalError, psycopg2.InterfaceError)):
+        return False
+    if isinstance(error, psycopg2.Error):
+        # Errors raised client-side (e.g. a value psycopg2 cannot adapt) have no SQLSTATE
+        return error.pgcode is None or error.pgcode[:2] in ROW_ERROR_CLASSES
+    return isinstance(error, (TypeError, ValueError))
+
+
+def split_extents(extents: list, chunks: int) -> list:
+    """
+    Split table extents into block ranges holding about the same number of blocks.
+    
+    A range may end inside an extent, but never spans two data objects
+    (partitions), since ROWIDs only order blocks within one object.
+    
+    Args:
+        extents: (data_object_id, relative_fno, block_id, blocks) rows,
+            ordered by object, file and block
+        chunks: Number of ranges wanted
+    
+    Returns:
+        List of (data_object_id, low_fno, low_block, high_fno, high_block)
+    """
+    total = sum(extent[3] for extent in extents)
+    target = max(1, -(-total // max(1, chunks)))
+    ranges = []
+    current = None
+    for object_id, fno, block, blocks in extents:
+        if current and current[0] != object_id:
+            ranges.append(tuple(current))
+            current = None
+        while blocks > 0:
+            if current is None:
+                current = [object_id, fno, block, fno, block]
+                filled = 0
+            take = min(blocks, target - filled)
+            current[3], current[4] = fno, block + take - 1
+            filled += take
+            block += take
+            blocks -= take
+            if filled >= target:
+                ranges.append(tuple(current))
+                current = None
+    if current:
+        ranges.append(tuple(current))
+    return ranges
+
 
 class OracleConnector:
     """Handles Oracle database connections and operations."""
     
     def __init__(self, host: str, port: int, service_name: str, 
-                 username: str, password: str, schema: Optional[str] = None):
+                 username: str, password: str, schema: Optional[str] = None,
+                 arraysize: Optional[int] = None, prefetchrows: Optional[int] = None):
         self.host = host
         self.port = port
         self.service_name = service_name
         self.username = username
         self.password = password
         self.schema = schema or username
+        # Fetch tuning of extraction cursors; None leaves it to the migrator
+        # (which defaults to its batch size)
+        self.arraysize = arraysize
+        self.prefetchrows = prefetchrows
+        # Optional pool manager (config_loader.ConnectionPools) to borrow from
+        self.pools = None
+        # Optional metadata_cache.MetadataCache consulted by load_catalog
+        self.metadata_cache = None
         self.connection = None
         self.cursor = None
+        self._session_stats_readable = True
     
     def connect(self):
         """Establish connection to Oracle database.
@@ -34,12 +133,15 @@ class OracleConnector:
         whether init_oracle_client() was called before this connection.
         """
         try:
-            dsn = oracledb.makedsn(self.host, self.port, service_name=self.service_name)
-            self.connection = oracledb.connect(
-                user=self.username,
-                password=self.password,
-                dsn=dsn
-            )
+            if self.pools is not None:
+                self.connection = self.pools.acquire_oracle(self)
+            else:
+                dsn = oracledb.makedsn(self.host, self.port, service_name=self.service_name)
+                self.connection = oracledb.connect(
+                    user=self.username,
+                    password=self.password,
+                    dsn=dsn
+                )
             self.cursor = self.connection.cursor()
             logger.info(f"Connected to Oracle database: {self.service_name}")
             return True
@@ -47,14 +149,44 @@ class OracleConnector:
             logger.error(f"Failed to connect to Oracle: {e}")
             raise
     
+    def clone(self) -> 'OracleConnector':
+        """Create an unconnected connector with the same settings."""
+        clone = OracleConnector(self.host, self.port, self.service_name,
+                                self.username, self.password, self.schema,
+                                self.arraysize, self.prefetchrows)
+        clone.pools = self.pools
+        clone.metadata_cache = self.metadata_cache
+        return clone
+    
+    @property
+    def cache_key(self) -> str:
+        """Key of this source schema in the metadata cache."""
+        return f'{self.host}_{self.port}_{self.service_name}_{self.schema.upper()}'
+    
     def disconnect(self):
-        """Close Oracle database connection."""
+        """Close Oracle database connection (a pooled one goes back to its pool)."""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.connection:
             self.connection.close()
+            self.connection = None
         logger.info("Disconnected from Oracle database")
     
+    def reconnect(self):
+        """
+        Replace the connection with a new one, e.g. after ORA-03113 or
+        ORA-03135 left it unusable (a pooled one is returned to its pool,
+        which drops it if it is dead).
+        """
+        try:
+            self.disconnect()
+        except Exception as e:
+            logger.debug(f"Error closing Oracle connection before reconnecting: {e}")
+        self.connection = None
+        self.cursor = None
+        self.connect()
+    
     def execute_query(self, query: str, params: Optional[Dict] = None):
         """Execute a query and return results."""
         if params:
@@ -63,6 +195,45 @@ class OracleConnector:
             self.cursor.execute(query)
         return self.cursor.fetchall()
     
+    def extraction_cursor(self, arraysize: int, prefetchrows: int):
+        """
+        Open a cursor for bulk extraction; the caller closes it.
+        
+        Args:
+            arraysize: Rows transferred per fetch round trip
+            prefetchrows: Rows returned with the execute round trip
+                (ignored by the driver for queries returning LOB locators)
+        """
+        cursor = self.connection.cursor()
+        cursor.arraysize = arraysize
+        cursor.prefetchrows = prefetchrows
+        cursor.outputtypehandler = inline_lob_handler
+        return cursor
+    
+    def round_trips(self) -> Optional[int]:
+        """
+        Get the number of SQL*Net round trips made by this session so far.
+        
+        Returns:
+            The v$mystat counter, or None if it cannot be read (e.g. without
+            SELECT privilege on v$mystat)
+        """
+        if not self._session_stats_readable:
+            return None
+        query = """
+            SELECT s.value
+            FROM v$mystat s
+            JOIN v$statname n ON n.statistic# = s.statistic#
+            WHERE n.name = 'SQL*Net roundtrips to/from client'
+        """
+        try:
+            result = self.execute_query(query)
+            return int(result[0][0]) if result else None
+        except Exception as e:
+            logger.warning(f"Cannot read round trips from v$mystat, estimating them instead: {e}")
+            self._session_stats_readable = False
+            return None
+    
     def get_tables(self) -> list:
         """Get list of all tables in the schema."""
         query = """
@@ -114,23 +285,37 @@ class OracleConnector:
         return [row[0] for row in results] if results else []
     
     def get_foreign_keys(self, table_name: str) -> list:
-        """Get foreign key constraints for a table."""
+        """
+        Get foreign key constraints for a table, with the referenced table
+        and delete rule resolved in the same query.
+        
+        Returns:
+            Rows of (constraint_name, column_name, r_owner, r_constraint_name,
+            ref_column, ref_table, delete_rule), ordered by constraint and
+            column position; ref_column is the referenced column at the
+            same position
+        """
         query = """
             SELECT 
                 a.constraint_name,
                 a.column_name,
                 c.r_owner,
                 c.r_constraint_name,
-                b.column_name as ref_column
+                b.column_name as ref_column,
+                r.table_name as ref_table,
+                c.delete_rule
             FROM all_cons_columns a
             JOIN all_constraints c ON a.owner = c.owner 
                 AND a.constraint_name = c.constraint_name
             JOIN all_cons_columns b ON c.r_owner = b.owner 
                 AND c.r_constraint_name = b.constraint_name
+                AND b.position = a.position
+            JOIN all_constraints r ON r.owner = c.r_owner
+                AND r.constraint_name = c.r_constraint_name
             WHERE a.owner = :schema
             AND a.table_name = :table_name
             AND c.constraint_type = 'R'
-            ORDER BY a.position
+            ORDER BY a.constraint_name, a.position
         """
         return self.execute_query(query, {
             'schema': self.schema.upper(),
@@ -157,11 +342,384 @@ class OracleConnector:
             'table_name': table_name.upper()
         })
     
+    def get_table_metadata(self, table_name: str) -> TableMetadata:
+        """Get the catalog model of one table with the per-table queries."""
+        return TableMetadata(
+            name=table_name,
+            columns=list(self.get_table_columns(table_name)),
+            primary_keys=self.get_primary_keys(table_name),
+            foreign_keys=[tuple(fk) for fk in self.get_foreign_keys(table_name)],
+            indexes=list(self.get_indexes(table_name)),
+        )
+    
+    def get_ddl_versions(self, tables: list = None) -> Dict[str, str]:
+        """
+        Get the DDL version of tables: the table's LAST_DDL_TIME, the latest
+        LAST_DDL_TIME of its indexes and its number of indexes.
+        
+        Args:
+            tables: Table names (if None, every table of the schema)
+        """
+        versions = {}
+        for chunk in table_filter_chunks(tables):
+            for row in self._catalog_query("""
+                SELECT o.object_name,
+                       TO_CHAR(o.last_ddl_time, 'YYYYMMDDHH24MISS'),
+                       TO_CHAR(MAX(io.last_ddl_time), 'YYYYMMDDHH24MISS'),
+                       COUNT(io.object_name)
+                FROM all_objects o
+                LEFT JOIN all_indexes i ON i.table_owner = o.owner
+                    AND i.table_name = o.object_name
+                LEFT JOIN all_objects io ON io.owner = i.owner
+                    AND io.object_name = i.index_name
+                    AND io.object_type = 'INDEX'
+                WHERE o.owner = :schema
+                AND o.object_type = 'TABLE' {filter}
+                GROUP BY o.object_name, o.last_ddl_time
+            """, 'o.object_name', chunk):
+                versions[row[0]] = f'{row[1]}|{row[2] or ""}|{row[3]}'
+        return versions
+    
+    def load_catalog(self, tables: list = None) -> Dict[str, TableMetadata]:
+        """
+        Load columns, primary keys, foreign keys and indexes of many tables
+        with one query per kind of information, instead of four queries per
+        table (and one per foreign key).
+        
+        With a metadata cache, only tables whose DDL changed since they were
+        cached (or that are not cached yet) are read from the dictionary.
+        
+        Args:
+            tables: Table names to load (if None, every table of the schema);
+                long lists are queried in chunks of 1000 names
+        
+        Returns:
+            Dictionary mapping table names to their TableMetadata
+        """
+        if self.metadata_cache is None:
+            return self._query_catalog(tables)
+        
+        versions = self.get_ddl_versions(tables)
+        catalog, stale = self.metadata_cache.get(self.cache_key, versions)
+        unchanged = len(catalog)
+        if stale:
+            # Without a filter, a cold cache is filled with the unfiltered queries
+            fetched = self._query_catalog(None if tables is None and not catalog else stale)
+            self.metadata_cache.put(self.cache_key, fetched, versions, complete=tables is None)
+            catalog.update((name, fetched[name]) for name in stale if name in fetched)
+        summary = self.metadata_cache.summary()
+        logger.info(f"Metadata cache: {unchanged} of {len(versions)} tables "
+                    f"unchanged ({summary['hits']} hits, {summary['misses']} misses this run)")
+        return catalog
+    
+    def _query_catalog(self, tables: list = None) -> Dict[str, TableMetadata]:
+        """Read the catalog model of tables from the data dictionary (see load_catalog)."""
+        catalog = {}
+        for chunk in table_filter_chunks(tables):
+            for row in self._catalog_query("""
+                SELECT c.table_name, c.column_name, c.data_type, c.data_length,
+                       c.data_precision, c.data_scale, c.nullable, c.data_default
+                FROM all_tab_columns c
+                JOIN all_tables t ON t.owner = c.owner AND t.table_name = c.table_name
+                WHERE c.owner = :schema {filter}
+                ORDER BY c.table_name, c.column_id
+            """, 'c.table_name', chunk):
+                catalog.setdefault(row[0], TableMetadata(row[0])).columns.append(tuple(row[1:]))
+            
+            for row in self._catalog_query("""
+                SELECT ac.table_name, acc.column_name
+                FROM all_constraints ac
+                JOIN all_cons_columns acc ON acc.owner = ac.owner
+                    AND acc.constraint_name = ac.constraint_name
+                WHERE ac.owner = :schema
+                AND ac.constraint_type = 'P' {filter}
+                ORDER BY ac.table_name, acc.position
+            """, 'ac.table_name', chunk):
+                if row[0] in catalog:
+                    catalog[row[0]].primary_keys.append(row[1])
+            
+            for row in self._catalog_query("""
+                SELECT c.table_name, c.constraint_name, a.column_name, c.r_owner,
+                       c.r_constraint_name, b.column_name, r.table_name, c.delete_rule
+                FROM all_constraints c
+                JOIN all_cons_columns a ON a.owner = c.owner
+                    AND a.constraint_name = c.constraint_name
+                JOIN all_cons_columns b ON b.owner = c.r_owner
+                    AND b.constraint_name = c.r_constraint_name
+                    AND b.position = a.position
+                JOIN all_constraints r ON r.owner = c.r_owner
+                    AND r.constraint_name = c.r_constraint_name
+                WHERE c.owner = :schema
+                AND c.constraint_type = 'R' {filter}
+                ORDER BY c.table_name, c.constraint_name, a.position
+            """, 'c.table_name', chunk):
+                if row[0] in catalog:
+                    catalog[row[0]].foreign_keys.append(tuple(row[1:]))
+            
+            for row in self._catalog_query("""
+                SELECT aic.table_name, aic.index_name, aic.column_name,
+                       aic.column_position, ai.uniqueness
+                FROM all_ind_columns aic
+                JOIN all_indexes ai ON aic.index_owner = ai.owner
+                    AND aic.index_name = ai.index_name
+                WHERE aic.table_owner = :schema {filter}
+                ORDER BY aic.table_name, aic.index_name, aic.column_position
+            """, 'aic.table_name', chunk):
+                if row[0] in catalog:
+                    catalog[row[0]].indexes.append(tuple(row[1:]))
+        return catalog
+    
+    def _catalog_query(self, query: str, table_column: str, tables: Optional[list]) -> list:
+        """Run a catalog query for the schema, restricted to tables if given."""
+        params = {'schema': self.schema.upper()}
+        condition = in_list(table_column, tables, params)
+        return self.execute_query(query.format(filter=condition), params)
+    
     def get_row_count(self, table_name: str) -> int:
         """Get total row count for a table."""
         query = f'SELECT COUNT(*) FROM "{self.schema}"."{table_name}"'
         result = self.execute_query(query)
         return result[0][0] if result else 0
+    
+    @staticmethod
+    def read_lob(lob, chunk_size: int = 1048576):
+        """
+        Read a LOB locator in pieces of chunk_size, bounding the size of each
+        round trip for very large values.
+        
+        Returns:
+            str for CLOB/NCLOB, bytes for BLOB
+        """
+        pieces = []
+        offset = 1
+        size = lob.size()
+        while offset <= size:
+            piece = lob.read(offset, chunk_size)
+            if not piece:
+                break
+            pieces.append(piece)
+            if isinstance(piece, str):
+                # CLOB offsets count UCS-2 code units, not Python characters
+                offset += len(piece.encode('utf-16-le')) // 2
+            else:
+                offset += len(piece)
+        if lob.type is oracledb.DB_TYPE_BLOB:
+            return b''.join(pieces)
+        return ''.join(pieces)
+
+    def get_table_stats(self, tables: list = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Get row count and size estimates of tables from optimizer statistics
+        and segment sizes, in one query instead of a COUNT(*) scan per table.
+        Segment sizes come from the first readable view of SEGMENT_VIEWS.
+        
+        Args:
+            tables: Table names (if None, every table of the schema)
+        
+        Returns:
+            Dictionary mapping table names to dicts with num_rows and
+            avg_row_len (None if the table has no statistics), bytes
+            (allocated segment size, else NUM_ROWS * AVG_ROW_LEN) and
+            last_analyzed
+        """
+        stats = {}
+        for chunk in table_filter_chunks(tables):
+            params = {'schema': self.schema.upper()}
+            condition = in_list('t.table_name', chunk, params)
+            segment_condition = in_list('segment_name', chunk, params)
+            results = None
+            for view in self._dictionary_views(SEGMENT_VIEWS):
+                owner = 'owner = :schema AND ' if view.startswith('dba_') else ''
+                try:
+                    results = self.execute_query(f"""
+                        SELECT t.table_name, t.num_rows, t.avg_row_len, s.bytes, t.last_analyzed
+                        FROM all_tables t
+                        LEFT JOIN (
+                            SELECT segment_name, SUM(bytes) AS bytes
+                            FROM {view}
+                            WHERE {owner}segment_type LIKE 'TABLE%' {segment_condition}
+                            GROUP BY segment_name
+                        ) s ON s.segment_name = t.table_name
+                        WHERE t.owner = :schema {condition}
+                    """, params)
+                    break
+                except oracledb.DatabaseError as e:
+                    logger.debug(f"Cannot read segment sizes from {view}: {e}")
+            if results is None:
+                logger.warning(f"Cannot read segment sizes from {' or '.join(SEGMENT_VIEWS)}, "
+                               f"using statistics only")
+                results = self.execute_query(f"""
+                    SELECT t.table_name, t.num_rows, t.avg_row_len, NULL, t.last_analyzed
+                    FROM all_tables t
+                    WHERE t.owner = :schema {condition}
+                """, params)
+            for table_name, num_rows, avg_row_len, segment_bytes, last_analyzed in results:
+                stats[table_name] = {
+                    'num_rows': int(num_rows) if num_rows is not None else None,
+                    'avg_row_len': int(avg_row_len) if avg_row_len is not None else None,
+                    'bytes': int(segment_bytes or (num_rows or 0) * (avg_row_len or 0)),
+                    'last_analyzed': last_analyzed,
+                }
+        return stats
+    
+    def get_table_sizes(self) -> Dict[str, int]:
+        """
+        Estimate the size in bytes of every table in the schema.
+        
+        Uses allocated segment sizes, falling back to optimizer statistics
+        (NUM_ROWS * AVG_ROW_LEN) for tables without a visible segment.
+        """
+        return {table_name: table['bytes'] for table_name, table in self.get_table_stats().items()}
+    
+    def get_column_range(self, table_name: str, column_name: str) -> tuple:
+        """Get the (min, max) values of a column."""
+        query = f'SELECT MIN("{column_name}"), MAX("{column_name}") ' \
+                f'FROM "{self.schema}"."{table_name}"'
+        result = self.execute_query(query)
+        return tuple(result[0]) if result else (None, None)
+    
+    def _dictionary_views(self, views: tuple) -> list:
+        """
+        Filter a tuple of DBA_/USER_ data dictionary views down to those
+        that can describe the source schema: USER_ views only list the
+        connected user's own objects.
+        """
+        own_schema = self.schema.upper() == self.username.upper()
+        return [view for view in views if own_schema or not view.startswith('user_')]
+    
+    def get_table_extents(self, table_name: str) -> list:
+        """
+        Get the extents of a table's segments (one per partition or
+        subpartition), from the first readable view of EXTENT_VIEWS.
+        
+        Returns:
+            (data_object_id, relative_fno, block_id, blocks) rows, ordered by
+            object, file and block; empty for tables without a segment of
+            their own (e.g. index-organized tables)
+        
+        Raises:
+            oracledb.DatabaseError: If no extent view can be read
+        """
+        error = None
+        for view in self._dictionary_views(EXTENT_VIEWS):
+            owner = 'e.owner = :schema AND ' if view.startswith('dba_') else ''
+            query = f"""
+                SELECT o.data_object_id, e.relative_fno, e.block_id, e.blocks
+                FROM {view} e
+                JOIN all_objects o ON o.owner = :schema
+                    AND o.object_name = e.segment_name
+                    AND o.object_type = e.segment_type
+                    AND NVL(o.subobject_name, '-') = NVL(e.partition_name, '-')
+                WHERE {owner}e.segment_name = :table_name
+                    AND e.segment_type IN ('TABLE', 'TABLE PARTITION', 'TABLE SUBPARTITION')
+                ORDER BY o.data_object_id, e.relative_fno, e.block_id
+            """
+            try:
+                return [tuple(row) for row in self.execute_query(query, {
+                    'schema': self.schema.upper(),
+                    'table_name': table_name.upper()
+                })]
+            except oracledb.DatabaseError as e:
+                error = e
+        raise error
+    
+    def get_rowid_ranges(self, table_name: str, chunks: int) -> list:
+        """
+        Split a table into contiguous ROWID ranges of roughly equal size.
+        
+        Ranges are cut from the table's extents, so no table data is read.
+        If no extent view is readable, they are taken from a scan of the
+        table's ROWIDs instead.
+        
+        Returns:
+            List of (low_rowid, high_rowid) string pairs, usable with
+            ROWID BETWEEN CHARTOROWID(:lo) AND CHARTOROWID(:hi); empty if
+            the table has no physical ROWIDs to split
+        """
+        try:
+            extents = self.get_table_extents(table_name)
+        except oracledb.DatabaseError as e:
+            logger.warning(f"Cannot read the extents of {table_name}, splitting it "
+                           f"with a ROWID scan: {e}")
+            return self._scan_rowid_ranges(table_name, chunks)
+        
+        ranges = split_extents(extents, chunks)
+        if not ranges:
+            return []
+        selects = []
+        params = {}
+        for i, (object_id, low_fno, low_block, high_fno, high_block) in enumerate(ranges):
+            selects.append(
+                f"SELECT {i} n, "
+                f"ROWIDTOCHAR(DBMS_ROWID.ROWID_CREATE(1, :o{i}, :lf{i}, :lb{i}, 0)) lo, "
+                f"ROWIDTOCHAR(DBMS_ROWID.ROWID_CREATE(1, :o{i}, :hf{i}, :hb{i}, "
+                f"{MAX_ROWID_ROW})) hi FROM dual"
+            )
+            params.update({f'o{i}': object_id, f'lf{i}': low_fno, f'lb{i}': low_block,
+                           f'hf{i}': high_fno, f'hb{i}': high_block})
+        query = f"SELECT lo, hi FROM ({' UNION ALL '.join(selects)}) ORDER BY n"
+        return [tuple(row) for row in self.execute_query(query, params)]
+    
+    def _scan_rowid_ranges(self, table_name: str, chunks: int) -> list:
+        """Split a table into ROWID ranges of equal row count by scanning and sorting its ROWIDs."""
+        query = f"""
+            SELECT ROWIDTOCHAR(MIN(rid)), ROWIDTOCHAR(MAX(rid))
+            FROM (
+                SELECT ROWID rid, NTILE(:chunks) OVER (ORDER BY ROWID) nt
+                FROM "{self.schema}"."{table_name}"
+            )
+            GROUP BY nt
+            ORDER BY nt
+        """
+        return [tuple(row) for row in self.execute_query(query, {'chunks': chunks})]
+
+    def get_partitioning(self, table_name: str) -> Optional[Dict[str, Any]]:
+        """
+        Get how a table is partitioned.
+        
+        Returns:
+            Dict with 'type' (RANGE, LIST, HASH, ...) and 'columns' (the
+            partition key columns, in order), or None if the table is not
+            partitioned
+        """
+        query = """
+            SELECT pt.partitioning_type, kc.column_name
+            FROM all_part_tables pt
+            JOIN all_part_key_columns kc ON kc.owner = pt.owner
+                AND kc.name = pt.table_name
+                AND kc.object_type = 'TABLE'
+            WHERE pt.owner = :schema AND pt.table_name = :table_name
+            ORDER BY kc.column_position
+        """
+        results = self.execute_query(query, {
+            'schema': self.schema.upper(),
+            'table_name': table_name.upper()
+        })
+        if not results:
+            return None
+        return {'type': results[0][0], 'columns': [row[1] for row in results]}
+    
+    def get_table_partitions(self, table_name: str) -> list:
+        """
+        Get the partitions of a table from ALL_TAB_PARTITIONS.
+        
+        Returns:
+            Rows of (partition_name, partition_position, high_value, num_rows)
+            in position order; empty if the table is not partitioned.
+            high_value is the bound expression text (e.g. a TO_DATE call)
+            and num_rows None for partitions without statistics
+        """
+        query = """
+            SELECT partition_name, partition_position, high_value, num_rows
+            FROM all_tab_partitions
+            WHERE table_owner = :schema AND table_name = :table_name
+            ORDER BY partition_position
+        """
+        results = self.execute_query(query, {
+            'schema': self.schema.upper(),
+            'table_name': table_name.upper()
+        })
+        return [tuple(row) for row in results] if results else []
 
 
 class PostgreSQLConnector:
@@ -175,19 +733,24 @@ class PostgreSQLConnector:
         self.username = username
         self.password = password
         self.schema = schema
+        # Optional pool manager (config_loader.ConnectionPools) to borrow from
+        self.pools = None
         self.connection = None
         self.cursor = None
     
     def connect(self):
         """Establish connection to PostgreSQL database."""
         try:
-            self.connection = psycopg2.connect(
-                host=self.host,
-                port=self.port,
-                database=self.database,
-                user=self.username,
-                password=self.password
-            )
+            if self.pools is not None:
+                self.connection = self.pools.acquire_postgresql(self)
+            else:
+                self.connection = psycopg2.connect(
+                    host=self.host,
+                    port=self.port,
+                    database=self.database,
+                    user=self.username,
+                    password=self.password
+                )
             self.cursor = self.connection.cursor(cursor_factory=RealDictCursor)
             # Ensure schema exists
             self.cursor.execute(f"CREATE SCHEMA IF NOT EXISTS {self.schema}")
@@ -198,12 +761,24 @@ class PostgreSQLConnector:
             logger.error(f"Failed to connect to PostgreSQL: {e}")
             raise
     
+    def clone(self) -> 'PostgreSQLConnector':
+        """Create an unconnected connector with the same settings."""
+        clone = PostgreSQLConnector(self.host, self.port, self.database,
+                                    self.username, self.password, self.schema)
+        clone.pools = self.pools
+        return clone
+    
     def disconnect(self):
-        """Close PostgreSQL database connection."""
+        """Close PostgreSQL database connection (a pooled one goes back to its pool)."""
         if self.cursor:
             self.cursor.close()
+            self.cursor = None
         if self.connection:
-            self.connection.close()
+            if self.pools is not None:
+                self.pools.release_postgresql(self.connection)
+            else:
+                self.connection.close()
+            self.connection = None
         logger.info("Disconnected from PostgreSQL database")
     
     def execute_query(self, query: str, params: Optional[tuple] = None):
@@ -222,23 +797,111 @@ class PostgreSQLConnector:
             self.cursor.execute(command)
         self.connection.commit()
     
-    def create_table(self, table_name: str, columns: list, primary_keys: list = None):
-        """Create a table in PostgreSQL."""
-        schema = self.schema
+    def create_table_statement(self, table_name: str, columns: list, primary_keys: list = None,
+                               unlogged: bool = False, partition_by: str = None) -> str:
+        """
+        Build the CREATE TABLE statement of a table.
+        
+        Args:
+            table_name: Name of the table
+            columns: Column definitions
+            primary_keys: Optional primary key column names
+            unlogged: If True, create the table UNLOGGED
+            partition_by: Optional partitioning, e.g. 'RANGE ("SALE_DATE")',
+                making this a partitioned table (see create_partition_statement)
+        
+        Returns:
+            The statement, without a terminating semicolon
+        """
         column_defs = ', '.join(columns)
+        table_kind = 'UNLOGGED TABLE' if unlogged else 'TABLE'
         
-        query = f'CREATE TABLE IF NOT EXISTS "{schema}"."{table_name}" ({column_defs}'
+        query = f'CREATE {table_kind} IF NOT EXISTS "{self.schema}"."{table_name}" ({column_defs}'
         
         if primary_keys:
             pk_cols = ', '.join([f'"{pk}"' for pk in primary_keys])
             query += f', PRIMARY KEY ({pk_cols})'
         
         query += ')'
+        if partition_by:
+            query += f' PARTITION BY {partition_by}'
+        return query
+    
+    def create_partition_statement(self, table_name: str, partition_name: str, bound: str) -> str:
+        """
+        Build the CREATE TABLE statement of one partition of a partitioned table.
+        
+        Args:
+            table_name: Partitioned table
+            partition_name: Source partition name; the partition is created
+                as table_name_partition_name
+            bound: Partition bound, e.g. "FOR VALUES IN ('EU')" or 'DEFAULT'
+        """
+        partition_table = f'{table_name}_{partition_name}'[:63]
+        return f'CREATE TABLE IF NOT EXISTS "{self.schema}"."{partition_table}" ' \
+               f'PARTITION OF "{self.schema}"."{table_name}" {bound}'
+    
+    def create_table(self, table_name: str, columns: list, primary_keys: list = None,
+                     unlogged: bool = False, partition_by: str = None):
+        """
+        Create a table in PostgreSQL.
         
-        self.execute_command(query)
-        logger.info(f"Created table: {schema}.{table_name}")
+        Args:
+            table_name: Name of the table
+            columns: Column definitions
+            primary_keys: Optional primary key column names
+            unlogged: If True, create the table UNLOGGED (no WAL is written
+                for its rows until it is switched with set_logged)
+            partition_by: Optional partitioning of the table
+        """
+        self.execute_command(self.create_table_statement(table_name, columns, primary_keys,
+                                                         unlogged, partition_by))
+        logger.info(f"Created {'unlogged ' if unlogged else ''}"
+                    f"{'partitioned ' if partition_by else ''}table: {self.schema}.{table_name}")
+    
+    def is_unlogged(self, table_name: str) -> bool:
+        """Check if a table is UNLOGGED."""
+        query = """
+            SELECT c.relpersistence = 'u' AS unlogged
+            FROM pg_catalog.pg_class c
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            WHERE n.nspname = %s AND c.relname = %s AND c.relkind = 'r'
+        """
+        result = self.execute_query(query, (self.schema, table_name))
+        return bool(result[0]['unlogged']) if result else False
+    
+    def set_logged(self, table_name: str):
+        """Switch an UNLOGGED table to a regular, WAL-logged table."""
+        self.execute_command(f'ALTER TABLE "{self.schema}"."{table_name}" SET LOGGED')
+        logger.info(f"Set table logged: {self.schema}.{table_name}")
+    
+    def get_row_count(self, table_name: str) -> int:
+        """Get total row count for a table."""
+        query = f'SELECT COUNT(*) AS count FROM "{self.schema}"."{table_name}"'
+        result = self.execute_query(query)
+        return result[0]['count'] if result else 0
+    
+    def commit(self):
+        """Commit the current transaction."""
+        self.connection.commit()
+    
+    def rollback(self):
+        """Roll back the current transaction."""
+        self.connection.rollback()
+    
+    def savepoint(self, name: str):
+        """Set a savepoint in the current transaction."""
+        self.cursor.execute(f'SAVEPOINT {name}')
     
-    def insert_data(self, table_name: str, columns: list, data: list):
+    def rollback_to_savepoint(self, name: str):
+        """Undo the work done since a savepoint, keeping the transaction open."""
+        self.cursor.execute(f'ROLLBACK TO SAVEPOINT {name}')
+    
+    def release_savepoint(self, name: str):
+        """Release a savepoint, keeping the work done since it."""
+        self.cursor.execute(f'RELEASE SAVEPOINT {name}')
+    
+    def insert_data(self, table_name: str, columns: list, data: list, commit: bool = True):
         """Insert data into a table using batch insert."""
         schema = self.schema
         col_names = ', '.join([f'"{col}"' for col in columns])
@@ -247,7 +910,96 @@ class PostgreSQLConnector:
         query = f'INSERT INTO "{schema}"."{table_name}" ({col_names}) VALUES ({placeholders})'
         
         self.cursor.executemany(query, data)
-        self.connection.commit()
+        if commit:
+            self.connection.commit()
+    
+    def copy_data(self, table_name: str, columns: list, data: list,
+                  format: str = 'text', column_types: list = None, commit: bool = True):
+        """
+        Load data into a table using COPY FROM STDIN.
+        
+        Args:
+            table_name: Target table name
+            columns: Target column names, in row order
+            data: Rows to load
+            format: 'text' or 'binary'
+            column_types: pg_type names of the columns (required for binary)
+            commit: If False, leave the transaction open for the caller
+        
+        Raises:
+            TypeError: If a value cannot be encoded in the requested format.
+                Nothing is sent to the server in that case, so the caller can
+                fall back to insert_data.
+        """
+        if format == 'binary':
+            payload = pg_copy.encode_binary_rows(data, column_types)
+        else:
+            payload = pg_copy.encode_text_rows(data)
+        self.copy_payload(table_name, columns, payload, format=format, commit=commit)
+        
+    def copy_payload(self, table_name: str, columns: list, payload: bytes,
+                     format: str = 'binary', commit: bool = True):
+        """Send already encoded COPY data (see pg_copy and arrow_copy)."""
+        query = pg_copy.copy_statement(self.schema, table_name, columns, format)
+        self.cursor.copy_expert(query, io.BytesIO(payload))
+        if commit:
+            self.connection.commit()
+    
+    def upsert_data(self, table_name: str, columns: list, key_columns: list, data: list,
+                    commit: bool = True) -> int:
+        """
+        Insert rows, updating the rows that already exist with the same key.
+        
+        The rows are copied (COPY text format) into a temporary staging table
+        kept for the session and merged with INSERT ... ON CONFLICT.
+        
+        Args:
+            table_name: Target table name
+            columns: Target column names, in row order
+            key_columns: Columns of the primary key the rows are matched on
+            data: Rows to load (unique keys)
+            commit: If False, leave the transaction open for the caller
+        
+        Returns:
+            Number of rows inserted or updated
+        """
+        schema = self.schema
+        staging = f'_sync_{table_name}'[:63]
+        self.cursor.execute(
+            f'CREATE TEMP TABLE IF NOT EXISTS "{staging}" (LIKE "{schema}"."{table_name}")'
+        )
+        self.cursor.copy_expert(pg_copy.copy_statement('pg_temp', staging, columns),
+                                io.BytesIO(pg_copy.encode_text_rows(data)))
+        
+        col_names = ', '.join([f'"{col}"' for col in columns])
+        key_names = ', '.join([f'"{col}"' for col in key_columns])
+        updates = ', '.join([f'"{col}" = EXCLUDED."{col}"'
+                             for col in columns if col not in key_columns])
+        self.cursor.execute(
+            f'INSERT INTO "{schema}"."{table_name}" ({col_names}) '
+            f'SELECT {col_names} FROM pg_temp."{staging}" '
+            f'ON CONFLICT ({key_names}) ' + (f'DO UPDATE SET {updates}' if updates else 'DO NOTHING')
+        )
+        upserted = self.cursor.rowcount
+        self.cursor.execute(f'TRUNCATE pg_temp."{staging}"')
+        if commit:
+            self.connection.commit()
+        return upserted
+    
+    def get_column_types(self, table_name: str) -> Dict[str, str]:
+        """Get the pg_type name of each column in a table."""
+        query = """
+            SELECT a.attname, t.typname
+            FROM pg_catalog.pg_attribute a
+            JOIN pg_catalog.pg_class c ON c.oid = a.attrelid
+            JOIN pg_catalog.pg_namespace n ON n.oid = c.relnamespace
+            JOIN pg_catalog.pg_type t ON t.oid = a.atttypid
+            WHERE n.nspname = %s AND c.relname = %s
+            AND a.attnum > 0 AND NOT a.attisdropped
+            ORDER BY a.attnum
+        """
+        results = self.execute_query(query, (self.schema, table_name))
+        return {row['attname']: row['typname'] for row in results}
     
     def table_exists(self, table_name: str) -> bool:
         """Check if a table exists."""
@@ -0,0 +1,70 @@
+"""
+Dead-letter files for rows rejected during data migration.
+"""
+
+import json
+import logging
+import os
+import threading
+from datetime import datetime, timezone
+from typing import List, Tuple
+from .checkpoint import json_values
+
+logger = logging.getLogger(__name__)
+
+DEAD_LETTER_SUFFIX = '.rejects.jsonl'
+
+
+class DeadLetterWriter:
+    """
+    Appends rejected rows to one JSONL file per table.
+    
+    Each line holds the table name, the row as a column-to-value mapping
+    (datetimes, dates, decimals and bytes encoded as by the checkpoint
+    keys), the database error and the time of the rejection. Files are only
+    created once a table has rejected rows.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._lock = threading.Lock()
+    
+    def path(self, table_name: str) -> str:
+        """Get the dead-letter file of a table."""
+        return os.path.join(self.directory, f'{table_name}{DEAD_LETTER_SUFFIX}')
+    
+    def reset(self, table_name: str):
+        """Remove the dead-letter file left for a table by a previous run."""
+        with self._lock:
+            if os.path.exists(self.path(table_name)):
+                os.remove(self.path(table_name))
+    
+    def write(self, table_name: str, column_names: List[str],
+              rejects: List[Tuple[tuple, str]]):
+        """
+        Append rejected rows to a table's dead-letter file.
+        
+        Args:
+            table_name: Table the rows were loaded into
+            column_names: Names of the row values, in order
+            rejects: Tuples of (row, error message)
+        """
+        if not rejects:
+            return
+        rejected_at = datetime.now(timezone.utc).isoformat()
+        lines = []
+        for row, error in rejects:
+            record = {
+                'table': table_name,
+                'row': dict(zip(column_names, json_values(list(row)))),
+                'error': error,
+                'rejected_at': rejected_at,
+            }
+            lines.append(json.dumps(record, default=str) + '\n')
+        
+        with self._lock:
+            os.makedirs(self.directory, exist_ok=True)
+            with open(self.path(table_name), 'a', encoding='utf-8') as f:
+                f.writelines(lines)
+        logger.warning(f"Wrote {len(rejects)} rejected rows of {table_name} to "
+                       f"{self.path(table_name)}")
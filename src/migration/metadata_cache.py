@@ -0,0 +1,136 @@
+"""
+On-disk cache of Oracle table metadata, invalidated by DDL times.
+"""
+
+import json
+import logging
+import os
+import re
+import threading
+import time
+from typing import Dict, List, Tuple
+from .catalog import TableMetadata
+
+logger = logging.getLogger(__name__)
+
+CACHE_SUFFIX = '.metadata.json'
+# Version of the cached row shapes; files of another version are ignored
+CACHE_FORMAT = 2
+# Entries fetched before this time are ignored in refresh mode
+PROCESS_STARTED = time.time()
+
+
+class MetadataCache:
+    """
+    Keeps the catalog model of each table in one JSON file per source schema.
+    
+    Every entry is stored with the DDL version of its table (the table's
+    ALL_OBJECTS.LAST_DDL_TIME, with the latest DDL time and the number of its
+    indexes), so an entry is reused only while the table's DDL is unchanged.
+    Hit and miss counts are kept for reporting. Safe to share between threads.
+    """
+    
+    def __init__(self, directory: str, refresh: bool = False):
+        """
+        Args:
+            directory: Directory of the cache files
+            refresh: Ignore entries written before this process started, so
+                every table is read from Oracle once (and cached again)
+        """
+        self.directory = directory
+        self.not_before = PROCESS_STARTED if refresh else 0
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+    
+    def path(self, key: str) -> str:
+        """Get the cache file of a source schema."""
+        return os.path.join(self.directory, re.sub(r'[^\w.-]', '_', key) + CACHE_SUFFIX)
+    
+    def _read(self, key: str) -> Dict[str, dict]:
+        try:
+            with open(self.path(key), encoding='utf-8') as f:
+                content = json.load(f)
+            if content.get('format') != CACHE_FORMAT:
+                return {}
+            return content.get('tables', {})
+        except FileNotFoundError:
+            return {}
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable metadata cache {self.path(key)}: {e}")
+            return {}
+    
+    def get(self, key: str, versions: Dict[str, str]) -> Tuple[Dict[str, TableMetadata], List[str]]:
+        """
+        Look up tables in the cache.
+        
+        Args:
+            key: Source schema key (see OracleConnector.cache_key)
+            versions: Current DDL version of each table to look up
+        
+        Returns:
+            Tuple of (cached metadata by table name, names of tables missing
+            from the cache or whose DDL changed)
+        """
+        with self._lock:
+            entries = self._read(key)
+        cached = {}
+        stale = []
+        for table_name, version in versions.items():
+            entry = entries.get(table_name)
+            if entry and entry['version'] == version and entry['fetched_at'] >= self.not_before:
+                cached[table_name] = TableMetadata(
+                    name=table_name,
+                    columns=[tuple(row) for row in entry['columns']],
+                    primary_keys=entry['primary_keys'],
+                    foreign_keys=[tuple(row) for row in entry['foreign_keys']],
+                    indexes=[tuple(row) for row in entry['indexes']],
+                )
+            else:
+                stale.append(table_name)
+        with self._lock:
+            self.hits += len(cached)
+            self.misses += len(stale)
+        return cached, stale
+    
+    def put(self, key: str, catalog: Dict[str, TableMetadata], versions: Dict[str, str],
+            complete: bool = False):
+        """
+        Store freshly read tables in the cache.
+        
+        Args:
+            key: Source schema key
+            catalog: Metadata read from Oracle
+            versions: DDL versions the metadata was read at
+            complete: versions lists every table of the schema, so entries of
+                other (dropped or renamed) tables are removed
+        """
+        fetched_at = time.time()
+        with self._lock:
+            entries = self._read(key)
+            if complete:
+                entries = {name: entry for name, entry in entries.items() if name in versions}
+            for table_name, metadata in catalog.items():
+                if table_name not in versions:
+                    continue
+                entries[table_name] = {
+                    'version': versions[table_name],
+                    'fetched_at': fetched_at,
+                    'columns': metadata.columns,
+                    'primary_keys': metadata.primary_keys,
+                    'foreign_keys': metadata.foreign_keys,
+                    'indexes': metadata.indexes,
+                }
+            try:
+                os.makedirs(self.directory, exist_ok=True)
+                temp_path = f'{self.path(key)}.{os.getpid()}.tmp'
+                with open(temp_path, 'w', encoding='utf-8') as f:
+                    json.dump({'format': CACHE_FORMAT, 'tables': entries}, f, default=str)
+                os.replace(temp_path, self.path(key))
+            except Exception as e:
+                logger.warning(f"Could not write metadata cache {self.path(key)}: {e}")
+    
+    def summary(self) -> Dict[str, int]:
+        """Cache hits and misses so far."""
+        return {'hits': self.hits, 'misses': self.misses}
+
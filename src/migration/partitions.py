@@ -0,0 +1,90 @@
+"""
+Conversion of Oracle table partitioning to PostgreSQL declarative partitioning.
+"""
+
+import re
+from typing import Any, List, Tuple
+
+# Oracle partitioning methods with a PostgreSQL equivalent (composite
+# partitioning is created with its top level only)
+PARTITION_METHODS = ('RANGE', 'LIST', 'HASH')
+
+_DATE_BOUND = re.compile(r"^TO_DATE\(\s*'\s*([^']*)'", re.IGNORECASE)
+_TIMESTAMP_BOUND = re.compile(r"^TIMESTAMP\s*'\s*([^']*)'$", re.IGNORECASE)
+_NUMBER_BOUND = re.compile(r'^[-+]?\d+(\.\d+)?([eE][-+]?\d+)?$')
+_KEYWORD_BOUNDS = ('MAXVALUE', 'NULL', 'DEFAULT')
+
+
+def split_high_value(high_value: str) -> List[str]:
+    """Split an ALL_TAB_PARTITIONS.HIGH_VALUE list at its top-level commas."""
+    values = []
+    depth = 0
+    quoted = False
+    start = 0
+    for i, char in enumerate(high_value):
+        if char == "'":
+            quoted = not quoted
+        elif not quoted and char == '(':
+            depth += 1
+        elif not quoted and char == ')':
+            depth -= 1
+        elif not quoted and not depth and char == ',':
+            values.append(high_value[start:i].strip())
+            start = i + 1
+    values.append(high_value[start:].strip())
+    return values
+
+
+def bound_literal(value: str) -> str:
+    """
+    Convert one Oracle partition bound expression to a PostgreSQL literal.
+    
+    Raises:
+        ValueError: If the expression is not a number, string, date or
+            timestamp literal, MAXVALUE, NULL or DEFAULT
+    """
+    value = value.strip()
+    if value.upper() in _KEYWORD_BOUNDS:
+        return value.upper()
+    if _NUMBER_BOUND.match(value):
+        return value
+    match = _DATE_BOUND.match(value) or _TIMESTAMP_BOUND.match(value)
+    if match:
+        return f"'{match.group(1).strip()}'"
+    if len(value) > 1 and value.startswith("'") and value.endswith("'"):
+        return value
+    raise ValueError(f"Unsupported partition bound: {value}")
+
+
+def partition_bounds(method: str, key_count: int,
+                     partitions: List[Tuple[Any, ...]]) -> List[Tuple[str, str]]:
+    """
+    Build the PostgreSQL bound of each Oracle partition.
+    
+    Args:
+        method: Oracle partitioning type (one of PARTITION_METHODS)
+        key_count: Number of partition key columns
+        partitions: OracleConnector.get_table_partitions rows, in position order
+    
+    Returns:
+        Tuples of (partition name, bound clause for CREATE TABLE ... PARTITION OF)
+    """
+    bounds = []
+    if method == 'HASH':
+        for i, partition in enumerate(partitions):
+            bounds.append((partition[0], f'FOR VALUES WITH (MODULUS {len(partitions)}, '
+                                         f'REMAINDER {i})'))
+        return bounds
+    
+    lower = ', '.join(['MINVALUE'] * key_count)
+    for partition in partitions:
+        values = [bound_literal(value) for value in split_high_value(partition[2])]
+        if method == 'RANGE':
+            upper = ', '.join(values)
+            bounds.append((partition[0], f'FOR VALUES FROM ({lower}) TO ({upper})'))
+            lower = upper
+        elif values == ['DEFAULT']:
+            bounds.append((partition[0], 'DEFAULT'))
+        else:
+            bounds.append((partition[0], f"FOR VALUES IN ({', '.join(values)})"))
+    return bounds
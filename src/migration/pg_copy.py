@@ -0,0 +1,239 @@
+"""
+Encoders for PostgreSQL COPY FROM STDIN in text and binary formats.
+"""
+
+import io
+import struct
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal
+from typing import List
+
+# Binary COPY file header: signature, flags field, header extension length
+BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+BINARY_TRAILER = struct.pack('!h', -1)
+
+PG_EPOCH_DATE = date(2000, 1, 1)
+PG_EPOCH = datetime(2000, 1, 1)
+PG_EPOCH_TZ = datetime(2000, 1, 1, tzinfo=timezone.utc)
+
+_TEXT_ESCAPES = str.maketrans({
+    '\\': '\\\\',
+    '\n': '\\n',
+    '\r': '\\r',
+    '\t': '\\t',
+})
+
+
+def encode_text_value(value) -> str:
+    """
+    Encode a Python value as a field of a COPY text-format row.
+    
+    Raises:
+        TypeError: If the value has no COPY text representation
+    """
+    if value is None:
+        return '\\N'
+    if isinstance(value, str):
+        return value.translate(_TEXT_ESCAPES)
+    if isinstance(value, bool):
+        return 't' if value else 'f'
+    if isinstance(value, (int, float, Decimal)):
+        return str(value)
+    if isinstance(value, (datetime, date, time)):
+        return value.isoformat()
+    if isinstance(value, timedelta):
+        return f'{value.days} days {value.seconds} seconds {value.microseconds} microseconds'
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        # bytea hex format, with the backslash escaped for COPY
+        return '\\\\x' + bytes(value).hex()
+    raise TypeError(f"Cannot encode {type(value).__name__} for COPY text format")
+
+
+def encode_text_rows(rows: List[tuple]) -> bytes:
+    """Encode a batch of rows as COPY text-format data."""
+    lines = [
+        '\t'.join([encode_text_value(value) for value in row])
+        for row in rows
+    ]
+    lines.append('')
+    return '\n'.join(lines).encode('utf-8')
+
+
+def _encode_numeric(value) -> bytes:
+    """Encode a number in PostgreSQL's binary NUMERIC representation."""
+    if isinstance(value, float):
+        value = Decimal(repr(value))
+    elif not isinstance(value, Decimal):
+        value = Decimal(value)
+    
+    if value.is_nan():
+        return struct.pack('!hhHh', 0, 0, 0xC000, 0)
+    if value.is_infinite():
+        raise TypeError("Cannot encode infinite NUMERIC for COPY binary format")
+    
+    sign, digits, exponent = value.as_tuple()
+    dscale = max(0, -exponent)
+    digit_str = ''.join(str(d) for d in digits)
+    
+    # Split into integer and fractional decimal digits
+    if exponent >= 0:
+        int_part = digit_str + '0' * exponent
+        frac_part = ''
+    elif len(digit_str) > -exponent:
+        int_part = digit_str[:exponent]
+        frac_part = digit_str[exponent:]
+    else:
+        int_part = ''
+        frac_part = digit_str.rjust(-exponent, '0')
+    
+    # Group into base-10000 digits aligned on the decimal point
+    int_part = int_part.lstrip('0')
+    int_part = '0' * (-len(int_part) % 4) + int_part
+    frac_part = frac_part + '0' * (-len(frac_part) % 4)
+    groups = [int(int_part[i:i + 4]) for i in range(0, len(int_part), 4)]
+    groups += [int(frac_part[i:i + 4]) for i in range(0, len(frac_part), 4)]
+    weight = len(int_part) // 4 - 1
+    
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight = 0
+    
+    header = struct.pack('!hhHh', len(groups), weight, 0x4000 if sign else 0, dscale)
+    return header + struct.pack(f'!{len(groups)}h', *groups)
+
+
+def _encode_text(value) -> bytes:
+    if not isinstance(value, str):
+        raise TypeError(f"Expected str, got {type(value).__name__}")
+    return value.encode('utf-8')
+
+
+def _encode_bytea(value) -> bytes:
+    if isinstance(value, str):
+        raise TypeError("Expected bytes for bytea, got str")
+    return bytes(value)
+
+
+def _encode_date(value) -> bytes:
+    if isinstance(value, datetime):
+        value = value.date()
+    return struct.pack('!i', (value - PG_EPOCH_DATE).days)
+
+
+def _timedelta_micros(delta: timedelta) -> int:
+    return (delta.days * 86400 + delta.seconds) * 1000000 + delta.microseconds
+
+
+def _encode_timestamp(value) -> bytes:
+    if not isinstance(value, datetime):
+        value = datetime(value.year, value.month, value.day)
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc).replace(tzinfo=None)
+    return struct.pack('!q', _timedelta_micros(value - PG_EPOCH))
+
+
+def _encode_timestamptz(value) -> bytes:
+    if not isinstance(value, datetime) or value.tzinfo is None:
+        # The text path lets the server apply its TimeZone setting instead
+        raise TypeError("Naive value for timestamptz column")
+    return struct.pack('!q', _timedelta_micros(value - PG_EPOCH_TZ))
+
+
+def _encode_interval(value) -> bytes:
+    if not isinstance(value, timedelta):
+        raise TypeError(f"Expected timedelta, got {type(value).__name__}")
+    micros = value.seconds * 1000000 + value.microseconds
+    return struct.pack('!qii', micros, value.days, 0)
+
+
+def _encode_bool(value) -> bytes:
+    return struct.pack('!?', bool(value))
+
+
+def _struct_encoder(fmt: str, cast):
+    packer = struct.Struct(fmt)
+    
+    def encode(value) -> bytes:
+        if isinstance(value, (str, bytes)):
+            raise TypeError(f"Cannot encode {type(value).__name__} as {fmt}")
+        converted = cast(value)
+        if cast is int and converted != value:
+            raise TypeError(f"Cannot encode non-integral value {value!r} as {fmt}")
+        try:
+            return packer.pack(converted)
+        except struct.error as e:
+            raise TypeError(f"Cannot encode {value!r} as {fmt}: {e}")
+    
+    return encode
+
+
+# Binary encoders keyed by pg_type.typname
+BINARY_ENCODERS = {
+    'int2': _struct_encoder('!h', int),
+    'int4': _struct_encoder('!i', int),
+    'int8': _struct_encoder('!q', int),
+    'float4': _struct_encoder('!f', float),
+    'float8': _struct_encoder('!d', float),
+    'numeric': _encode_numeric,
+    'bool': _encode_bool,
+    'text': _encode_text,
+    'varchar': _encode_text,
+    'bpchar': _encode_text,
+    'bytea': _encode_bytea,
+    'date': _encode_date,
+    'timestamp': _encode_timestamp,
+    'timestamptz': _encode_timestamptz,
+    'interval': _encode_interval,
+}
+
+
+def supports_binary(column_types: List[str]) -> bool:
+    """Check whether every column type has a binary COPY encoder."""
+    return all(col_type in BINARY_ENCODERS for col_type in column_types)
+
+
+def encode_binary_rows(rows: List[tuple], column_types: List[str],
+                       header: bool = True) -> bytes:
+    """
+    Encode a batch of rows as COPY binary-format data.
+    
+    Args:
+        rows: Rows to encode
+        column_types: pg_type names of the target columns, in row order
+        header: If True, wrap the rows in the binary header and trailer
+    
+    Raises:
+        TypeError: If a value cannot be encoded for its column type
+    """
+    encoders = [BINARY_ENCODERS[col_type] for col_type in column_types]
+    field_count = struct.pack('!h', len(encoders))
+    null_field = struct.pack('!i', -1)
+    pack_length = struct.Struct('!i').pack
+    
+    buf = io.BytesIO()
+    if header:
+        buf.write(BINARY_HEADER)
+    for row in rows:
+        buf.write(field_count)
+        for encode, value in zip(encoders, row):
+            if value is None:
+                buf.write(null_field)
+            else:
+                data = encode(value)
+                buf.write(pack_length(len(data)))
+                buf.write(data)
+    if header:
+        buf.write(BINARY_TRAILER)
+    return buf.getvalue()
+
+
+def copy_statement(schema: str, table_name: str, columns: List[str],
+                   format: str = 'text') -> str:
+    """Build a COPY ... FROM STDIN statement for the given columns."""
+    col_names = ', '.join([f'"{col}"' for col in columns])
+    options = ' WITH (FORMAT binary)' if format == 'binary' else ''
+    return f'COPY "{schema}"."{table_name}" ({col_names}) FROM STDIN{options}'
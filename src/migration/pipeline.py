@@ -0,0 +1,127 @@
+"""
+Overlapped extract/load pipeline for batch data transfer.
+"""
+
+import logging
+import queue
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable
+
+logger = logging.getLogger(__name__)
+
+# How long blocked queue operations wait before re-checking for shutdown
+POLL_INTERVAL = 0.1
+
+
+class BatchPipeline:
+    """
+    Runs a reader thread that produces batches into a bounded queue and
+    writer threads that drain it.
+    
+    The queue bound provides backpressure: at most queue_size batches are
+    held in memory between the stages, plus one in flight per thread.
+    """
+    
+    def __init__(self, writers: int = 1, queue_size: int = 4):
+        self.writers = max(1, writers)
+        self.queue_size = max(1, queue_size)
+    
+    def run(self, batches: Iterable[Any],
+            write: Callable[[int, Any], None]) -> Dict[str, Dict[str, float]]:
+        """
+        Drain batches through write(writer_id, batch) on the writer threads.
+        
+        Args:
+            batches: Iterable producing batches; consumed on the reader thread
+            write: Called for each batch with the index of the writer thread
+        
+        Returns:
+            Busy and idle seconds per stage, keyed 'reader' and 'writer-N'.
+            Reader idle time is time blocked on a full queue; writer idle
+            time is time waiting on an empty queue.
+        
+        Raises:
+            The first exception raised by the reader or a writer, after all
+            threads have stopped.
+        """
+        pending = queue.Queue(maxsize=self.queue_size)
+        reader_done = threading.Event()
+        stop = threading.Event()
+        errors = []
+        stats = {'reader': {'busy': 0.0, 'idle': 0.0, 'batches': 0}}
+        for writer_id in range(self.writers):
+            stats[f'writer-{writer_id}'] = {'busy': 0.0, 'idle': 0.0, 'batches': 0}
+        
+        def reader():
+            timing = stats['reader']
+            try:
+                iterator = iter(batches)
+                while not stop.is_set():
+                    started = time.perf_counter()
+                    try:
+                        batch = next(iterator)
+                    except StopIteration:
+                        break
+                    fetched = time.perf_counter()
+                    timing['busy'] += fetched - started
+                    
+                    while not stop.is_set():
+                        try:
+                            pending.put(batch, timeout=POLL_INTERVAL)
+                            timing['batches'] += 1
+                            break
+                        except queue.Full:
+                            continue
+                    timing['idle'] += time.perf_counter() - fetched
+            except Exception as e:
+                errors.append(e)
+                stop.set()
+            finally:
+                reader_done.set()
+        
+        def writer(writer_id: int):
+            timing = stats[f'writer-{writer_id}']
+            while not stop.is_set():
+                waiting = time.perf_counter()
+                try:
+                    batch = pending.get(timeout=POLL_INTERVAL)
+                except queue.Empty:
+                    timing['idle'] += time.perf_counter() - waiting
+                    if reader_done.is_set() and pending.empty():
+                        break
+                    continue
+                started = time.perf_counter()
+                timing['idle'] += started - waiting
+                try:
+                    write(writer_id, batch)
+                except Exception as e:
+                    errors.append(e)
+                    stop.set()
+                    break
+                timing['busy'] += time.perf_counter() - started
+                timing['batches'] += 1
+        
+        threads = [threading.Thread(target=reader, name='pipeline-reader', daemon=True)]
+        threads += [
+            threading.Thread(target=writer, args=(writer_id,),
+                             name=f'pipeline-writer-{writer_id}', daemon=True)
+            for writer_id in range(self.writers)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        if errors:
+            raise errors[0]
+        return stats
+
+
+def summarize_stage_times(stats: Dict[str, Dict[str, float]]) -> str:
+    """Format pipeline stage timings for logging."""
+    parts = [
+        f"{stage} busy {timing['busy']:.1f}s idle {timing['idle']:.1f}s"
+        for stage, timing in stats.items()
+    ]
+    return '; '.join(parts)
@@ -0,0 +1,106 @@
+"""
+Per-table row converters compiled from Oracle column metadata.
+"""
+
+import re
+from datetime import timezone
+from typing import Callable, List, Optional
+
+# Oracle types fetched as LOB locators unless inlined by an output type handler
+LOB_TYPES = ('CLOB', 'NCLOB', 'BLOB', 'BFILE')
+
+_TZ_TIMESTAMP = re.compile(r'^TIMESTAMP(\(\d+\))? WITH TIME ZONE$')
+_INTERVAL_YM = re.compile(r'^INTERVAL YEAR(\(\d+\))? TO MONTH$')
+
+
+def read_lob_value(value):
+    """Read a value that was fetched as a LOB locator."""
+    if not hasattr(value, 'read'):
+        return value
+    try:
+        return value.read()
+    except Exception:
+        return str(value)
+
+
+def utc_timestamp(value):
+    """Mark a timestamp selected with SYS_EXTRACT_UTC as UTC."""
+    return value.replace(tzinfo=timezone.utc)
+
+
+def interval_ym_text(value) -> str:
+    """Format an IntervalYM as PostgreSQL interval input."""
+    return f'{value.years} years {value.months} months'
+
+
+def is_tz_timestamp(data_type: str) -> bool:
+    """Check for TIMESTAMP WITH TIME ZONE (not WITH LOCAL TIME ZONE)."""
+    return bool(_TZ_TIMESTAMP.match(data_type))
+
+
+def column_conversion(data_type: str) -> Optional[Callable]:
+    """
+    Get the conversion applied to non-NULL values of a column type.
+    
+    Returns:
+        A callable, or None if fetched values can be loaded as they are
+    """
+    if data_type in LOB_TYPES:
+        return read_lob_value
+    if is_tz_timestamp(data_type):
+        return utc_timestamp
+    if _INTERVAL_YM.match(data_type):
+        return interval_ym_text
+    return None
+
+
+def select_expression(column_name: str, data_type: str) -> str:
+    """
+    Build the select-list expression for a column.
+    
+    TIMESTAMP WITH TIME ZONE values are fetched without their offset, so
+    they are normalized to UTC on the server and marked UTC by the converter.
+    """
+    if is_tz_timestamp(data_type):
+        return f'SYS_EXTRACT_UTC("{column_name}") AS "{column_name}"'
+    return f'"{column_name}"'
+
+
+def compile_row_converter(data_types: List[str],
+                          row_width: Optional[int] = None) -> Optional[Callable[[tuple], tuple]]:
+    """
+    Compile a function converting fetched rows of a table for loading.
+    
+    The function is generated once per table as a single tuple expression,
+    so columns that need no conversion cost one index operation per value
+    and no per-value type checks are made.
+    
+    Args:
+        data_types: Oracle data type of each column, in select-list order
+        row_width: Number of values in fetched rows, if helper columns
+            (e.g. ROWID or LOB locators) follow the table columns; they
+            are dropped from the result
+    
+    Returns:
+        A callable taking and returning a tuple, or None if fetched rows
+        can be loaded as they are
+    """
+    width = len(data_types)
+    conversions = [column_conversion(data_type) for data_type in data_types]
+    has_extra = row_width is not None and row_width > width
+    if not any(conversions):
+        if not has_extra:
+            return None
+        return lambda row: row[:width]
+    
+    namespace = {}
+    fields = []
+    for i, conversion in enumerate(conversions):
+        if conversion is None:
+            fields.append(f'row[{i}]')
+        else:
+            namespace[f'_convert{i}'] = conversion
+            fields.append(f'(None if row[{i}] is None else _convert{i}(row[{i}]))')
+    source = f"def convert(row):\n    return ({', '.join(fields)},)\n"
+    exec(source, namespace)
+    return namespace['convert']
@@ -0,0 +1,107 @@
+"""
+Concurrent per-table scheduling for schema and data migration.
+"""
+
+import logging
+import queue
+import threading
+from typing import Callable, Dict, List
+from .db_connector import OracleConnector, PostgreSQLConnector
+
+logger = logging.getLogger(__name__)
+
+
+class TableScheduler:
+    """
+    Runs a per-table task on a pool of workers.
+    
+    Each worker opens its own Oracle and PostgreSQL connections, cloned from
+    the given connectors, and keeps them for every table it processes.
+    """
+    
+    def __init__(self, oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector,
+                 workers: int = 1):
+        self.oracle_conn = oracle_conn
+        self.pg_conn = pg_conn
+        self.workers = max(1, workers)
+    
+    def order_by_size(self, tables: List[str]) -> List[str]:
+        """
+        Order tables largest-first so the longest tables start early.
+        
+        Falls back to the given order if sizes cannot be estimated.
+        """
+        try:
+            sizes = self.oracle_conn.get_table_sizes()
+        except Exception as e:
+            logger.warning(f"Could not estimate table sizes, keeping table order: {e}")
+            return list(tables)
+        return sorted(tables, key=lambda t: sizes.get(t, 0), reverse=True)
+    
+    def run(self, tables: List[str],
+            task: Callable[[OracleConnector, PostgreSQLConnector, str], bool]) -> Dict[str, bool]:
+        """
+        Run task(oracle_conn, pg_conn, table_name) for every table.
+        
+        Args:
+            tables: Tables to process, in scheduling order
+            task: Per-table callable returning a success flag
+        
+        Returns:
+            Dictionary mapping table names to success status, in the order
+            the tables were given
+        """
+        pending = queue.Queue()
+        for table_name in tables:
+            pending.put(table_name)
+        
+        results = {}
+        lock = threading.Lock()
+        
+        def worker():
+            oracle_conn = self.oracle_conn.clone()
+            pg_conn = self.pg_conn.clone()
+            try:
+                oracle_conn.connect()
+                pg_conn.connect()
+            except Exception as e:
+                logger.error(f"Worker could not connect: {e}")
+                self._disconnect(oracle_conn, pg_conn)
+                return
+            
+            try:
+                while True:
+                    try:
+                        table_name = pending.get_nowait()
+                    except queue.Empty:
+                        break
+                    try:
+                        success = task(oracle_conn, pg_conn, table_name)
+                    except Exception as e:
+                        logger.error(f"Error processing table {table_name}: {e}")
+                        success = False
+                    with lock:
+                        results[table_name] = success
+            finally:
+                self._disconnect(oracle_conn, pg_conn)
+        
+        threads = [
+            threading.Thread(target=worker, name=f"table-worker-{i}", daemon=True)
+            for i in range(min(self.workers, len(tables)))
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        # Tables left unprocessed because every worker failed to connect
+        return {table_name: results.get(table_name, False) for table_name in tables}
+    
+    @staticmethod
+    def _disconnect(oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector):
+        for conn in (oracle_conn, pg_conn):
+            try:
+                if conn.connection:
+                    conn.disconnect()
+            except Exception as e:
+                logger.error(f"Error disconnecting worker connection: {e}")
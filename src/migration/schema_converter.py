@@ -3,27 +3,109 @@ Schema conversion utilities for Oracle to PostgreSQL migration.
 """
 
 import logging
-from typing import List, Dict, Any
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .catalog import TableMetadata, foreign_key_order
 from .db_connector import OracleConnector, PostgreSQLConnector
+from .partitions import PARTITION_METHODS, partition_bounds
 from .type_mapper import TypeMapper
+from .scheduler import TableScheduler
 
 logger = logging.getLogger(__name__)
 
+# Oracle delete rules carried over to PostgreSQL (NO ACTION is the default)
+FK_DELETE_RULES = ('CASCADE', 'SET NULL')
+# Sections of a DDL script, in the order they are applied
+DDL_SECTIONS = ('pre-data', 'post-data', 'constraints')
+DDL_SECTION_MARKER = '-- section: '
+
+
+def split_ddl_sections(script: str) -> Dict[str, str]:
+    """
+    Split a DDL script written by SchemaConverter.generate_ddl_script into
+    its sections.
+    
+    Returns:
+        Dictionary mapping section names to their SQL, in script order
+        (text before the first section marker is ignored)
+    """
+    sections = {}
+    current = None
+    for line in script.splitlines(keepends=True):
+        if line.startswith(DDL_SECTION_MARKER):
+            current = line[len(DDL_SECTION_MARKER):].strip()
+            sections.setdefault(current, '')
+        elif current is not None:
+            sections[current] += line
+    return sections
+
 
 class SchemaConverter:
     """Converts Oracle schemas to PostgreSQL schemas."""
     
-    def __init__(self, oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector):
+    def __init__(self, oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector,
+                 workers: int = 1, defer_constraints: bool = False,
+                 unlogged: bool = False, catalog: Dict[str, TableMetadata] = None,
+                 pg_partitions: bool = False):
+        """
+        Args:
+            oracle_conn: Source connection
+            pg_conn: Target connection
+            workers: Number of tables processed concurrently
+            defer_constraints: Load-first mode: convert_table creates only the
+                table and its primary key; secondary indexes and foreign keys
+                are built by create_deferred_constraints after the data load
+            unlogged: Create tables UNLOGGED for the initial load; the data
+                migrator sets them LOGGED once their row counts are verified
+            catalog: Preloaded table metadata (see load_catalog); tables
+                missing from it are read with the per-table queries
+            pg_partitions: Create RANGE, LIST and HASH partitioned Oracle
+                tables as PostgreSQL partitioned tables, with one partition
+                per Oracle partition (never UNLOGGED)
+        """
         self.oracle_conn = oracle_conn
         self.pg_conn = pg_conn
+        self.workers = max(1, workers)
+        self.defer_constraints = defer_constraints
+        self.unlogged = unlogged
+        self.catalog = catalog if catalog is not None else {}
+        self.pg_partitions = pg_partitions
         self.type_mapper = TypeMapper()
+        # Seconds spent in each stage of the last convert_all_tables
+        self.stage_times: Dict[str, float] = {}
+    
+    def load_catalog(self, tables: List[str] = None):
+        """
+        Preload the metadata of many tables with the bulk catalog queries.
+        
+        If the bulk load fails, tables are read one at a time instead.
+        
+        Args:
+            tables: Table names to load (if None, every table of the schema)
+        """
+        started = time.monotonic()
+        try:
+            self.catalog.update(self.oracle_conn.load_catalog(tables))
+            logger.info(f"Loaded metadata of {len(self.catalog)} tables "
+                        f"in {time.monotonic() - started:.1f}s")
+        except Exception as e:
+            logger.warning(f"Bulk metadata load failed, reading tables one at a time: {e}")
     
-    def convert_table(self, table_name: str) -> bool:
+    def _metadata(self, table_name: str) -> TableMetadata:
+        """Get a table's metadata from the catalog, or query it if not loaded."""
+        metadata = self.catalog.get(table_name)
+        if metadata is None:
+            metadata = self.oracle_conn.get_table_metadata(table_name)
+        return metadata
+    
+    def convert_table(self, table_name: str, foreign_keys: bool = True) -> bool:
         """
         Convert a single Oracle table to PostgreSQL.
         
         Args:
             table_name: Name of the table to convert
+            foreign_keys: If False, leave the foreign keys to the caller
+                (convert_all_tables adds them once all tables exist)
             
         Returns:
             True if successful, False otherwise
@@ -32,52 +114,34 @@ class SchemaConverter:
             logger.info(f"Converting table: {table_name}")
             
             # Get table structure from Oracle
-            columns = self.oracle_conn.get_table_columns(table_name)
-            primary_keys = self.oracle_conn.get_primary_keys(table_name)
-            foreign_keys = self.oracle_conn.get_foreign_keys(table_name)
-            indexes = self.oracle_conn.get_indexes(table_name)
+            metadata = self._metadata(table_name)
+            columns = metadata.columns
+            primary_keys = metadata.primary_keys
             
             # Convert columns
-            pg_columns = []
-            for col in columns:
-                col_name = col[0]
-                oracle_type = col[1]
-                data_length = col[2]
-                data_precision = col[3]
-                data_scale = col[4]
-                nullable = col[5]
-                default_value = col[6]
-                
-                # Map data type
-                pg_type = self.type_mapper.map_type(
-                    oracle_type, data_length, data_precision, data_scale
-                )
-                
-                # Build column definition
-                col_def = f'"{col_name}" {pg_type}'
-                
-                # Add NOT NULL constraint
-                if nullable == 'N':
-                    col_def += ' NOT NULL'
-                
-                # Add default value
-                if default_value:
-                    pg_default = self.type_mapper.convert_default_value(
-                        default_value, oracle_type
-                    )
-                    if pg_default:
-                        col_def += f' DEFAULT {pg_default}'
-                
-                pg_columns.append(col_def)
+            pg_columns = self._column_definitions(columns)
             
             # Create table in PostgreSQL
-            self.pg_conn.create_table(table_name, pg_columns, primary_keys)
+            partitioning = self._partitioning(table_name, metadata)
+            self.pg_conn.create_table(table_name, pg_columns, primary_keys,
+                                      unlogged=self.unlogged and not partitioning,
+                                      partition_by=partitioning['partition_by'] if partitioning else None)
+            for statement in self._partition_statements(table_name, partitioning):
+                self.pg_conn.execute_command(statement)
             
-            # Create indexes
-            self._create_indexes(table_name, indexes)
+            if self.defer_constraints:
+                logger.debug(f"Deferring indexes and foreign keys of {table_name}")
+            else:
+                # Create indexes
+                self._create_indexes(table_name, metadata.indexes)
             
-            # Create foreign keys
-            self._create_foreign_keys(table_name, foreign_keys)
+                # Create foreign keys
+                if foreign_keys:
+                    _, failed = self._create_foreign_keys(table_name, metadata.foreign_keys)
+                    if failed:
+                        logger.error(f"Table {table_name} created without foreign keys "
+                                     f"{', '.join(failed)}")
+                        return False
             
             logger.info(f"Successfully converted table: {table_name}")
             return True
@@ -86,14 +150,95 @@ class SchemaConverter:
             logger.error(f"Error converting table {table_name}: {e}")
             return False
     
-    def _create_indexes(self, table_name: str, indexes: List[Any]):
-        """Create indexes in PostgreSQL."""
-        if not indexes:
-            return
+    def _column_definitions(self, columns: List[Any]) -> List[str]:
+        """Map TableMetadata.columns rows to PostgreSQL column definitions."""
+        pg_columns = []
+        for col in columns:
+            col_name = col[0]
+            oracle_type = col[1]
+            data_length = col[2]
+            data_precision = col[3]
+            data_scale = col[4]
+            nullable = col[5]
+            default_value = col[6]
+            
+            # Map data type
+            pg_type = self.type_mapper.map_type(
+                oracle_type, data_length, data_precision, data_scale
+            )
+            
+            # Build column definition
+            col_def = f'"{col_name}" {pg_type}'
+            
+            # Add NOT NULL constraint
+            if nullable == 'N':
+                col_def += ' NOT NULL'
+            
+            # Add default value
+            if default_value:
+                pg_default = self.type_mapper.convert_default_value(
+                    default_value, oracle_type
+                )
+                if pg_default:
+                    col_def += f' DEFAULT {pg_default}'
+            
+            pg_columns.append(col_def)
+        return pg_columns
+    
+    def _partitioning(self, table_name: str, metadata: TableMetadata) -> Optional[Dict[str, Any]]:
+        """
+        Plan the PostgreSQL partitioning of a table when pg_partitions is set.
         
+        Returns:
+            Dict with 'partition_by' (the PARTITION BY clause) and 'bounds'
+            (see partitions.partition_bounds), or None to create a regular
+            table
+        """
+        if not self.pg_partitions:
+            return None
+        try:
+            partitioning = self.oracle_conn.get_partitioning(table_name)
+            if partitioning is None:
+                return None
+            method = partitioning['type']
+            if method not in PARTITION_METHODS:
+                logger.warning(f"Creating {table_name} unpartitioned: {method} partitioning "
+                               f"has no PostgreSQL equivalent")
+                return None
+            # PostgreSQL primary keys must contain the partition key
+            missing = [c for c in partitioning['columns'] if c not in metadata.primary_keys]
+            if metadata.primary_keys and missing:
+                logger.warning(f"Creating {table_name} unpartitioned: partition key "
+                               f"{', '.join(missing)} is not part of its primary key")
+                return None
+            partitions = self.oracle_conn.get_table_partitions(table_name)
+            key_list = ', '.join(f'"{col}"' for col in partitioning['columns'])
+            return {
+                'partition_by': f'{method} ({key_list})',
+                'bounds': partition_bounds(method, len(partitioning['columns']), partitions),
+            }
+        except Exception as e:
+            logger.warning(f"Creating {table_name} unpartitioned: {e}")
+            return None
+    
+    def _partition_statements(self, table_name: str,
+                              partitioning: Optional[Dict[str, Any]]) -> List[str]:
+        """Build the CREATE TABLE ... PARTITION OF statements of a partitioned table."""
+        if not partitioning:
+            return []
+        return [self.pg_conn.create_partition_statement(table_name, partition_name, bound)
+                for partition_name, bound in partitioning['bounds']]
+    
+    def _index_statements(self, table_name: str, indexes: List[Any]) -> List[Tuple[str, str]]:
+        """
+        Build the CREATE INDEX statements of a table.
+        
+        Returns:
+            Tuples of (PostgreSQL index name, statement)
+        """
         # Group indexes by index name
         index_dict = {}
-        for idx in indexes:
+        for idx in indexes or []:
             idx_name = idx[0]
             col_name = idx[1]
             col_pos = idx[2]
@@ -110,132 +255,404 @@ class SchemaConverter:
                 index_dict[idx_name]['columns'].append(None)
             index_dict[idx_name]['columns'][col_pos - 1] = col_name
         
-        # Create indexes
         schema = self.pg_conn.schema
+        statements = []
         for idx_name, idx_info in index_dict.items():
+            # Skip if it's a primary key index (already created)
+            if idx_name.upper().endswith('_PK'):
+                continue
+            
+            cols = [col for col in idx_info['columns'] if col]
+            if not cols:
+                continue
+            
+            col_list = ', '.join([f'"{col}"' for col in cols])
+            unique_clause = 'UNIQUE ' if idx_info['unique'] else ''
+            
+            # PostgreSQL index names must be unique, so prefix with table name
+            pg_idx_name = f"{table_name}_{idx_name}".lower()[:63]  # Max 63 chars
+            
+            statements.append((pg_idx_name,
+                               f'CREATE {unique_clause}INDEX IF NOT EXISTS "{pg_idx_name}" '
+                               f'ON "{schema}"."{table_name}" ({col_list})'))
+        return statements
+    
+    def _create_indexes(self, table_name: str, indexes: List[Any]) -> bool:
+        """
+        Create indexes in PostgreSQL.
+        
+        Returns:
+            True if every index was created
+        """
+        success = True
+        for pg_idx_name, query in self._index_statements(table_name, indexes):
             try:
-                # Skip if it's a primary key index (already created)
-                if idx_name.upper().endswith('_PK'):
-                    continue
-                
-                cols = [col for col in idx_info['columns'] if col]
-                if not cols:
-                    continue
-                
-                col_list = ', '.join([f'"{col}"' for col in cols])
-                unique_clause = 'UNIQUE ' if idx_info['unique'] else ''
-                
-                # PostgreSQL index names must be unique, so prefix with table name
-                pg_idx_name = f"{table_name}_{idx_name}".lower()[:63]  # Max 63 chars
-                
-                query = f'CREATE {unique_clause}INDEX IF NOT EXISTS "{pg_idx_name}" ' \
-                       f'ON "{schema}"."{table_name}" ({col_list})'
-                
                 self.pg_conn.execute_command(query)
                 logger.debug(f"Created index: {pg_idx_name}")
             except Exception as e:
-                logger.warning(f"Failed to create index {idx_name}: {e}")
+                logger.warning(f"Failed to create index {pg_idx_name}: {e}")
+                self.pg_conn.rollback()
+                success = False
+        return success
     
-    def _create_foreign_keys(self, table_name: str, foreign_keys: List[Any]):
-        """Create foreign key constraints in PostgreSQL."""
-        if not foreign_keys:
-            return
+    def _foreign_key_statements(self, table_name: str, foreign_keys: List[Any],
+                                not_valid: bool = False) -> List[Tuple[str, str]]:
+        """
+        Build the ADD CONSTRAINT statements of a table's foreign keys.
+        
+        Args:
+            table_name: Referencing table
+            foreign_keys: TableMetadata.foreign_keys rows
+            not_valid: Add the constraints NOT VALID
         
-        # Group foreign keys by constraint name
+        Returns:
+            Tuples of (PostgreSQL constraint name, statement)
+        """
+        # Group foreign keys by constraint name; rows come in column position
+        # order with the referenced table already resolved
         fk_dict = {}
-        for fk in foreign_keys:
-            constraint_name = fk[0]
-            column_name = fk[1]
-            ref_schema = fk[2]
-            ref_constraint = fk[3]
-            ref_column = fk[4]
+        for fk in foreign_keys or []:
+            constraint_name, column_name, _, _, ref_column, ref_table, delete_rule = fk
             
             if constraint_name not in fk_dict:
                 fk_dict[constraint_name] = {
                     'columns': [],
-                    'ref_table': None,
-                    'ref_columns': []
+                    'ref_table': ref_table,
+                    'ref_columns': [],
+                    'delete_rule': delete_rule
                 }
             
             fk_dict[constraint_name]['columns'].append(column_name)
             fk_dict[constraint_name]['ref_columns'].append(ref_column)
         
-        # Get referenced table names
+        schema = self.pg_conn.schema
+        statements = []
         for constraint_name, fk_info in fk_dict.items():
-            # Find the FK entry for this constraint to get reference info
-            fk_entry = next((fk for fk in foreign_keys if fk[0] == constraint_name), None)
-            if not fk_entry:
+            if not fk_info['ref_table']:
                 continue
             
-            ref_owner = fk_entry[2]
-            ref_constraint = fk_entry[3]
+            cols = ', '.join([f'"{col}"' for col in fk_info['columns']])
+            ref_cols = ', '.join([f'"{col}"' for col in fk_info['ref_columns']])
+            
+            # PostgreSQL FK names must be unique
+            pg_fk_name = f"{table_name}_{constraint_name}".lower()[:63]
             
-            # Query to get referenced table
-            query = """
-                SELECT table_name
-                FROM all_constraints
-                WHERE owner = :owner
-                AND constraint_name = :constraint_name
-            """
+            query = f'ALTER TABLE "{schema}"."{table_name}" ' \
+                   f'ADD CONSTRAINT "{pg_fk_name}" ' \
+                   f'FOREIGN KEY ({cols}) ' \
+                   f'REFERENCES "{schema}"."{fk_info["ref_table"]}" ({ref_cols})'
+            if fk_info['delete_rule'] in FK_DELETE_RULES:
+                query += f' ON DELETE {fk_info["delete_rule"]}'
+            if not_valid:
+                query += ' NOT VALID'
+            statements.append((pg_fk_name, query))
+        return statements
+    
+    def _create_foreign_keys(self, table_name: str, foreign_keys: List[Any],
+                             not_valid: bool = False) -> Tuple[List[str], List[str]]:
+        """
+        Create foreign key constraints in PostgreSQL.
+        
+        Args:
+            table_name: Referencing table
+            foreign_keys: TableMetadata.foreign_keys rows
+            not_valid: Add the constraints NOT VALID, skipping the check of
+                existing rows (see _validate_foreign_keys)
+        
+        Returns:
+            Tuple of (names of the constraints created, names of those that failed)
+        """
+        created = []
+        failed = []
+        for pg_fk_name, query in self._foreign_key_statements(table_name, foreign_keys, not_valid):
             try:
-                result = self.oracle_conn.execute_query(query, {
-                    'owner': ref_owner,
-                    'constraint_name': ref_constraint
-                })
-                if result:
-                    fk_info['ref_table'] = result[0][0]
+                self.pg_conn.execute_command(query)
+                created.append(pg_fk_name)
+                logger.debug(f"Created foreign key: {pg_fk_name}")
             except Exception as e:
-                logger.warning(f"Could not determine referenced table for FK {constraint_name}: {e}")
-                continue
+                logger.warning(f"Failed to create foreign key {pg_fk_name}: {e}")
+                self.pg_conn.rollback()
+                failed.append(pg_fk_name)
+        return created, failed
+    
+    def _validate_foreign_keys(self, table_name: str, constraint_names: List[str]) -> bool:
+        """
+        Validate foreign keys added NOT VALID.
         
-        # Create foreign key constraints
+        VALIDATE CONSTRAINT only takes a SHARE UPDATE EXCLUSIVE lock, so
+        several tables can be validated concurrently.
+        
+        Returns:
+            True if every constraint validated
+        """
         schema = self.pg_conn.schema
-        for constraint_name, fk_info in fk_dict.items():
-            if not fk_info['ref_table']:
-                continue
-            
+        success = True
+        for constraint_name in constraint_names:
             try:
-                cols = ', '.join([f'"{col}"' for col in fk_info['columns']])
-                ref_cols = ', '.join([f'"{col}"' for col in fk_info['ref_columns']])
-                
-                # PostgreSQL FK names must be unique
-                pg_fk_name = f"{table_name}_{constraint_name}".lower()[:63]
-                
-                query = f'ALTER TABLE "{schema}"."{table_name}" ' \
-                       f'ADD CONSTRAINT "{pg_fk_name}" ' \
-                       f'FOREIGN KEY ({cols}) ' \
-                       f'REFERENCES "{schema}"."{fk_info["ref_table"]}" ({ref_cols})'
-                
-                self.pg_conn.execute_command(query)
-                logger.debug(f"Created foreign key: {pg_fk_name}")
+                self.pg_conn.execute_command(
+                    f'ALTER TABLE "{schema}"."{table_name}" VALIDATE CONSTRAINT "{constraint_name}"'
+                )
+                logger.debug(f"Validated foreign key: {constraint_name}")
             except Exception as e:
-                logger.warning(f"Failed to create foreign key {constraint_name}: {e}")
+                logger.warning(f"Failed to validate foreign key {constraint_name}: {e}")
+                self.pg_conn.rollback()
+                success = False
+        return success
     
     def convert_all_tables(self, table_filter: List[str] = None) -> Dict[str, bool]:
         """
         Convert all tables from Oracle to PostgreSQL.
         
+        Tables, with their primary keys and indexes, are created on the
+        worker pool. Foreign keys are then added in dependency order (see
+        _add_foreign_keys), once the tables at both ends exist.
+        
         Args:
             table_filter: Optional list of table names to convert (if None, converts all)
             
         Returns:
             Dictionary mapping table names to success status
         """
-        results = {}
-        
-        # Get list of tables
-        if table_filter:
-            tables = [t for t in self.oracle_conn.get_tables() if t in table_filter]
-        else:
-            tables = self.oracle_conn.get_tables()
+        self.stage_times = {}
+        started = time.monotonic()
+        tables = self._get_tables(table_filter)
+        self.load_catalog(tables if table_filter else None)
+        self.stage_times['catalog'] = time.monotonic() - started
         
         logger.info(f"Converting {len(tables)} tables...")
         
-        for table_name in tables:
-            results[table_name] = self.convert_table(table_name)
+        started = time.monotonic()
+        results = self._run_per_table(
+            tables, lambda converter, table_name: converter.convert_table(
+                table_name, foreign_keys=False)
+        )
+        self.stage_times['tables'] = time.monotonic() - started
+        
+        if not self.defer_constraints:
+            started = time.monotonic()
+            added = self._add_foreign_keys([t for t in tables if results[t]])
+            for table_name, foreign_keys in added.items():
+                results[table_name] = foreign_keys is not None and not foreign_keys[1]
+            self.stage_times['foreign_keys'] = time.monotonic() - started
         
         successful = sum(1 for v in results.values() if v)
         logger.info(f"Schema conversion complete: {successful}/{len(tables)} tables successful")
+        logger.info("Schema conversion stages: " + ', '.join(
+            f"{stage} {seconds:.1f}s" for stage, seconds in self.stage_times.items()))
         
         return results
+    
+    def _add_foreign_keys(self, tables: List[str], not_valid: bool = False
+                          ) -> Dict[str, Optional[Tuple[List[str], List[str]]]]:
+        """
+        Add the foreign keys of tables one table at a time, each table after
+        the tables it references; tables in reference cycles come last.
+        
+        Args:
+            tables: Tables whose foreign keys to add (all of them exist)
+            not_valid: Add the constraints NOT VALID
+        
+        Returns:
+            Dictionary mapping table names to (constraints created, constraints
+            that failed), or None if the table's foreign keys could not be
+            processed
+        """
+        added = {}
+        metadata = {}
+        for table_name in tables:
+            try:
+                metadata[table_name] = self._metadata(table_name)
+            except Exception as e:
+                logger.error(f"Error reading foreign keys of {table_name}: {e}")
+                added[table_name] = None
+        
+        ordered, cyclic = foreign_key_order(metadata, list(metadata))
+        if cyclic:
+            logger.info(f"Adding foreign keys of {len(cyclic)} tables in reference cycles "
+                        f"in a final pass: {', '.join(cyclic)}")
+        
+        for table_name in ordered + cyclic:
+            try:
+                added[table_name] = self._create_foreign_keys(
+                    table_name, metadata[table_name].foreign_keys, not_valid=not_valid
+                )
+            except Exception as e:
+                logger.error(f"Error adding foreign keys of {table_name}: {e}")
+                added[table_name] = None
+        return added
 
+    def create_deferred_constraints(self, table_filter: List[str] = None) -> Dict[str, bool]:
+        """
+        Build the secondary indexes and foreign keys skipped in load-first mode.
+
+        Indexes are built on the worker pool, several tables at a time. Foreign
+        keys are then added NOT VALID one table at a time, which is a quick
+        catalog change but locks both tables, so doing it serially avoids lock
+        order deadlocks between tables referencing each other. Finally the
+        constraints are validated on the worker pool.
+        
+        Args:
+            table_filter: Optional list of table names (if None, all tables)
+        
+        Returns:
+            Dictionary mapping table names to success status
+        """
+        tables = self._get_tables(table_filter)
+        self.load_catalog(tables if table_filter else None)
+        logger.info(f"Building indexes and foreign keys for {len(tables)} tables...")
+        
+        index_results = self._run_per_table(
+            tables, lambda converter, table_name: converter._create_indexes(
+                table_name, converter._metadata(table_name).indexes)
+        )
+        
+        added = self._add_foreign_keys(tables, not_valid=True)
+        
+        validate_tables = [t for t in tables if added[t] and added[t][0]]
+        validate_results = self._run_per_table(
+            validate_tables, lambda converter, table_name: converter._validate_foreign_keys(
+                table_name, added[table_name][0])
+        )
+        
+        results = {
+            table_name: bool(index_results[table_name]) and added[table_name] is not None
+            and not added[table_name][1] and validate_results.get(table_name, True)
+            for table_name in tables
+        }
+        successful = sum(1 for v in results.values() if v)
+        logger.info(f"Index and foreign key creation complete: "
+                    f"{successful}/{len(tables)} tables successful")
+        return results
+    
+    def generate_ddl_script(self, path: str, table_filter: List[str] = None) -> Dict[str, int]:
+        """
+        Render the PostgreSQL DDL of the schema to a SQL file, reading only
+        the Oracle catalog (the target is not touched).
+        
+        The script has three sections, each headed by a "-- section: name"
+        line: pre-data (tables and primary keys), post-data (secondary
+        indexes) and constraints (foreign keys, in dependency order). It can
+        be reviewed and edited, then run with apply_ddl_script or psql.
+        
+        Args:
+            path: File to write
+            table_filter: Optional list of table names (if None, all tables)
+        
+        Returns:
+            Dictionary mapping section names to their number of statements
+        """
+        tables = self._get_tables(table_filter)
+        self.load_catalog(tables if table_filter else None)
+        
+        sections = {section: [] for section in DDL_SECTIONS}
+        metadata = {}
+        for table_name in tables:
+            try:
+                table_metadata = self._metadata(table_name)
+                partitioning = self._partitioning(table_name, table_metadata)
+                sections['pre-data'].append(self.pg_conn.create_table_statement(
+                    table_name, self._column_definitions(table_metadata.columns),
+                    table_metadata.primary_keys, unlogged=self.unlogged and not partitioning,
+                    partition_by=partitioning['partition_by'] if partitioning else None
+                ))
+                sections['pre-data'].extend(self._partition_statements(table_name, partitioning))
+                sections['post-data'].extend(
+                    query for _, query in self._index_statements(table_name, table_metadata.indexes)
+                )
+                metadata[table_name] = table_metadata
+            except Exception as e:
+                logger.error(f"Error rendering DDL of table {table_name}: {e}")
+        
+        ordered, cyclic = foreign_key_order(metadata, list(metadata))
+        for table_name in ordered + cyclic:
+            sections['constraints'].extend(
+                query for _, query in self._foreign_key_statements(
+                    table_name, metadata[table_name].foreign_keys)
+            )
+        
+        with open(path, 'w', encoding='utf-8') as f:
+            f.write(f"-- PostgreSQL DDL for {len(metadata)} tables of Oracle schema "
+                    f"{self.oracle_conn.schema}, target schema {self.pg_conn.schema}\n")
+            for section in DDL_SECTIONS:
+                f.write(f"\n{DDL_SECTION_MARKER}{section}\n")
+                f.writelines(f"{query};\n" for query in sections[section])
+        
+        counts = {section: len(sections[section]) for section in DDL_SECTIONS}
+        logger.info(f"Wrote DDL script {path}: " + ', '.join(
+            f"{count} {section} statements" for section, count in counts.items()))
+        return counts
+    
+    def apply_ddl_script(self, path: str) -> Dict[str, bool]:
+        """
+        Run a DDL script written by generate_ddl_script against PostgreSQL.
+        
+        Each section is sent as one batch and committed as one transaction,
+        so a failing statement leaves none of its section applied. Sections
+        run in script order and the first failing one stops the run, as later
+        sections depend on it.
+        
+        Args:
+            path: Script to run
+        
+        Returns:
+            Dictionary mapping section names to success status (sections
+            after a failure are missing)
+        """
+        with open(path, encoding='utf-8') as f:
+            sections = split_ddl_sections(f.read())
+        
+        results = {}
+        for section, sql in sections.items():
+            if not sql.strip():
+                results[section] = True
+                continue
+            started = time.monotonic()
+            try:
+                self.pg_conn.cursor.execute(sql)
+                self.pg_conn.commit()
+                results[section] = True
+                logger.info(f"Applied {section} section of {path} "
+                            f"in {time.monotonic() - started:.1f}s")
+            except Exception as e:
+                logger.error(f"Error applying {section} section of {path}, "
+                             f"section rolled back: {e}")
+                self.pg_conn.rollback()
+                results[section] = False
+                break
+        return results
+    
+    def _get_tables(self, table_filter: List[str] = None) -> List[str]:
+        """List the tables to process, optionally restricted to table_filter."""
+        if table_filter:
+            return [t for t in self.oracle_conn.get_tables() if t in table_filter]
+        return self.oracle_conn.get_tables()
+    
+    def _run_per_table(self, tables: List[str],
+                       task: Callable[['SchemaConverter', str], bool]) -> Dict[str, bool]:
+        """
+        Run task(converter, table_name) for every table, on the worker pool
+        when workers > 1 (each worker with its own converter and connections).
+        """
+        if self.workers > 1 and len(tables) > 1:
+            scheduler = TableScheduler(self.oracle_conn, self.pg_conn, self.workers)
+            ordered = scheduler.order_by_size(tables)
+            
+            def run(oracle_conn, pg_conn, table_name):
+                converter = SchemaConverter(oracle_conn, pg_conn,
+                                            defer_constraints=self.defer_constraints,
+                                            unlogged=self.unlogged,
+                                            catalog=self.catalog,
+                                            pg_partitions=self.pg_partitions)
+                return task(converter, table_name)
+            
+            scheduled = scheduler.run(ordered, run)
+            return {table_name: scheduled[table_name] for table_name in tables}
+        
+        results = {}
+        for table_name in tables:
+            try:
+                results[table_name] = task(self, table_name)
+            except Exception as e:
+                logger.error(f"Error processing table {table_name}: {e}")
+                results[table_name] = False
+        return results
@@ -0,0 +1,235 @@
+"""
+Migration duration estimates from a sample of each table's rows.
+"""
+
+import heapq
+import io
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Tuple
+from . import pg_copy
+from .db_connector import OracleConnector, PostgreSQLConnector
+from .row_converter import compile_row_converter, select_expression
+from .type_mapper import TypeMapper
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SAMPLE_ROWS = 2000
+# Bounds Oracle accepts for a SAMPLE percentage
+SAMPLE_PERCENT_MIN = 0.000001
+SAMPLE_PERCENT_MAX = 99.999999
+# Sampled blocks are not uniformly filled, so sample a bit more than needed
+SAMPLE_OVERSHOOT = 2
+
+
+@dataclass
+class TableSample:
+    """Costs measured on the sampled rows of one table."""
+    
+    table: str
+    rows: int
+    encoded_bytes: int
+    fetch_seconds: float
+    convert_seconds: float
+    load_seconds: Optional[float] = None
+    
+    @property
+    def row_bytes(self) -> float:
+        """Average COPY text size of a row."""
+        return self.encoded_bytes / self.rows if self.rows else 0.0
+    
+    def seconds_per_row(self, default_load: float = 0.0) -> float:
+        """
+        Time to fetch, convert and load one row.
+        
+        Args:
+            default_load: Load time per row used if no trial COPY was made
+        """
+        if not self.rows:
+            return 0.0
+        load = self.load_seconds / self.rows if self.load_seconds is not None else default_load
+        return (self.fetch_seconds + self.convert_seconds) / self.rows + load
+
+
+class ThroughputEstimator:
+    """
+    Estimates how long each table takes to migrate from a few thousand of its
+    rows.
+    
+    The rows are read with a SAMPLE BLOCK clause, so only the sampled blocks
+    are scanned. They are converted and encoded as for a COPY load, and
+    copied into a temporary table that is rolled back. The costs per row are
+    then scaled by each table's row count. The temporary table has no
+    indexes or constraints and writes no WAL, so load times are a lower
+    bound for tables with many indexes.
+    """
+    
+    def __init__(self, oracle_conn: OracleConnector, pg_conn: PostgreSQLConnector = None,
+                 sample_rows: int = DEFAULT_SAMPLE_ROWS):
+        """
+        Args:
+            oracle_conn: Source connection
+            pg_conn: Target connection for the trial COPY (if None, load
+                times are estimated from the tables that had one, or left out)
+            sample_rows: Rows sampled per table
+        """
+        self.oracle_conn = oracle_conn
+        self.pg_conn = pg_conn
+        self.sample_rows = sample_rows
+        self.type_mapper = TypeMapper()
+    
+    def sample_query(self, table_name: str, columns: List[Any],
+                     num_rows: int) -> Tuple[str, Dict[str, Any]]:
+        """
+        Build the query sampling about sample_rows rows of a table.
+        
+        Args:
+            table_name: Table to sample
+            columns: TableMetadata.columns rows
+            num_rows: Estimated rows in the table
+        """
+        select_list = ', '.join(select_expression(col[0], col[1]) for col in columns)
+        query = f'SELECT {select_list} FROM "{self.oracle_conn.schema}"."{table_name}"'
+        if num_rows > self.sample_rows:
+            percent = 100.0 * self.sample_rows * SAMPLE_OVERSHOOT / num_rows
+            percent = min(SAMPLE_PERCENT_MAX, max(SAMPLE_PERCENT_MIN, percent))
+            query += f' SAMPLE BLOCK ({percent:.6f})'
+        query += ' FETCH FIRST :sample_rows ROWS ONLY'
+        return query, {'sample_rows': self.sample_rows}
+    
+    def sample_table(self, table_name: str, columns: List[Any], num_rows: int) -> TableSample:
+        """
+        Fetch, convert and trial-load a sample of a table's rows.
+        
+        Args:
+            table_name: Table to sample
+            columns: TableMetadata.columns rows
+            num_rows: Estimated rows in the table
+        """
+        query, params = self.sample_query(table_name, columns, num_rows)
+        started = time.monotonic()
+        cursor = self.oracle_conn.extraction_cursor(self.sample_rows, self.sample_rows)
+        try:
+            cursor.execute(query, params)
+            rows = cursor.fetchall()
+        finally:
+            cursor.close()
+        fetch_seconds = time.monotonic() - started
+        
+        started = time.monotonic()
+        convert = compile_row_converter([col[1] for col in columns])
+        if convert:
+            rows = [convert(row) for row in rows]
+        payload = pg_copy.encode_text_rows(rows) if rows else b''
+        convert_seconds = time.monotonic() - started
+        
+        sample = TableSample(table_name, len(rows), len(payload), fetch_seconds, convert_seconds)
+        if self.pg_conn is not None and rows:
+            try:
+                sample.load_seconds = self._trial_copy(table_name, columns, payload)
+            except Exception as e:
+                logger.warning(f"Trial COPY of {table_name} failed: {e}")
+                self.pg_conn.rollback()
+        return sample
+    
+    def _trial_copy(self, table_name: str, columns: List[Any], payload: bytes) -> float:
+        """
+        COPY encoded rows into a temporary table shaped like the converted
+        table, then roll it back.
+        
+        Returns:
+            Seconds spent in the COPY
+        """
+        staging = f'_eta_{table_name}'[:63]
+        col_defs = ', '.join(
+            f'"{col[0]}" {self.type_mapper.map_type(col[1], col[2], col[3], col[4])}'
+            for col in columns
+        )
+        try:
+            self.pg_conn.cursor.execute(f'CREATE TEMP TABLE "{staging}" ({col_defs})')
+            started = time.monotonic()
+            self.pg_conn.cursor.copy_expert(
+                pg_copy.copy_statement('pg_temp', staging, [col[0] for col in columns]),
+                io.BytesIO(payload)
+            )
+            return time.monotonic() - started
+        finally:
+            self.pg_conn.rollback()
+    
+    def estimate(self, tables: Dict[str, Tuple[List[Any], int]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Estimate the transfer size and duration of tables.
+        
+        Args:
+            tables: Mapping of table name to (TableMetadata.columns, row count)
+        
+        Returns:
+            Mapping of table name to a dict with 'row_bytes', 'bytes' and
+            'seconds' (None for tables that could not be sampled), in the
+            order of tables
+        """
+        samples = {}
+        for table_name, (columns, num_rows) in tables.items():
+            if not num_rows:
+                continue
+            try:
+                samples[table_name] = self.sample_table(table_name, columns, num_rows)
+            except Exception as e:
+                logger.warning(f"Could not sample {table_name}: {e}")
+        
+        # Tables without a trial COPY use the load cost per byte of the others
+        loaded = [s for s in samples.values() if s.load_seconds is not None and s.encoded_bytes]
+        load_per_byte = (sum(s.load_seconds for s in loaded) / sum(s.encoded_bytes for s in loaded)
+                         if loaded else 0.0)
+        
+        estimates = {}
+        for table_name, (_, num_rows) in tables.items():
+            sample = samples.get(table_name)
+            if not num_rows:
+                estimates[table_name] = {'row_bytes': 0.0, 'bytes': 0, 'seconds': 0.0}
+            elif sample is None or not sample.rows:
+                estimates[table_name] = {'row_bytes': None, 'bytes': None, 'seconds': None}
+            else:
+                estimates[table_name] = {
+                    'row_bytes': sample.row_bytes,
+                    'bytes': int(sample.row_bytes * num_rows),
+                    'seconds': sample.seconds_per_row(load_per_byte * sample.row_bytes) * num_rows,
+                }
+        return estimates
+
+
+def schedule_eta(durations: Dict[str, float], workers: int) -> Tuple[float, Optional[str]]:
+    """
+    Simulate migrating tables on a worker pool, longest table first, each
+    worker taking the next table as soon as it is free.
+    
+    Args:
+        durations: Estimated seconds per table
+        workers: Number of tables migrated concurrently
+    
+    Returns:
+        Tuple of (wall-clock seconds, table finishing last), the latter None
+        when there are no tables
+    """
+    finish_times = [(0.0, i) for i in range(max(1, workers))]
+    wall_seconds = 0.0
+    critical_table = None
+    for table_name in sorted(durations, key=lambda t: durations[t], reverse=True):
+        free_at, worker = heapq.heappop(finish_times)
+        done_at = free_at + durations[table_name]
+        heapq.heappush(finish_times, (done_at, worker))
+        if critical_table is None or done_at > wall_seconds:
+            wall_seconds = done_at
+            critical_table = table_name
+    return wall_seconds, critical_table
+
+
+def format_duration(seconds: float) -> str:
+    """Format seconds as e.g. '45s', '12m 05s' or '3h 20m'."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    if seconds < 3600:
+        return f"{seconds // 60}m {seconds % 60:02d}s"
+    return f"{seconds // 3600}h {seconds % 3600 // 60:02d}m"
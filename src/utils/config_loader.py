@@ -2,7 +2,8 @@
 
 import yaml
 import os
-from typing import Dict, Any
+import threading
+from typing import Dict, Any, Optional
 from pathlib import Path
 import logging
 
@@ -24,12 +25,15 @@ def load_config(config_path: str) -> Dict[str, Any]:
         raise
 
 
-def get_db_connections(config: Dict[str, Any]) -> tuple:
+def get_db_connections(config: Dict[str, Any],
+                       pools: Optional['ConnectionPools'] = None) -> tuple:
     """
     Create Oracle and PostgreSQL connections from config.
     
     Args:
         config: Configuration dictionary containing 'oracle' and 'postgresql' sections
+        pools: Optional pool manager the connectors (and their clones)
+            borrow connections from instead of opening their own
         
     Returns:
         tuple: (OracleConnector, PostgreSQLConnector) instances
@@ -39,16 +43,20 @@ def get_db_connections(config: Dict[str, Any]) -> tuple:
         ValueError: If configuration values are invalid
     """
     from src.migration.db_connector import OracleConnector, PostgreSQLConnector
+    from src.migration.metadata_cache import MetadataCache
     
     # Oracle connection
     oracle_config = config.get('oracle', {})
+    migration_config = config.get('migration') or {}
     oracle_conn = OracleConnector(
         host=oracle_config.get('host') or os.getenv('ORACLE_HOST'),
         port=oracle_config.get('port') or int(os.getenv('ORACLE_PORT', 1521)),
         service_name=oracle_config.get('service_name') or os.getenv('ORACLE_SERVICE_NAME'),
         username=oracle_config.get('username') or os.getenv('ORACLE_USERNAME'),
         password=oracle_config.get('password') or os.getenv('ORACLE_PASSWORD'),
-        schema=oracle_config.get('schema') or os.getenv('ORACLE_SCHEMA')
+        schema=oracle_config.get('schema') or os.getenv('ORACLE_SCHEMA'),
+        arraysize=migration_config.get('fetch_arraysize'),
+        prefetchrows=migration_config.get('prefetch_rows')
     )
     
     # PostgreSQL connection
@@ -62,5 +70,122 @@ def get_db_connections(config: Dict[str, Any]) -> tuple:
         schema=pg_config.get('schema') or os.getenv('PG_SCHEMA', 'public')
     )
     
+    oracle_conn.pools = pools
+    pg_conn.pools = pools
+    
+    # Schema metadata cache (disabled with an empty metadata_cache_dir)
+    cache_dir = migration_config.get('metadata_cache_dir', 'metadata_cache')
+    if cache_dir:
+        oracle_conn.metadata_cache = MetadataCache(
+            cache_dir, refresh=bool(migration_config.get('refresh_metadata', False))
+        )
+    
     return oracle_conn, pg_conn
 
+
+class ConnectionPools:
+    """
+    Oracle and PostgreSQL connection pools shared by the agents of a run.
+    
+    A pool is created on first use for each distinct set of connection
+    settings, sized from the config's 'pool' section (min, max, increment).
+    Connectors given this manager borrow a connection when they connect and
+    return it when they disconnect. When a pool has no free connection, a
+    standalone connection is opened instead, so parallel modes needing more
+    sessions than the pool holds do not wait on each other.
+    """
+    
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        pool_config = (config or {}).get('pool') or {}
+        self.min_size = pool_config.get('min', 1)
+        self.max_size = max(self.min_size, pool_config.get('max', 8))
+        self.increment = pool_config.get('increment', 1)
+        self.borrowed = 0
+        self.overflow = 0
+        self._oracle_pools: Dict[tuple, Any] = {}
+        self._pg_pools: Dict[tuple, Any] = {}
+        self._pg_borrowed: Dict[int, Any] = {}
+        self._lock = threading.Lock()
+    
+    def acquire_oracle(self, connector):
+        """Borrow an Oracle connection for an OracleConnector; closing it returns it."""
+        import oracledb
+        
+        dsn = oracledb.makedsn(connector.host, connector.port, service_name=connector.service_name)
+        key = (dsn, connector.username)
+        with self._lock:
+            pool = self._oracle_pools.get(key)
+            if pool is None:
+                pool = oracledb.create_pool(
+                    user=connector.username, password=connector.password, dsn=dsn,
+                    min=self.min_size, max=self.max_size, increment=self.increment,
+                    getmode=oracledb.POOL_GETMODE_NOWAIT
+                )
+                self._oracle_pools[key] = pool
+                logger.info(f"Created Oracle connection pool ({self.min_size}-{self.max_size}) "
+                            f"for {connector.service_name}")
+        try:
+            connection = pool.acquire()
+        except oracledb.Error as e:
+            logger.debug(f"Oracle pool exhausted, opening a standalone connection: {e}")
+            with self._lock:
+                self.overflow += 1
+            return oracledb.connect(user=connector.username, password=connector.password, dsn=dsn)
+        with self._lock:
+            self.borrowed += 1
+        return connection
+    
+    def acquire_postgresql(self, connector):
+        """Borrow a PostgreSQL connection for a PostgreSQLConnector."""
+        import psycopg2
+        from psycopg2 import pool as pg_pool
+        
+        settings = dict(host=connector.host, port=connector.port, database=connector.database,
+                        user=connector.username, password=connector.password)
+        key = (connector.host, connector.port, connector.database, connector.username)
+        with self._lock:
+            pool = self._pg_pools.get(key)
+            if pool is None:
+                pool = pg_pool.ThreadedConnectionPool(self.min_size, self.max_size, **settings)
+                self._pg_pools[key] = pool
+                logger.info(f"Created PostgreSQL connection pool ({self.min_size}-{self.max_size}) "
+                            f"for {connector.database}")
+        try:
+            connection = pool.getconn()
+        except pg_pool.PoolError as e:
+            logger.debug(f"PostgreSQL pool exhausted, opening a standalone connection: {e}")
+            with self._lock:
+                self.overflow += 1
+            return psycopg2.connect(**settings)
+        with self._lock:
+            self.borrowed += 1
+            self._pg_borrowed[id(connection)] = pool
+        return connection
+    
+    def release_postgresql(self, connection):
+        """Return a connection from acquire_postgresql (standalone ones are closed)."""
+        with self._lock:
+            pool = self._pg_borrowed.pop(id(connection), None)
+        if pool is not None:
+            # putconn rolls back an open transaction before the connection is reused
+            pool.putconn(connection)
+        else:
+            connection.close()
+    
+    def close(self):
+        """Close all pools."""
+        with self._lock:
+            for pool in self._oracle_pools.values():
+                try:
+                    pool.close(force=True)
+                except Exception as e:
+                    logger.warning(f"Error closing Oracle connection pool: {e}")
+            for pool in self._pg_pools.values():
+                pool.closeall()
+            if self._oracle_pools or self._pg_pools:
+                logger.info(f"Closed connection pools: {self.borrowed} connections borrowed, "
+                            f"{self.overflow} opened outside the pools")
+            self._oracle_pools.clear()
+            self._pg_pools.clear()
+            self._pg_borrowed.clear()
+
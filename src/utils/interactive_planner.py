@@ -13,11 +13,23 @@ logger = logging.getLogger(__name__)
 class InteractivePlanner:
     """Handles interactive user input collection and migration planning."""
     
-    def __init__(self):
+    def __init__(self, refresh_metadata: bool = False, workers: int = None):
+        """
+        Args:
+            refresh_metadata: Re-read table metadata cached by earlier runs
+            workers: Number of tables the migration will run concurrently,
+                used for the duration estimate (default: 1)
+        """
+        from src.utils.config_loader import ConnectionPools
+        
+        self.refresh_metadata = refresh_metadata
+        self.workers = max(1, workers or 1)
         self.oracle_config = {}
         self.pg_config = {}
         self.selected_tables = []
         self.migration_plan = {}
+        # Validation, discovery and planning reuse the same sessions
+        self.pools = ConnectionPools()
     
     def collect_connection_details(self) -> Dict[str, Any]:
         """
@@ -63,6 +75,8 @@ class InteractivePlanner:
             'oracle': self.oracle_config,
             'postgresql': self.pg_config
         }
+        if self.refresh_metadata:
+            config['migration'] = {'refresh_metadata': True}
         
         return config
     
@@ -81,7 +95,7 @@ class InteractivePlanner:
         print("\n--- Validating Connections ---")
         
         try:
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, self.pools)
             
             # Test Oracle connection
             print("Testing Oracle connection...", end=" ")
@@ -120,7 +134,7 @@ class InteractivePlanner:
         print("\n--- Discovering Schema ---")
         
         try:
-            oracle_conn, _ = get_db_connections(config)
+            oracle_conn, _ = get_db_connections(config, self.pools)
             oracle_conn.connect()
             
             try:
@@ -213,7 +227,7 @@ class InteractivePlanner:
         print("Analyzing schema and estimating migration complexity...\n")
         
         try:
-            oracle_conn, pg_conn = get_db_connections(config)
+            oracle_conn, pg_conn = get_db_connections(config, self.pools)
             oracle_conn.connect()
             
             try:
@@ -233,47 +247,66 @@ class InteractivePlanner:
                     'summary': {
                         'total_tables': len(tables),
                         'total_rows': 0,
-                        'estimated_complexity': 'Medium'
+                        'total_bytes': 0,
+                        'estimated_complexity': 'Medium',
+                        'workers': self.workers,
+                        'transfer_bytes': 0,
+                        'estimated_seconds': None,
+                        'critical_table': None
                     },
                     'warnings': []
                 }
                 
+                catalog = oracle_conn.load_catalog(tables)
+                # Row counts and sizes from optimizer statistics, in one query
+                stats = oracle_conn.get_table_stats(tables)
+                table_columns = {}
+                
                 # Analyze each table
                 for table in tables:
                     try:
-                        # Get row count
-                        count_query = f"SELECT COUNT(*) FROM {table}"
-                        result = oracle_conn.execute_query(count_query)
-                        row_count = result[0][0] if result else 0
+                        # Get row count (exact only for tables without statistics)
+                        table_stats = stats.get(table) or {}
+                        row_count = table_stats.get('num_rows')
+                        if row_count is None:
+                            row_count = oracle_conn.get_row_count(table)
+                            plan['warnings'].append(
+                                f"No optimizer statistics for {table}; rows counted exactly")
                         
-                        # Get column info
-                        columns_query = f"""
-                            SELECT column_name, data_type, data_length, nullable
-                            FROM all_tab_columns
-                            WHERE table_name = :1 AND owner = :2
-                            ORDER BY column_id
-                        """
-                        columns = oracle_conn.execute_query(
-                            columns_query, 
-                            (table, oracle_conn.schema)
-                        )
+                        # Get column info (name, type, length, nullable)
+                        metadata = catalog.get(table) or oracle_conn.get_table_metadata(table)
+                        columns = [(col[0], col[1], col[2], col[5]) for col in metadata.columns]
                         
                         table_info = {
                             'name': table,
                             'row_count': row_count,
+                            'size_bytes': table_stats.get('bytes', 0),
                             'column_count': len(columns) if columns else 0,
-                            'columns': columns[:5] if columns else []  # Sample first 5 columns
+                            'columns': columns[:5] if columns else [],  # Sample first 5 columns
+                            'estimated_seconds': None
                         }
                         
                         plan['tables'].append(table_info)
+                        table_columns[table] = metadata.columns
                         plan['summary']['total_rows'] += row_count
+                        plan['summary']['total_bytes'] += table_stats.get('bytes', 0)
                         
                     except Exception as e:
                         logger.warning(f"Could not analyze table {table}: {e}")
                         plan['warnings'].append(f"Could not fully analyze table {table}")
                 
+                self._estimate_duration(plan, table_columns, oracle_conn, pg_conn)
+                
                 # Estimate complexity
-                if plan['summary']['total_rows'] > 1000000:
+                estimated_seconds = plan['summary']['estimated_seconds']
+                if estimated_seconds is not None:
+                    if estimated_seconds > 3600:
+                        plan['summary']['estimated_complexity'] = 'High'
+                    elif estimated_seconds > 600:
+                        plan['summary']['estimated_complexity'] = 'Medium'
+                    else:
+                        plan['summary']['estimated_complexity'] = 'Low'
+                elif plan['summary']['total_rows'] > 1000000:
                     plan['summary']['estimated_complexity'] = 'High'
                 elif plan['summary']['total_rows'] > 100000:
                     plan['summary']['estimated_complexity'] = 'Medium'
@@ -308,6 +341,52 @@ class InteractivePlanner:
             logger.error(f"Failed to generate migration plan: {e}")
             raise
     
+    def _estimate_duration(self, plan: Dict[str, Any], table_columns: Dict[str, List[tuple]],
+                           oracle_conn, pg_conn) -> None:
+        """
+        Sample every planned table to estimate its duration, and the
+        wall-clock time of the migration on the planned number of workers.
+        
+        Args:
+            plan: Migration plan being generated, updated in place
+            table_columns: TableMetadata.columns of each planned table
+            oracle_conn: Connected source connection
+            pg_conn: Target connection for trial COPYs (connected here)
+        """
+        from src.migration.throughput import ThroughputEstimator, schedule_eta
+        
+        print("Sampling tables to estimate throughput...")
+        try:
+            pg_conn.connect()
+        except Exception as e:
+            logger.warning(f"No trial COPY, PostgreSQL connection failed: {e}")
+            pg_conn = None
+        
+        try:
+            estimator = ThroughputEstimator(oracle_conn, pg_conn)
+            estimates = estimator.estimate({
+                t['name']: (table_columns[t['name']], t['row_count']) for t in plan['tables']
+            })
+        finally:
+            if pg_conn is not None:
+                pg_conn.disconnect()
+        
+        durations = {}
+        for table_info in plan['tables']:
+            estimate = estimates[table_info['name']]
+            table_info['estimated_seconds'] = estimate['seconds']
+            plan['summary']['transfer_bytes'] += estimate['bytes'] or 0
+            if estimate['seconds'] is None:
+                plan['warnings'].append(f"Could not sample {table_info['name']}; "
+                                        f"it is left out of the duration estimate")
+            else:
+                durations[table_info['name']] = estimate['seconds']
+        
+        if durations:
+            wall_seconds, critical_table = schedule_eta(durations, self.workers)
+            plan['summary']['estimated_seconds'] = wall_seconds
+            plan['summary']['critical_table'] = critical_table
+    
     def display_plan(self, plan: Dict[str, Any]) -> None:
         """
         Display migration plan to user.
@@ -315,6 +394,8 @@ class InteractivePlanner:
         Args:
             plan: Migration plan dictionary
         """
+        from src.migration.throughput import format_duration
+        
         print("\n" + "="*70)
         print("  MIGRATION PLAN")
         print("="*70)
@@ -335,17 +416,28 @@ class InteractivePlanner:
         print("\n--- Migration Summary ---")
         print(f"  Tables to migrate:     {plan['summary']['total_tables']}")
         print(f"  Total rows (approx):   {plan['summary']['total_rows']:,}")
+        print(f"  Total size (approx):   {plan['summary']['total_bytes'] / 1048576:,.1f} MB")
         print(f"  Estimated complexity:  {plan['summary']['estimated_complexity']}")
+        if plan['summary'].get('estimated_seconds') is not None:
+            print(f"  COPY volume (approx):  {plan['summary']['transfer_bytes'] / 1048576:,.1f} MB")
+            critical = next(t for t in plan['tables']
+                            if t['name'] == plan['summary']['critical_table'])
+            print(f"  Estimated duration:    {format_duration(plan['summary']['estimated_seconds'])} "
+                  f"with {plan['summary']['workers']} worker(s)")
+            print(f"  Critical path table:   {critical['name']} "
+                  f"({format_duration(critical['estimated_seconds'])})")
         
         # Tables
         print("\n--- Tables ---")
         table_data = [
-            [i+1, t['name'], f"{t['row_count']:,}", t['column_count']]
+            [i+1, t['name'], f"{t['row_count']:,}", f"{t['size_bytes'] / 1048576:,.1f}",
+             t['column_count'],
+             format_duration(t['estimated_seconds']) if t.get('estimated_seconds') is not None else '-']
             for i, t in enumerate(plan['tables'])
         ]
         print(tabulate(
             table_data,
-            headers=['#', 'Table Name', 'Rows', 'Columns'],
+            headers=['#', 'Table Name', 'Rows', 'Size (MB)', 'Columns', 'Est. Time'],
             tablefmt='simple'
         ))
         
@@ -437,12 +529,20 @@ class InteractivePlanner:
             return None, None
 
 
-def run_interactive_mode() -> Tuple[Optional[Dict[str, Any]], Optional[List[str]]]:
+def run_interactive_mode(refresh_metadata: bool = False,
+                         workers: int = None) -> Tuple[Optional[Dict[str, Any]], Optional[List[str]]]:
     """
     Convenience function to run interactive mode.
     
+    Args:
+        refresh_metadata: Re-read table metadata cached by earlier runs
+        workers: Number of tables migrated concurrently, for the estimate
+    
     Returns:
         Tuple of (config, selected_tables) if approved, (None, None) if cancelled
     """
-    planner = InteractivePlanner()
-    return planner.run_interactive_mode()
+    planner = InteractivePlanner(refresh_metadata, workers)
+    try:
+        return planner.run_interactive_mode()
+    finally:
+        planner.pools.close()
@@ -325,16 +325,19 @@ def execute_plan(plan: NLPlan, config_path: str = "config/config.yaml") -> List[
 
     results: List[Dict[str, Any]] = []
 
-    for task in plan.tasks:
-        payload: Dict[str, Any] = {
-            "type": task.type,
-            "config": config,
-        }
-        payload.update(task.options or {})
-
-        logger.info(f"Executing planned task: {task.type}")
-        result = router.execute_task(payload)
-        results.append(result)
+    try:
+        for task in plan.tasks:
+            payload: Dict[str, Any] = {
+                "type": task.type,
+                "config": config,
+            }
+            payload.update(task.options or {})
+
+            logger.info(f"Executing planned task: {task.type}")
+            result = router.execute_task(payload)
+            results.append(result)
+    finally:
+        router.close()
 
     return results
 
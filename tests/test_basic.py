@@ -250,6 +250,1066 @@ def test_query_agent_validation():
         return False
 
 
+def test_copy_encoding():
+    """Test COPY text and binary encoders."""
+    print("\nTesting COPY encoding...")
+    
+    try:
+        import struct
+        from datetime import datetime
+        from decimal import Decimal
+        from src.migration import pg_copy
+        
+        row = (1, None, 'a\tb\\c', b'\x01\xff', True, datetime(2024, 1, 2, 3, 4, 5))
+        assert pg_copy.encode_text_rows([row]) == \
+            b'1\t\\N\ta\\tb\\\\c\t\\\\x01ff\tt\t2024-01-02T03:04:05\n'
+        print("  ✓ Text format escaping correct")
+        
+        assert pg_copy._encode_numeric(Decimal('12345.678')) == \
+            struct.pack('!hhHh3h', 3, 1, 0, 3, 1, 2345, 6780)
+        assert pg_copy._encode_numeric(Decimal('-0.00012')) == \
+            struct.pack('!hhHh2h', 2, -1, 0x4000, 5, 1, 2000)
+        print("  ✓ Binary NUMERIC encoding correct")
+        
+        data = pg_copy.encode_binary_rows([(7, None)], ['int4', 'text'])
+        assert data.startswith(pg_copy.BINARY_HEADER)
+        assert data.endswith(pg_copy.BINARY_TRAILER)
+        assert struct.pack('!hi', 2, 4) + struct.pack('!i', 7) + struct.pack('!i', -1) in data
+        print("  ✓ Binary row framing correct")
+        
+        try:
+            pg_copy.encode_binary_rows([('x',)], ['int4'])
+            return False
+        except TypeError:
+            print("  ✓ Unencodable value raises TypeError")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ COPY encoding test failed: {e}")
+        return False
+
+
+def test_checkpoint_keys():
+    """Test checkpoint key serialization and keyset predicates."""
+    print("\nTesting checkpoint keys...")
+    
+    try:
+        from datetime import datetime
+        from decimal import Decimal
+        from src.migration.checkpoint import encode_key, decode_key
+        from src.migration.data_migrator import _TableJob
+        
+        key = [42, 'abc', Decimal('1.50'), datetime(2024, 1, 2, 3, 4, 5), b'\x00\x01']
+        assert decode_key(encode_key(key)) == key
+        assert decode_key(encode_key(None)) is None
+        print("  ✓ Key values round-trip")
+        
+        job = _TableJob('T', ['A', 'B'])
+        job.key_exprs = ['"A"', '"B"']
+        job.key_binds = [':k0', ':k1']
+        assert job.keyset_predicate() == '(("A" > :k0) OR ("A" = :k0 AND "B" > :k1))'
+        print("  ✓ Composite keyset predicate correct")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Checkpoint key test failed: {e}")
+        return False
+
+
+def test_row_converter():
+    """Test compiled row converters."""
+    print("\nTesting row converter...")
+    
+    try:
+        from datetime import datetime, timezone
+        import oracledb
+        from src.migration.row_converter import compile_row_converter, select_expression
+        
+        assert compile_row_converter(['NUMBER', 'VARCHAR2']) is None
+        assert compile_row_converter(['NUMBER'], row_width=2)((1, 'AAAB')) == (1,)
+        print("  ✓ Pass-through tables need no conversion")
+        
+        convert = compile_row_converter(
+            ['NUMBER', 'TIMESTAMP(6) WITH TIME ZONE', 'INTERVAL YEAR(2) TO MONTH', 'CLOB']
+        )
+        row = (1, datetime(2024, 1, 2, 3, 4, 5), oracledb.IntervalYM(1, 2), 'text')
+        assert convert(row) == (1, datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+                                '1 years 2 months', 'text')
+        assert convert((None, None, None, None)) == (None, None, None, None)
+        assert select_expression('TS', 'TIMESTAMP(6) WITH TIME ZONE') == \
+            'SYS_EXTRACT_UTC("TS") AS "TS"'
+        print("  ✓ Conversions applied to LOB, interval and TZ timestamp columns")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Row converter test failed: {e}")
+        return False
+
+
+def test_columnar_encoding():
+    """Test that the columnar COPY encoder matches the row encoder."""
+    print("\nTesting columnar encoding...")
+    
+    try:
+        from src.migration import arrow_copy, pg_copy
+        if not arrow_copy.available():
+            print("  - pyarrow not installed, skipping")
+            return True
+        import pyarrow as pa
+        from datetime import datetime
+        
+        batch = pa.record_batch([
+            pa.array([1, None, 3], pa.int64()),
+            pa.array([1.5, 2.5, None]),
+            pa.array(['a', None, 'b\tc'], pa.string()),
+            pa.array([datetime(2024, 1, 2, 3, 4, 5), None, datetime(1990, 5, 6)],
+                     pa.timestamp('s')),
+        ], names=['a', 'b', 'c', 'd'])
+        types = ['int8', 'float8', 'varchar', 'timestamp']
+        rows = arrow_copy.to_rows(batch)
+        assert arrow_copy.encode_record_batch(batch, types) == \
+            pg_copy.encode_binary_rows(rows, types)
+        print("  ✓ Columnar output identical to row output")
+        
+        from decimal import Decimal
+        numbers = pa.record_batch([
+            pa.array([Decimal('12345.6789'), Decimal('-0.0001'), None, Decimal('0'),
+                      Decimal('99999999999999999999999999999999.999999')], pa.decimal128(38, 6)),
+            pa.array([10**18, -5, None, 0, 7], pa.int64()),
+        ], names=['a', 'b'])
+        rows = arrow_copy.to_rows(numbers)
+        assert arrow_copy.supports(['numeric'])
+        assert arrow_copy.encode_record_batch(numbers, ['numeric', 'numeric']) == \
+            pg_copy.encode_binary_rows(rows, ['numeric', 'numeric'])
+        print("  ✓ Decimal and integer columns encoded as NUMERIC")
+        
+        try:
+            arrow_copy.encode_record_batch(pa.record_batch([pa.array([70000])], names=['x']),
+                                           ['int2'])
+            return False
+        except TypeError:
+            print("  ✓ Out-of-range value raises TypeError")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Columnar encoding test failed: {e}")
+        return False
+
+
+def test_adaptive_batch_size():
+    """Test adaptive batch sizing towards byte and time targets."""
+    print("\nTesting adaptive batch size...")
+    
+    try:
+        from src.migration.batch_sizer import AdaptiveBatchSizer, estimate_row_bytes
+        
+        assert estimate_row_bytes([(1, 'abcd', None, b'xy')] * 100) == 14
+        print("  ✓ Row size estimated from a sample")
+        
+        sizer = AdaptiveBatchSizer(1000, 100, 50000, target_bytes=1000000, target_seconds=1.0)
+        assert sizer.record(1000, 100000, 0.01) == 2000  # growth limited to 2x
+        assert sizer.record(2000, 200000, 0.02) == 4000
+        assert sizer.record(4000, 4000000, 0.04) == 1000  # 1 KB rows: shrink at once
+        assert sizer.record(1000, 1000000, 50.0) == 100  # slow loads, clamped to min
+        print("  ✓ Batch size grows, shrinks and stays within bounds")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Adaptive batch size test failed: {e}")
+        return False
+
+
+def test_rejected_rows():
+    """Test row error classification and dead-letter files."""
+    print("\nTesting rejected rows...")
+    
+    try:
+        import json
+        import os
+        import tempfile
+        from datetime import date
+        import psycopg2
+        from src.migration.db_connector import is_row_error
+        from src.migration.dead_letter import DeadLetterWriter
+        
+        assert is_row_error(psycopg2.DataError('bad value'))
+        assert is_row_error(TypeError('cannot encode'))
+        assert not is_row_error(psycopg2.OperationalError('connection lost'))
+        print("  ✓ Row errors distinguished from connection errors")
+        
+        with tempfile.TemporaryDirectory() as directory:
+            writer = DeadLetterWriter(directory)
+            writer.write('T', ['ID', 'D'], [((1, date(2024, 1, 2)), 'bad value')])
+            with open(writer.path('T')) as f:
+                record = json.loads(f.readline())
+            assert record['row'] == {'ID': 1, 'D': {'date': '2024-01-02'}}
+            assert record['error'] == 'bad value'
+            writer.reset('T')
+            assert not os.path.exists(writer.path('T'))
+        print("  ✓ Rejected rows written to the dead-letter file")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Rejected rows test failed: {e}")
+        return False
+
+
+def test_catalog_loader():
+    """Test bulk catalog loading and foreign key dependency order."""
+    print("\nTesting bulk catalog loader...")
+    
+    try:
+        from src.migration.catalog import TableMetadata, foreign_key_order, table_filter_chunks
+        from src.migration.db_connector import OracleConnector
+        
+        class CannedOracle(OracleConnector):
+            def __init__(self):
+                super().__init__('localhost', 1521, 'XE', 'user', 'pass')
+                self.queries = []
+            
+            def execute_query(self, query, params=None):
+                self.queries.append(params)
+                if 'all_tab_columns' in query:
+                    return [('A', 'ID', 'NUMBER', 22, 10, 0, 'N', None),
+                            ('B', 'ID', 'NUMBER', 22, 10, 0, 'N', None),
+                            ('B', 'A_ID', 'NUMBER', 22, 10, 0, 'Y', None)]
+                if "constraint_type = 'P'" in query:
+                    return [('A', 'ID'), ('B', 'ID')]
+                if "constraint_type = 'R'" in query:
+                    return [('B', 'FK_A', 'A_ID', 'USER', 'A_PK', 'ID', 'A', 'CASCADE')]
+                return [('B', 'B_A_IDX', 'A_ID', 1, 'NONUNIQUE')]
+        
+        oracle = CannedOracle()
+        catalog = oracle.load_catalog(['A', 'B'])
+        assert len(oracle.queries) == 4
+        assert oracle.queries[0] == {'schema': 'USER', 't0': 'A', 't1': 'B'}
+        assert [col[0] for col in catalog['B'].columns] == ['ID', 'A_ID']
+        assert catalog['A'].primary_keys == ['ID']
+        assert catalog['B'].foreign_keys[0][5] == 'A'
+        assert catalog['B'].indexes == [('B_A_IDX', 'A_ID', 1, 'NONUNIQUE')]
+        assert not catalog['A'].foreign_keys
+        print("  ✓ Catalog rows grouped by table in four queries")
+        
+        def fk(ref_table):
+            return ('FK', 'ID', 'USER', 'PK', 'ID', ref_table, 'NO ACTION')
+        
+        graph = {
+            'ORDERS': TableMetadata('ORDERS', foreign_keys=[fk('CUSTOMERS'), fk('ORDERS')]),
+            'CUSTOMERS': TableMetadata('CUSTOMERS'),
+            'A': TableMetadata('A', foreign_keys=[fk('B')]),
+            'B': TableMetadata('B', foreign_keys=[fk('A')]),
+            'C': TableMetadata('C', foreign_keys=[fk('OTHER_SCHEMA_TABLE')]),
+        }
+        ordered, cyclic = foreign_key_order(graph, ['ORDERS', 'A', 'B', 'CUSTOMERS', 'C'])
+        assert ordered == ['CUSTOMERS', 'C', 'ORDERS'] and cyclic == ['A', 'B']
+        print("  ✓ Foreign keys ordered by dependency, cycles last")
+        
+        assert [len(c) for c in table_filter_chunks(['T'] * 2500)] == [1000, 1000, 500]
+        assert table_filter_chunks(None) == [None]
+        print("  ✓ Table filters split into IN lists of 1000 names")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Catalog loader test failed: {e}")
+        return False
+
+
+def test_metadata_cache():
+    """Test metadata cache hits, DDL invalidation and refresh."""
+    print("\nTesting metadata cache...")
+    
+    try:
+        import tempfile
+        from src.migration.catalog import TableMetadata
+        from src.migration.metadata_cache import MetadataCache
+        
+        with tempfile.TemporaryDirectory() as directory:
+            cache = MetadataCache(directory)
+            metadata = TableMetadata('A', columns=[('ID', 'NUMBER', 22, 10, 0, 'N', None)],
+                                     primary_keys=['ID'])
+            cache.put('db_USER', {'A': metadata}, {'A': 'v1'})
+            
+            cached, stale = cache.get('db_USER', {'A': 'v1', 'B': 'v1'})
+            assert cached['A'] == metadata and stale == ['B']
+            _, stale = cache.get('db_USER', {'A': 'v2'})
+            assert stale == ['A']
+            assert cache.summary() == {'hits': 1, 'misses': 2}
+            print("  ✓ Entries reused until the table DDL changes")
+            
+            _, stale = MetadataCache(directory, refresh=True).get('db_USER', {'A': 'v1'})
+            assert stale == []  # written by this process, so already refreshed
+            print("  ✓ Refresh keeps entries written by the current run")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Metadata cache test failed: {e}")
+        return False
+
+
+def test_sync_query():
+    """Test change marker selection and incremental sync queries."""
+    print("\nTesting incremental sync queries...")
+    
+    try:
+        from datetime import datetime
+        from src.migration.data_sync import DataSynchronizer
+        from src.migration.db_connector import OracleConnector, PostgreSQLConnector
+        
+        oracle = OracleConnector('localhost', 1521, 'XE', 'user', 'pass', 'APP')
+        pg = PostgreSQLConnector('localhost', 5432, 'db', 'user', 'pass')
+        columns = [('ID', 'NUMBER', 22, 10, 0, 'N', None), ('UPDATED', 'DATE', 7, None, None, 'Y', None)]
+        
+        synchronizer = DataSynchronizer(oracle, pg, sync_column='updated',
+                                        sync_columns={'audit': 'ORA_ROWSCN'})
+        assert synchronizer._sync_column('ORDERS', ['ID', 'UPDATED']) == 'UPDATED'
+        assert synchronizer._sync_column('ITEMS', ['ID']) == 'ORA_ROWSCN'
+        assert synchronizer._sync_column('AUDIT', ['ID', 'UPDATED']) == 'ORA_ROWSCN'
+        print("  ✓ Change-tracking column chosen per table")
+        
+        query, params = synchronizer._select_query('ORDERS', columns, 'ORA_ROWSCN', 1234)
+        assert query.endswith('WHERE ORA_ROWSCN > :watermark') and params == {'watermark': 1234}
+        query, params = synchronizer._select_query('ORDERS', columns, 'UPDATED', None)
+        assert 'WHERE' not in query and not params
+        synchronizer.since = '2024-01-02T03:04:05'
+        assert synchronizer._initial_watermark('UPDATED') == datetime(2024, 1, 2, 3, 4, 5)
+        print("  ✓ Rows selected above the watermark")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Incremental sync test failed: {e}")
+        return False
+
+
+def test_ddl_script():
+    """Test offline DDL script sections and their order."""
+    print("\nTesting DDL script generation...")
+    
+    try:
+        import os
+        import tempfile
+        from src.migration.catalog import TableMetadata
+        from src.migration.db_connector import OracleConnector, PostgreSQLConnector
+        from src.migration.schema_converter import SchemaConverter, split_ddl_sections
+        
+        catalog = {
+            'ORDERS': TableMetadata(
+                'ORDERS',
+                columns=[('ID', 'NUMBER', 22, 10, 0, 'N', None),
+                         ('CUSTOMER_ID', 'NUMBER', 22, 10, 0, 'Y', None)],
+                primary_keys=['ID'],
+                foreign_keys=[('FK_CUST', 'CUSTOMER_ID', 'APP', 'CUST_PK', 'ID', 'CUSTOMERS', 'CASCADE')],
+                indexes=[('ORDERS_CUST_IDX', 'CUSTOMER_ID', 1, 'NONUNIQUE')]
+            ),
+            'CUSTOMERS': TableMetadata('CUSTOMERS', columns=[('ID', 'NUMBER', 22, 10, 0, 'N', None)],
+                                       primary_keys=['ID']),
+        }
+        
+        class CatalogOracle(OracleConnector):
+            def get_tables(self):
+                return ['ORDERS', 'CUSTOMERS']
+            
+            def load_catalog(self, tables=None):
+                return catalog
+        
+        oracle = CatalogOracle('localhost', 1521, 'XE', 'user', 'pass', 'APP')
+        pg = PostgreSQLConnector('localhost', 5432, 'db', 'user', 'pass')
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'schema.sql')
+            counts = SchemaConverter(oracle, pg).generate_ddl_script(path)
+            with open(path, encoding='utf-8') as f:
+                sections = split_ddl_sections(f.read())
+        
+        assert counts == {'pre-data': 2, 'post-data': 1, 'constraints': 1}
+        assert list(sections) == ['pre-data', 'post-data', 'constraints']
+        assert sections['pre-data'].startswith('CREATE TABLE IF NOT EXISTS "public"."ORDERS"')
+        assert 'PRIMARY KEY ("ID"));' in sections['pre-data']
+        assert '"orders_orders_cust_idx"' in sections['post-data']
+        assert 'REFERENCES "public"."CUSTOMERS" ("ID") ON DELETE CASCADE;' in sections['constraints']
+        print("  ✓ Tables, indexes and foreign keys written to separate sections")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ DDL script test failed: {e}")
+        return False
+
+
+def test_failed_foreign_keys():
+    """Test that tables whose foreign keys could not be added are reported as failed."""
+    print("\nTesting failed foreign keys...")
+    
+    try:
+        from src.migration.catalog import TableMetadata
+        from src.migration.db_connector import OracleConnector, PostgreSQLConnector
+        from src.migration.schema_converter import SchemaConverter
+        
+        catalog = {
+            'ORDERS': TableMetadata(
+                'ORDERS', columns=[('ID', 'NUMBER', 22, 10, 0, 'N', None),
+                                   ('CUSTOMER_ID', 'NUMBER', 22, 10, 0, 'Y', None)],
+                primary_keys=['ID'],
+                foreign_keys=[('FK_CUST', 'CUSTOMER_ID', 'APP', 'CUST_PK', 'ID', 'CUSTOMERS', None)]
+            ),
+            'CUSTOMERS': TableMetadata('CUSTOMERS', columns=[('ID', 'NUMBER', 22, 10, 0, 'N', None)],
+                                       primary_keys=['ID']),
+        }
+        
+        class CatalogOracle(OracleConnector):
+            def get_tables(self):
+                return ['ORDERS', 'CUSTOMERS']
+            
+            def load_catalog(self, tables=None):
+                return catalog
+        
+        class RejectingPG(PostgreSQLConnector):
+            """Rejects foreign keys, as PostgreSQL 17 does NOT VALID ones on partitioned tables."""
+            
+            def __init__(self):
+                super().__init__('localhost', 5432, 'db', 'user', 'pass')
+                self.commands = []
+            
+            def create_table(self, *args, **kwargs):
+                pass
+            
+            def execute_command(self, command, params=None):
+                if 'FOREIGN KEY' in command:
+                    raise Exception('cannot add NOT VALID foreign key on partitioned table')
+                self.commands.append(command)
+            
+            def rollback(self):
+                pass
+        
+        oracle = CatalogOracle('localhost', 1521, 'XE', 'user', 'pass', 'APP')
+        converter = SchemaConverter(oracle, RejectingPG(), defer_constraints=True)
+        assert converter.create_deferred_constraints() == {'ORDERS': False, 'CUSTOMERS': True}
+        print("  ✓ Deferred foreign key failures fail their table")
+        
+        converter = SchemaConverter(oracle, RejectingPG())
+        assert converter.convert_all_tables() == {'ORDERS': False, 'CUSTOMERS': True}
+        assert not converter.convert_table('ORDERS')
+        print("  ✓ Foreign key failures fail their table on conversion")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Failed foreign key test failed: {e}")
+        return False
+
+
+def test_throughput_estimate():
+    """Test sampled throughput estimates and the worker schedule."""
+    print("\nTesting throughput estimates...")
+    
+    try:
+        from src.migration.db_connector import OracleConnector
+        from src.migration.throughput import ThroughputEstimator, format_duration, schedule_eta
+        
+        class SampleCursor:
+            def execute(self, query, params=None):
+                pass
+            
+            def fetchall(self):
+                return [(i, 'x' * 10) for i in range(100)]
+            
+            def close(self):
+                pass
+        
+        class SampleOracle(OracleConnector):
+            def extraction_cursor(self, arraysize, prefetchrows):
+                return SampleCursor()
+        
+        columns = [('ID', 'NUMBER', 22, 10, 0, 'N', None), ('NAME', 'VARCHAR2', 10, None, None, 'Y', None)]
+        estimator = ThroughputEstimator(SampleOracle('localhost', 1521, 'XE', 'user', 'pass', 'APP'),
+                                        sample_rows=100)
+        query, params = estimator.sample_query('T', columns, 1000000)
+        assert 'SAMPLE BLOCK (0.020000)' in query and params == {'sample_rows': 100}
+        assert 'SAMPLE' not in estimator.sample_query('T', columns, 50)[0]
+        
+        estimates = estimator.estimate({'T': (columns, 1000000), 'EMPTY': (columns, 0)})
+        assert estimates['T']['bytes'] > 0 and estimates['T']['seconds'] >= 0
+        assert estimates['EMPTY'] == {'row_bytes': 0.0, 'bytes': 0, 'seconds': 0.0}
+        print("  ✓ Encoded row size measured on sampled rows")
+        
+        assert schedule_eta({'A': 60, 'B': 30, 'C': 30, 'D': 20}, 2) == (80, 'D')
+        assert schedule_eta({'A': 60, 'B': 30}, 4) == (60, 'A')
+        assert format_duration(3725) == '1h 02m' and format_duration(65) == '1m 05s'
+        print("  ✓ Wall-clock time and critical table for a worker count")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Throughput estimate test failed: {e}")
+        return False
+
+
+def test_partitions():
+    """Test partition bound conversion and per-partition extraction queries."""
+    print("\nTesting partitioned tables...")
+    
+    try:
+        from src.migration.data_migrator import DataMigrator, _TableJob
+        from src.migration.db_connector import OracleConnector, PostgreSQLConnector
+        from src.migration.partitions import partition_bounds, split_high_value
+        
+        assert split_high_value("'EU', 'UK', TO_DATE('2024-01-01', 'YYYY-MM-DD')") == \
+            ["'EU'", "'UK'", "TO_DATE('2024-01-01', 'YYYY-MM-DD')"]
+        date_bound = "TO_DATE(' 2024-01-01 00:00:00', 'SYYYY-MM-DD HH24:MI:SS', 'NLS_CALENDAR=GREGORIAN')"
+        assert partition_bounds('RANGE', 1, [('P2023', 1, date_bound, 10), ('PMAX', 2, 'MAXVALUE', 0)]) == [
+            ('P2023', "FOR VALUES FROM (MINVALUE) TO ('2024-01-01 00:00:00')"),
+            ('PMAX', "FOR VALUES FROM ('2024-01-01 00:00:00') TO (MAXVALUE)"),
+        ]
+        assert partition_bounds('LIST', 1, [('P_EU', 1, "'DE', 'FR'", 5), ('P_OTHER', 2, 'DEFAULT', 1)]) == [
+            ('P_EU', "FOR VALUES IN ('DE', 'FR')"), ('P_OTHER', 'DEFAULT')]
+        assert partition_bounds('HASH', 1, [('P1', 1, None, 0), ('P2', 2, None, 0)])[1] == \
+            ('P2', 'FOR VALUES WITH (MODULUS 2, REMAINDER 1)')
+        print("  ✓ Oracle partition bounds converted")
+        
+        class PartitionedOracle(OracleConnector):
+            def get_table_partitions(self, table_name):
+                return [('P1', 1, '10', 100), ('P2', 2, '20', 900), ('P3', 3, 'MAXVALUE', None)]
+        
+        oracle = PartitionedOracle('localhost', 1521, 'XE', 'user', 'pass', 'APP')
+        migrator = DataMigrator(oracle, PostgreSQLConnector('localhost', 5432, 'db', 'user', 'pass'),
+                                partition_workers=2)
+        chunks = migrator._new_chunks('SALES', [])
+        assert [chunk['partition'] for chunk in chunks] == ['P2', 'P1', 'P3']
+        query, _ = migrator._select_query(oracle, _TableJob('SALES', ['ID']), chunks[0], None)
+        assert query == 'SELECT "ID" FROM "APP"."SALES" PARTITION ("P2")'
+        print("  ✓ Partitions extracted separately, largest first")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Partition test failed: {e}")
+        return False
+
+
+def _fake_connectors():
+    """
+    Build in-memory Oracle and PostgreSQL connectors and a checkpoint store
+    for transfer tests: the Oracle side serves key-ordered rows, the
+    PostgreSQL side keeps loaded rows and checkpoints pending until commit.
+    """
+    import psycopg2
+    from src.migration.db_connector import OracleConnector, PostgreSQLConnector
+    
+    class ListCursor:
+        def __init__(self, source):
+            self.source = source
+            self.rows = []
+        
+        def execute(self, query, params=None):
+            params = params or {}
+            self.source.queries.append((query, dict(params)))
+            error = self.source.page_errors.pop(0) if self.source.page_errors else None
+            if error:
+                raise error
+            rows = sorted(self.source.rows)
+            bound = tuple(params[f'k{i}'] for i in range(len(params)) if f'k{i}' in params)
+            if bound:
+                rows = [row for row in rows if row[:len(bound)] > bound]
+            self.rows = rows[:params['page_size']] if 'page_size' in params else rows
+        
+        def fetchmany(self, size):
+            batch, self.rows = self.rows[:size], self.rows[size:]
+            return batch
+        
+        def fetchall(self):
+            return self.fetchmany(len(self.rows))
+        
+        def close(self):
+            pass
+    
+    class ListOracle(OracleConnector):
+        def __init__(self, columns, primary_keys, rows):
+            super().__init__('localhost', 1521, 'XE', 'user', 'pass', 'APP')
+            self.columns = columns
+            self.primary_keys = primary_keys
+            self.rows = rows
+            self.queries = []
+            # Errors raised by successive queries (None to succeed)
+            self.page_errors = []
+            self.connects = 0
+        
+        def connect(self):
+            self.connects += 1
+            self.connection = object()
+        
+        def disconnect(self):
+            self.connection = None
+        
+        def clone(self):
+            return self
+        
+        def round_trips(self):
+            return None
+        
+        def extraction_cursor(self, arraysize, prefetchrows):
+            return ListCursor(self)
+        
+        def get_row_count(self, table_name):
+            return len(self.rows)
+        
+        def get_table_columns(self, table_name):
+            return self.columns
+        
+        def get_primary_keys(self, table_name):
+            return self.primary_keys
+    
+    class TransactionalPG(PostgreSQLConnector):
+        def __init__(self):
+            super().__init__('localhost', 5432, 'db', 'user', 'pass')
+            self.rows = []
+            self.pending = []
+            self.savepoints = []
+            # Returns the exception a batch fails with, or None
+            self.fail_batch = lambda batch: None
+            self.savepoints_broken = False
+            self.failing_commits = 0
+        
+        def connect(self):
+            pass
+        
+        def disconnect(self):
+            pass
+        
+        def clone(self):
+            return self
+        
+        def table_exists(self, table_name):
+            return True
+        
+        def insert_data(self, table_name, columns, data, commit=True):
+            error = self.fail_batch(data)
+            if error:
+                raise error
+            self.pending.append(lambda: self.rows.extend(data))
+        
+        def savepoint(self, name):
+            self.savepoints.append(len(self.pending))
+        
+        def rollback_to_savepoint(self, name):
+            if self.savepoints_broken:
+                raise psycopg2.InterfaceError('connection already closed')
+            self.pending = self.pending[:self.savepoints[-1]]
+        
+        def release_savepoint(self, name):
+            self.savepoints.pop()
+        
+        def commit(self):
+            if self.failing_commits:
+                self.failing_commits -= 1
+                self.rollback()
+                raise psycopg2.OperationalError('could not receive data from server')
+            for apply in self.pending:
+                apply()
+            self.pending = []
+            self.savepoints = []
+        
+        def rollback(self):
+            self.pending = []
+            self.savepoints = []
+    
+    class MemoryCheckpoints:
+        def __init__(self):
+            self.chunks = {}
+        
+        def ensure_table(self, pg_conn):
+            pass
+        
+        def load(self, pg_conn, table_name):
+            return {chunk_id: dict(state) for (table, chunk_id), state in self.chunks.items()
+                    if table == table_name}
+        
+        def reset(self, pg_conn, table_name):
+            self.chunks = {k: v for k, v in self.chunks.items() if k[0] != table_name}
+        
+        def register(self, pg_conn, table_name, chunk_specs):
+            for chunk_id, spec in enumerate(chunk_specs):
+                self.chunks.setdefault((table_name, chunk_id), {
+                    'chunk_spec': spec, 'last_key': None, 'rows_loaded': 0, 'status': 'pending'})
+        
+        def save(self, pg_conn, table_name, chunk_id, last_key, rows_loaded, done=False):
+            def apply():
+                state = self.chunks[(table_name, chunk_id)]
+                if last_key is not None:
+                    state['last_key'] = list(last_key)
+                state.update(rows_loaded=rows_loaded, status='done' if done else 'in_progress')
+            pg_conn.pending.append(apply)
+    
+    return ListOracle, TransactionalPG, MemoryCheckpoints
+
+
+def _checkpointed_migrator(oracle, pg_conn, store, **options):
+    """Create a DataMigrator on fake connectors with checkpoints kept in store."""
+    import tempfile
+    from src.migration.data_migrator import DataMigrator
+    
+    migrator = DataMigrator(oracle, pg_conn, checkpoint=True, row_counts='exact',
+                            dead_letter_dir=tempfile.mkdtemp(), **options)
+    migrator.checkpoints = store
+    return migrator
+
+
+def _segment_oracle(readable_views, schema='APP'):
+    """
+    Build an Oracle connector (user APP) whose statistics query fails with
+    ORA-00942 on segment views other than readable_views.
+    """
+    import oracledb
+    from src.migration.db_connector import OracleConnector
+    
+    class SegmentOracle(OracleConnector):
+        def __init__(self):
+            super().__init__('localhost', 1521, 'XE', 'app', 'pass', schema)
+            self.queries = []
+        
+        def execute_query(self, query, params=None):
+            self.queries.append(query)
+            view = next((v for v in ('all_segments', 'dba_segments', 'user_segments')
+                         if v in query), None)
+            if view and view not in readable_views:
+                raise oracledb.DatabaseError('ORA-00942: table or view does not exist')
+            # (table, num_rows, avg_row_len, segment bytes, last_analyzed)
+            return [('SMALL', 1000, 100, 65536 if view else None, None),
+                    ('BIG', 10, 100, 8388608 if view else None, None),
+                    ('EMPTY', None, None, None, None)]
+    
+    return SegmentOracle()
+
+
+def test_segment_sizes():
+    """Test that table sizes come from DBA_SEGMENTS or USER_SEGMENTS."""
+    print("\nTesting segment sizes...")
+    
+    try:
+        oracle = _segment_oracle(['dba_segments'])
+        stats = oracle.get_table_stats()
+        assert stats['BIG']['bytes'] == 8388608 and stats['SMALL']['bytes'] == 65536
+        assert len(oracle.queries) == 1
+        print("  ✓ Segment bytes read from DBA_SEGMENTS")
+        
+        oracle = _segment_oracle(['user_segments'])
+        assert oracle.get_table_stats()['BIG']['bytes'] == 8388608
+        assert 'user_segments' in oracle.queries[-1]
+        print("  ✓ USER_SEGMENTS used for the connected schema")
+        
+        oracle = _segment_oracle(['user_segments'], schema='OTHER')
+        stats = oracle.get_table_stats()
+        assert stats['BIG']['bytes'] == 1000 and stats['SMALL']['bytes'] == 100000
+        assert stats['EMPTY']['bytes'] == 0
+        assert not any('user_segments' in query for query in oracle.queries)
+        print("  ✓ Statistics estimate used when no segment view is readable")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Segment size test failed: {e}")
+        return False
+
+
+def test_size_ordering():
+    """Test that tables are scheduled largest segment first."""
+    print("\nTesting size ordering...")
+    
+    try:
+        from src.migration.db_connector import PostgreSQLConnector
+        from src.migration.scheduler import TableScheduler
+        
+        # ALL_SEGMENTS does not exist in Oracle and must not be needed
+        oracle = _segment_oracle(['dba_segments'])
+        assert oracle.get_table_sizes() == {'SMALL': 65536, 'BIG': 8388608, 'EMPTY': 0}
+        scheduler = TableScheduler(oracle, PostgreSQLConnector('localhost', 5432, 'db', 'user', 'pass'))
+        assert scheduler.order_by_size(['EMPTY', 'SMALL', 'BIG']) == ['BIG', 'SMALL', 'EMPTY']
+        assert not any('all_segments' in query for query in oracle.queries)
+        print("  ✓ Tables ordered by segment size, largest first")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Size ordering test failed: {e}")
+        return False
+
+
+def test_batch_pipeline():
+    """Test batch order, error propagation and shutdown of the batch pipeline."""
+    print("\nTesting batch pipeline...")
+    
+    try:
+        import itertools
+        import threading
+        import time
+        from src.migration.pipeline import BatchPipeline
+        
+        def run(pipeline, batches, write):
+            """Run a pipeline on a thread, so a hang fails the test instead of blocking it."""
+            outcome = {}
+            
+            def target():
+                try:
+                    outcome['stats'] = pipeline.run(batches, write)
+                except Exception as e:
+                    outcome['error'] = e
+            
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            thread.join(timeout=10)
+            assert not thread.is_alive(), "pipeline did not shut down"
+            return outcome
+        
+        written = []
+        outcome = run(BatchPipeline(writers=1, queue_size=2), range(200),
+                      lambda writer_id, batch: written.append(batch))
+        assert 'error' not in outcome and written == list(range(200))
+        assert outcome['stats']['reader']['batches'] == 200
+        print("  ✓ Batches written in fetch order")
+        
+        def failing_fetch():
+            yield 1
+            yield 2
+            raise ValueError('fetch failed')
+        
+        written = []
+        outcome = run(BatchPipeline(writers=2), failing_fetch(),
+                      lambda writer_id, batch: written.append(batch))
+        assert isinstance(outcome.get('error'), ValueError)
+        assert sorted(written) in ([], [1], [1, 2])
+        print("  ✓ Fetch error raised from run")
+        
+        def failing_load(writer_id, batch):
+            if batch == 3:
+                raise RuntimeError('load failed')
+        
+        outcome = run(BatchPipeline(writers=1), range(100), failing_load)
+        assert isinstance(outcome.get('error'), RuntimeError)
+        print("  ✓ Load error raised from run")
+        
+        fetched = []
+        
+        def endless_fetch():
+            for i in itertools.count():
+                fetched.append(i)
+                yield i
+        
+        def slow_failing_load(writer_id, batch):
+            # Long enough for the fetcher to fill the queue and block on it
+            time.sleep(0.3)
+            raise RuntimeError('load failed')
+        
+        outcome = run(BatchPipeline(writers=1, queue_size=2), endless_fetch(), slow_failing_load)
+        assert isinstance(outcome.get('error'), RuntimeError)
+        assert len(fetched) <= 4
+        print("  ✓ Fetcher blocked on a full queue stops when the loader fails")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Batch pipeline test failed: {e}")
+        return False
+
+
+def test_rowid_chunks():
+    """Test ROWID range planning from extents and its fallbacks."""
+    print("\nTesting ROWID chunks...")
+    
+    try:
+        import oracledb
+        from src.migration.data_migrator import DataMigrator
+        from src.migration.db_connector import OracleConnector, PostgreSQLConnector, split_extents
+        
+        extents = [(100, 4, 128, 8), (100, 4, 256, 8), (100, 5, 8, 16)]
+        assert split_extents(extents, 4) == [(100, 4, 128, 4, 135), (100, 4, 256, 4, 263),
+                                             (100, 5, 8, 5, 15), (100, 5, 16, 5, 23)]
+        assert split_extents(extents, 3) == [(100, 4, 128, 4, 258), (100, 4, 259, 5, 13),
+                                             (100, 5, 14, 5, 23)]
+        assert split_extents([(100, 4, 8, 8), (200, 4, 16, 8)], 1) == \
+            [(100, 4, 8, 4, 15), (200, 4, 16, 4, 23)]
+        assert split_extents([], 4) == []
+        print("  ✓ Extents split into equal block ranges within each partition")
+        
+        class ExtentOracle(OracleConnector):
+            def __init__(self, readable_views, extents):
+                super().__init__('localhost', 1521, 'XE', 'app', 'pass', 'APP')
+                self.readable_views = readable_views
+                self.extents = extents
+                self.queries = []
+            
+            def execute_query(self, query, params=None):
+                self.queries.append(query)
+                view = next((v for v in ('dba_extents', 'user_extents') if v in query), None)
+                if view:
+                    if view not in self.readable_views:
+                        raise oracledb.DatabaseError('ORA-00942: table or view does not exist')
+                    return self.extents
+                if 'DBMS_ROWID' in query:
+                    count = query.count('UNION ALL') + 1
+                    return [(f"lo{i}:{params[f'lb{i}']}", f"hi{i}:{params[f'hb{i}']}")
+                            for i in range(count)]
+                return [('AAA', 'AAB')]
+            
+            def get_primary_keys(self, table_name):
+                return []
+        
+        oracle = ExtentOracle(['user_extents'], extents)
+        assert oracle.get_rowid_ranges('T', 2) == [('lo0:128', 'hi0:263'), ('lo1:8', 'hi1:23')]
+        assert not any('NTILE' in query for query in oracle.queries)
+        print("  ✓ ROWID ranges built from extents without reading the table")
+        
+        oracle = ExtentOracle([], extents)
+        assert oracle.get_rowid_ranges('T', 2) == [('AAA', 'AAB')]
+        assert 'NTILE' in oracle.queries[-1]
+        oracle.schema = 'OTHER'
+        oracle.queries = []
+        oracle.get_rowid_ranges('T', 2)
+        assert not any('user_extents' in query for query in oracle.queries)
+        print("  ✓ Unreadable extent views fall back to a ROWID scan")
+        
+        pg_conn = PostgreSQLConnector('localhost', 5432, 'db', 'user', 'pass')
+        columns = [('ID', 'NUMBER', 22, 10, 0, 'N', None)]
+        migrator = DataMigrator(ExtentOracle(['dba_extents'], extents), pg_conn,
+                                parallel_chunks=2)
+        chunks = migrator._new_chunks('T', columns)
+        assert [chunk['params'] for chunk in chunks] == [
+            {'lo': 'lo0:128', 'hi': 'hi0:263'}, {'lo': 'lo1:8', 'hi': 'hi1:23'}]
+        assert chunks[0]['where'] == 'ROWID BETWEEN CHARTOROWID(:lo) AND CHARTOROWID(:hi)'
+        migrator = DataMigrator(ExtentOracle(['dba_extents'], []), pg_conn, parallel_chunks=2)
+        chunks = migrator._new_chunks('T', columns)
+        assert len(chunks) == 1 and chunks[0]['where'] is None
+        print("  ✓ Tables without a primary key or ROWID ranges fall back to one chunk")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ ROWID chunk test failed: {e}")
+        return False
+
+
+def test_keyset_pages():
+    """Test keyset page boundaries on a composite key and page retries on a new connection."""
+    print("\nTesting keyset pages...")
+    
+    from src.migration import data_migrator
+    retry_delay = data_migrator.PAGE_RETRY_DELAY
+    try:
+        import oracledb
+        import tempfile
+        from src.migration.data_migrator import DataMigrator
+        ListOracle, TransactionalPG, _ = _fake_connectors()
+        data_migrator.PAGE_RETRY_DELAY = 0
+        
+        columns = [('REGION', 'NUMBER', 22, 5, 0, 'N', None), ('SEQ', 'NUMBER', 22, 10, 0, 'N', None),
+                   ('NAME', 'VARCHAR2', 20, None, None, 'Y', None)]
+        # Pages of 4 rows end inside runs of equal REGION values
+        rows = [(region, seq, f'{region}-{seq}') for region in (1, 2, 3) for seq in range(1, 6)]
+        oracle = ListOracle(columns, ['REGION', 'SEQ'], list(reversed(rows)))
+        # The second page query loses its connection
+        oracle.page_errors = [None, oracledb.DatabaseError('ORA-03113: end-of-file on communication channel')]
+        pg_conn = TransactionalPG()
+        
+        migrator = DataMigrator(oracle, pg_conn, batch_size=4, extraction='keyset', row_counts='exact',
+                                dead_letter_dir=tempfile.mkdtemp())
+        assert migrator.migrate_table('T')
+        assert pg_conn.rows == rows
+        query, params = oracle.queries[-1]
+        assert '(("REGION" > :k0) OR ("REGION" = :k0 AND "SEQ" > :k1))' in query
+        assert 'ORDER BY "REGION", "SEQ"' in query
+        assert [(p.get('k0'), p.get('k1')) for _, p in oracle.queries] == \
+            [(None, None), (1, 4), (1, 4), (2, 3), (3, 2)]
+        print("  ✓ Composite key pages resume inside runs of equal leading values")
+        
+        assert oracle.connects == 1
+        print("  ✓ Failed page query retried on a new connection")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Keyset page test failed: {e}")
+        return False
+    finally:
+        data_migrator.PAGE_RETRY_DELAY = retry_delay
+
+
+def test_resume_after_skipped_batch():
+    """Test that a failed batch stops its chunk and is extracted again on resume."""
+    print("\nTesting resume after a skipped batch...")
+    
+    try:
+        import psycopg2
+        ListOracle, TransactionalPG, MemoryCheckpoints = _fake_connectors()
+        
+        columns = [('ID', 'NUMBER', 22, 10, 0, 'N', None), ('NAME', 'VARCHAR2', 20, None, None, 'Y', None)]
+        oracle = ListOracle(columns, ['ID'], [(i, f'row {i}') for i in range(1, 11)])
+        pg_conn = TransactionalPG()
+        store = MemoryCheckpoints()
+        pg_conn.fail_batch = lambda batch: (psycopg2.OperationalError('server closed the connection')
+                                            if batch[0][0] == 5 else None)
+        
+        migrator = _checkpointed_migrator(oracle, pg_conn, store, batch_size=2)
+        assert not migrator.migrate_table('T')
+        assert [row[0] for row in pg_conn.rows] == [1, 2, 3, 4]
+        state = store.chunks[('T', 0)]
+        assert state['status'] == 'in_progress' and state['last_key'] == [4]
+        assert state['rows_loaded'] == 4
+        print("  ✓ Chunk stops at the skipped batch without being marked done")
+        
+        pg_conn.fail_batch = lambda batch: None
+        oracle.queries = []
+        migrator = _checkpointed_migrator(oracle, pg_conn, store, batch_size=2, resume=True)
+        assert migrator.migrate_table('T')
+        assert oracle.queries[0][1] == {'k0': 4}
+        assert [row[0] for row in pg_conn.rows] == list(range(1, 11))
+        assert store.chunks[('T', 0)]['status'] == 'done'
+        print("  ✓ Resumed run extracts the skipped rows again")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Resume test failed: {e}")
+        return False
+
+
+def test_commit_policy_checkpoints():
+    """Test that checkpoints only cover batches their commit window committed."""
+    print("\nTesting commit policy checkpoints...")
+    
+    try:
+        import psycopg2
+        ListOracle, TransactionalPG, MemoryCheckpoints = _fake_connectors()
+        
+        columns = [('ID', 'NUMBER', 22, 10, 0, 'N', None), ('NAME', 'VARCHAR2', 20, None, None, 'Y', None)]
+        # (policy, interval, savepoints broken, failing commits, rows committed before the stop)
+        cases = [
+            ('batch', None, False, 0, [1, 2]),
+            ('batches', 3, False, 0, [1, 2]),
+            ('chunk', None, False, 0, [1, 2]),
+            ('chunk', None, True, 0, []),
+            ('batches', 3, False, 1, []),
+        ]
+        for policy, interval, savepoints_broken, failing_commits, committed in cases:
+            oracle = ListOracle(columns, ['ID'], [(i, f'row {i}') for i in range(1, 11)])
+            pg_conn = TransactionalPG()
+            store = MemoryCheckpoints()
+            pg_conn.savepoints_broken = savepoints_broken
+            pg_conn.failing_commits = failing_commits
+            if not failing_commits:
+                # The second batch of each window fails
+                pg_conn.fail_batch = lambda batch: (psycopg2.OperationalError('connection reset')
+                                                    if batch[0][0] == 3 else None)
+            
+            migrator = _checkpointed_migrator(oracle, pg_conn, store, batch_size=2,
+                                              commit_policy=policy, commit_interval=interval)
+            assert not migrator.migrate_table('T'), policy
+            assert [row[0] for row in pg_conn.rows] == committed, (policy, pg_conn.rows)
+            state = store.chunks[('T', 0)]
+            assert state['status'] != 'done', policy
+            assert state['last_key'] == (committed[-1:] or None), (policy, state)
+            assert state['rows_loaded'] == len(committed), (policy, state)
+            
+            pg_conn.fail_batch = lambda batch: None
+            pg_conn.savepoints_broken = False
+            migrator = _checkpointed_migrator(oracle, pg_conn, store, batch_size=2, resume=True,
+                                              commit_policy=policy, commit_interval=interval)
+            assert migrator.migrate_table('T'), policy
+            assert [row[0] for row in pg_conn.rows] == list(range(1, 11)), (policy, pg_conn.rows)
+        print("  ✓ Failed batches mid-window leave checkpoints at the last commit")
+        print("  ✓ Resumed runs load every row once under each commit policy")
+        
+        return True
+    except Exception as e:
+        print(f"  ✗ Commit policy checkpoint test failed: {e}")
+        return False
+
+
 def main():
     """Run all tests."""
     print("=" * 60)
@@ -264,6 +1324,26 @@ def main():
         ("Type Mapper", test_type_mapper),
         ("Config Loader", test_config_loader),
         ("Query Agent Validation", test_query_agent_validation),
+        ("COPY Encoding", test_copy_encoding),
+        ("Checkpoint Keys", test_checkpoint_keys),
+        ("Row Converter", test_row_converter),
+        ("Columnar Encoding", test_columnar_encoding),
+        ("Adaptive Batch Size", test_adaptive_batch_size),
+        ("Rejected Rows", test_rejected_rows),
+        ("Catalog Loader", test_catalog_loader),
+        ("Metadata Cache", test_metadata_cache),
+        ("Incremental Sync", test_sync_query),
+        ("DDL Script", test_ddl_script),
+        ("Failed Foreign Keys", test_failed_foreign_keys),
+        ("Throughput Estimate", test_throughput_estimate),
+        ("Partitioned Tables", test_partitions),
+        ("Segment Sizes", test_segment_sizes),
+        ("Size Ordering", test_size_ordering),
+        ("Batch Pipeline", test_batch_pipeline),
+        ("ROWID Chunks", test_rowid_chunks),
+        ("Keyset Pages", test_keyset_pages),
+        ("Resume After Skipped Batch", test_resume_after_skipped_batch),
+        ("Commit Policy Checkpoints", test_commit_policy_checkpoints),
     ]
     
     results = []